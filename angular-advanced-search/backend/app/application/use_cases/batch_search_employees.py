@@ -0,0 +1,21 @@
+"""
+Application Layer — Batch Search Employees Use Case
+
+Runs several searches in one call, e.g. the panels of a dashboard. The
+repository may share work between the queries (filters and text searches
+they have in common); each one is still sorted and paginated on its own,
+and the results come back in the order of the queries.
+"""
+
+from collections.abc import Sequence
+
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchQuery, SearchResult
+
+
+class BatchSearchEmployeesUseCase:
+    def __init__(self, repository: EmployeeRepository) -> None:
+        self._repository = repository
+
+    def execute(self, queries: Sequence[SearchQuery]) -> list[SearchResult]:
+        return self._repository.search_batch(queries)
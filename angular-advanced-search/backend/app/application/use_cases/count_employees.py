@@ -0,0 +1,22 @@
+"""
+Application Layer — Count Employees Use Case
+
+Answers "how many employees match?" without the page: the repository skips
+sorting, and nothing but the number is serialised. The query's total_mode
+chooses between an exact count and a cheaper estimate; 'none' asks for no
+count at all, so it is rejected here.
+"""
+
+from app.domain.exceptions import InvalidQueryError
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchCount, SearchQuery
+
+
+class CountEmployeesUseCase:
+    def __init__(self, repository: EmployeeRepository) -> None:
+        self._repository = repository
+
+    def execute(self, query: SearchQuery) -> SearchCount:
+        if query.total_mode == "none":
+            raise InvalidQueryError("A count needs totalMode 'exact' or 'estimate'")
+        return self._repository.count(query)
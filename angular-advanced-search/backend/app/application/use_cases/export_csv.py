@@ -6,29 +6,55 @@ to RFC 4180 CSV format. CSV generation is an application-level concern
 because it combines domain data with a presentation format — it doesn't
 belong in the domain (which has no I/O concept) or in the exposition layer
 (which should only translate HTTP, not format data).
+
+The CSV is produced as a stream of UTF-8 chunks while the repository's
+iterator is consumed, so memory stays bounded by the chunk size however many
+rows match, and the first chunk can be sent before the last row is read.
 """
 
 import csv
 import io
+from collections.abc import Iterable, Iterator
 
+from app.domain.entities import Employee
 from app.domain.ports.employee_repository import EmployeeRepository
 from app.domain.value_objects import SearchQuery
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 class ExportCsvUseCase:
-    def __init__(self, repository: EmployeeRepository) -> None:
+    format = "csv"  # the file format written, named as in ?format=
+
+    def __init__(self, repository: EmployeeRepository, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
         self._repository = repository
+        self._chunk_size = chunk_size
+
+    def execute(self, query: SearchQuery) -> Iterator[bytes]:
+        """
+        Return an iterator of UTF-8 CSV chunks of all employees matching the
+        query; nothing is yielded when no employee matches.
 
-    def execute(self, query: SearchQuery) -> str:
-        """Return a UTF-8 CSV string of all employees matching the query."""
-        employees = self._repository.get_all_matching(query)
-        if not employees:
-            return ""
+        The query is evaluated before this method returns, so an invalid query
+        raises here and not after the response has started streaming.
+        """
+        return self._encode(self._repository.iter_matching(query))
 
+    def _encode(self, employees: Iterable[Employee]) -> Iterator[bytes]:
+        """Yield chunks of roughly chunk_size characters, each ending on a row boundary."""
         output = io.StringIO()
-        fieldnames = list(employees[0].to_dict().keys())
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
+        writer: csv.DictWriter | None = None
         for employee in employees:
-            writer.writerow(employee.to_dict())
-        return output.getvalue()
+            row = employee.view
+            if writer is None:
+                writer = csv.DictWriter(output, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow(row)
+            if output.tell() >= self._chunk_size:
+                yield output.getvalue().encode("utf-8")
+                output.seek(0)
+                output.truncate()
+        if output.tell():
+            yield output.getvalue().encode("utf-8")
@@ -0,0 +1,52 @@
+"""
+Application Layer — Export NDJSON Use Case
+
+Serialises all employees matching a query (no pagination) as newline
+delimited JSON: one object per line, with the same camelCase keys and values
+as the search endpoint's "data" items. Streamed in chunks like the CSV export.
+
+Each line is the employee's cached view encoding (EmployeeView.json), the
+same bytes the search endpoint writes for that row, so NaN and infinities
+are written as null rather than as bare NaN, which is not JSON.
+"""
+
+import io
+from collections.abc import Iterable, Iterator
+
+from app.application.use_cases.export_csv import DEFAULT_CHUNK_SIZE
+from app.domain.entities import Employee
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchQuery
+
+
+class ExportNdjsonUseCase:
+    format = "ndjson"  # the file format written, named as in ?format=
+
+    def __init__(self, repository: EmployeeRepository, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self._repository = repository
+        self._chunk_size = chunk_size
+
+    def execute(self, query: SearchQuery) -> Iterator[bytes]:
+        """
+        Return an iterator of UTF-8 NDJSON chunks of all employees matching
+        the query; nothing is yielded when no employee matches.
+
+        The query is evaluated before this method returns, so an invalid query
+        raises here and not after the response has started streaming.
+        """
+        return self._encode(self._repository.iter_matching(query))
+
+    def _encode(self, employees: Iterable[Employee]) -> Iterator[bytes]:
+        """Yield chunks of roughly chunk_size bytes, each ending on a line boundary."""
+        output = io.BytesIO()
+        for employee in employees:
+            output.write(employee.view.json)
+            output.write(b"\n")
+            if output.tell() >= self._chunk_size:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        if output.tell():
+            yield output.getvalue()
@@ -0,0 +1,17 @@
+"""
+Application Layer — Get Reload Status Use Case
+
+Tells whether a dataset reload is still running, failed, or done, and which
+dataset generation searches are served from.
+"""
+
+from app.domain.ports.dataset_reloader import DatasetReloader
+from app.domain.value_objects import ReloadStatus
+
+
+class GetReloadStatusUseCase:
+    def __init__(self, reloader: DatasetReloader) -> None:
+        self._reloader = reloader
+
+    def execute(self) -> ReloadStatus:
+        return self._reloader.status()
@@ -0,0 +1,18 @@
+"""
+Application Layer — Reload Dataset Use Case
+
+Refreshes the employee data without a restart: the dataset is loaded again
+from its source in the background while the current one keeps being served,
+and searches switch to the new one once it is complete.
+"""
+
+from app.domain.ports.dataset_reloader import DatasetReloader
+from app.domain.value_objects import ReloadStatus
+
+
+class ReloadDatasetUseCase:
+    def __init__(self, reloader: DatasetReloader) -> None:
+        self._reloader = reloader
+
+    def execute(self) -> ReloadStatus:
+        return self._reloader.reload()
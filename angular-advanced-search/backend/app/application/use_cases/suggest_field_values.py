@@ -0,0 +1,27 @@
+"""
+Application Layer — Suggest Field Values Use Case
+
+Autocompletes a filter value: the most frequent existing values of a string
+field that start with what the user typed so far. Only string fields can be
+suggested; the prefix is compared without case, as the starts_with filter
+does.
+"""
+
+from app.domain.exceptions import InvalidQueryError
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import FieldSuggestion
+
+
+class SuggestFieldValuesUseCase:
+    def __init__(self, repository: EmployeeRepository) -> None:
+        self._repository = repository
+
+    def execute(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        types = {f.field: f.type for f in self._repository.get_field_definitions()}
+        if field not in types:
+            raise InvalidQueryError(f"Cannot suggest values of unknown field '{field}'")
+        if types[field] != "string":
+            raise InvalidQueryError(f"Cannot suggest values of {types[field]} field '{field}'")
+        if limit < 1:
+            raise InvalidQueryError("Suggestions need a positive limit")
+        return self._repository.suggest(field, prefix, limit)
@@ -5,7 +5,12 @@ Core business objects representing the fundamental concepts of the domain.
 These classes are pure Python with no framework dependencies.
 """
 
+import json
+import math
+from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, NoReturn
 
 
 @dataclass
@@ -17,15 +22,89 @@ class FieldDefinition:
     type: str   # 'string' | 'number' | 'date' | 'boolean'
 
 
-@dataclass
+# camelCase API field name → Employee attribute, in to_dict() order
+EMPLOYEE_FIELDS: dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "email": "email",
+    "age": "age",
+    "salary": "salary",
+    "score": "score",
+    "status": "status",
+    "department": "department",
+    "description": "description",
+    "isActive": "is_active",
+    "isVerified": "is_verified",
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+    "birthDate": "birth_date",
+}
+
+# camelCase API field name → getter returning that value from an Employee
+FIELD_ACCESSORS: dict[str, Callable[["Employee"], Any]] = {
+    field: attrgetter(attr) for field, attr in EMPLOYEE_FIELDS.items()
+}
+
+# Slots caching the derived representations of an Employee
+_DERIVED = ("_view", "_search_text")
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+class EmployeeView(dict):
+    """
+    Read-only camelCase mapping of one employee (Employee.view). Its JSON
+    encoding is built the first time it is asked for and kept with the
+    view, so a row returned by many searches is encoded once.
+    """
+
+    __slots__ = ("_json",)
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("EmployeeView is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    @property
+    def json(self) -> bytes:
+        """UTF-8 JSON object of the view; NaN and infinities are written as null."""
+        try:
+            return self._json
+        except AttributeError:
+            pass
+        try:
+            encoded = _ENCODER.encode(self)
+        except ValueError:  # not representable in JSON
+            encoded = _ENCODER.encode({
+                k: None if isinstance(v, float) and not math.isfinite(v) else v for k, v in self.items()
+            })
+        self._json = encoded.encode("utf-8")
+        return self._json
+
+
+@dataclass(frozen=True)
 class Employee:
     """
     Core entity representing an employee record.
 
     Attribute names follow Python conventions (snake_case).
-    The to_dict() method produces the camelCase representation expected by the frontend.
+    The view property is the camelCase representation expected by the
+    frontend; it is built on first use and kept, together with its JSON
+    encoding.
+
+    Instances are immutable: repositories index them by their values when
+    they are loaded, so an attribute changed in place would leave those
+    indexes and the cached view stale. A changed record is a new Employee
+    (dataclasses.replace), loaded with a new dataset.
+
+    Instances have __slots__ instead of a __dict__: a dataset holds millions
+    of them, and the slots take a fraction of the memory of a per-instance
+    dict.
     """
 
+    __slots__ = (*EMPLOYEE_FIELDS.values(), *_DERIVED)
+
     id: int
     name: str
     email: str
@@ -41,21 +120,40 @@ class Employee:
     updated_at: str
     birth_date: str
 
+    def __getstate__(self) -> tuple[Any, ...]:
+        # Derived representations are rebuilt on demand rather than shipped
+        return tuple(getattr(self, attr) for attr in EMPLOYEE_FIELDS.values())
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for attr, value in zip(EMPLOYEE_FIELDS.values(), state):
+            object.__setattr__(self, attr, value)
+
+    @property
+    def view(self) -> EmployeeView:
+        """Read-only camelCase mapping compatible with the frontend API contract."""
+        try:
+            return self._view
+        except AttributeError:  # not built yet
+            pass
+        view = EmployeeView({field: getattr(self, attr) for field, attr in EMPLOYEE_FIELDS.items()})
+        object.__setattr__(self, "_view", view)
+        return view
+
+    @property
+    def search_text(self) -> tuple[str, ...]:
+        """Lower-cased str() of every view value — what full-text search matches against."""
+        try:
+            return self._search_text
+        except AttributeError:  # not built yet
+            pass
+        text = tuple(str(v).lower() for v in self.view.values())
+        object.__setattr__(self, "_search_text", text)
+        return text
+
+    def get(self, field: str) -> Any:
+        """Value of a camelCase field, e.g. employee.get("isActive")."""
+        return FIELD_ACCESSORS[field](self)
+
     def to_dict(self) -> dict:
-        """Return a camelCase dict compatible with the frontend API contract."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "age": self.age,
-            "salary": self.salary,
-            "score": self.score,
-            "status": self.status,
-            "department": self.department,
-            "description": self.description,
-            "isActive": self.is_active,
-            "isVerified": self.is_verified,
-            "createdAt": self.created_at,
-            "updatedAt": self.updated_at,
-            "birthDate": self.birth_date,
-        }
+        """Return a new camelCase dict; prefer view when the result is only read."""
+        return dict(self.view)
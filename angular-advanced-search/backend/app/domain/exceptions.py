@@ -0,0 +1,10 @@
+"""
+Domain Layer — Exceptions
+
+Errors raised by the domain and its ports. They carry no HTTP knowledge; the
+exposition layer decides which status code each one maps to.
+"""
+
+
+class InvalidQueryError(ValueError):
+    """A SearchQuery cannot be evaluated, e.g. a filter operand is malformed."""
@@ -0,0 +1,34 @@
+"""
+Domain Layer — Dataset Reloader Port (outbound port)
+
+Refreshes the employee data without restarting the process. The reloader
+owns the repository the use cases query: a reload builds a complete new
+repository (data and every index) from the dataset source, then replaces
+the served one in a single step. Searches that already hold the previous
+repository finish on it; searches started after the swap see the new one.
+"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.value_objects import ReloadStatus
+
+
+class DatasetReloader(ABC):
+    """
+    Outbound port: reloads the dataset in the background.
+    Concrete implementations live in app.infrastructure.
+    """
+
+    @abstractmethod
+    def reload(self) -> ReloadStatus:
+        """
+        Start loading the dataset again and return without waiting for it.
+        While a reload is running another one is not started; its status is
+        returned instead.
+        """
+        ...
+
+    @abstractmethod
+    def status(self) -> ReloadStatus:
+        """Return the state of the latest reload and of the dataset served."""
+        ...
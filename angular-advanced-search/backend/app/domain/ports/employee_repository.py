@@ -8,9 +8,11 @@ and storage details are pushed outward into adapters.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from typing import Any
 
 from app.domain.entities import Employee, FieldDefinition
-from app.domain.value_objects import SearchQuery, SearchResult
+from app.domain.value_objects import FieldSuggestion, SearchCount, SearchQuery, SearchResult
 
 
 class EmployeeRepository(ABC):
@@ -32,10 +34,58 @@ class EmployeeRepository(ABC):
         """
         ...
 
+    def search_batch(self, queries: Sequence[SearchQuery]) -> list[SearchResult]:
+        """
+        Run several searches at once; returns one SearchResult per query, in
+        order. Adapters override this to share work between the queries
+        (common filters, the text search, the pass over the data); each
+        result is sorted and paginated on its own either way.
+        """
+        return [self.search(query) for query in queries]
+
+    @abstractmethod
+    def count(self, query: SearchQuery) -> SearchCount:
+        """
+        Count the employees matching the query without ordering or returning
+        any of them. query.total_mode is 'exact' or 'estimate'.
+        """
+        ...
+
+    @abstractmethod
+    def suggest(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        """
+        The `limit` most frequent values of a string field that start with
+        prefix, most frequent first — the values a starts_with filter with
+        that prefix would match, compared without case. Values differing only
+        by case count as one, spelled as the smallest of them; ties are in
+        alphabetical order, and None and empty values are never suggested.
+        """
+        ...
+
     @abstractmethod
     def get_all_matching(self, query: SearchQuery) -> list[Employee]:
         """
         Return every employee that matches the query without pagination.
-        Used by the CSV export use-case.
+        """
+        ...
+
+    @abstractmethod
+    def iter_matching(self, query: SearchQuery) -> Iterator[Employee]:
+        """
+        Lazily yield every employee that matches the query, in sort order,
+        without pagination. Used by the CSV export use-case.
+
+        The query is evaluated when this method is called, so an invalid
+        query raises here rather than midway through the iteration.
+        """
+        ...
+
+    @abstractmethod
+    def iter_matching_columns(self, query: SearchQuery, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        """
+        Like iter_matching, but yield the employees column-wise in batches of
+        at most batch_size rows: each batch maps every camelCase field of
+        EMPLOYEE_FIELDS to the list of its values. Used by the columnar
+        export formats, which never need a per-row dict.
         """
         ...
@@ -5,6 +5,7 @@ Immutable objects that represent domain concepts by their attributes rather
 than by identity. They carry no side-effects and are safe to share.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -25,6 +26,21 @@ class SearchFilter:
     value: Any = None
 
 
+@dataclass(frozen=True)
+class SearchFacet:
+    """
+    An aggregation requested alongside a search, computed over every row the
+    query matches. The field's type decides the kind of facet:
+    - string:  counts per distinct value, the `limit` most frequent first
+    - boolean: true / false counts and the share of true values
+    - number:  histogram of `buckets` equal-width buckets between min and max
+    """
+
+    field: str
+    buckets: int = 10
+    limit: int = 20
+
+
 @dataclass(frozen=True)
 class SearchQuery:
     """
@@ -32,6 +48,20 @@ class SearchQuery:
 
     Uses snake_case attribute names following Python conventions.
     The exposition layer maps the camelCase frontend payload to this object.
+
+    cursor switches to keyset pagination: None pages by offset (page /
+    page_size); "" requests the first page of a cursor walk; any other value
+    is a next_cursor from a previous result and resumes right after it.
+
+    facets are aggregations over all matched rows returned with the page;
+    they never change which rows the page contains.
+
+    explain asks the repository to also describe how it evaluated the query.
+
+    total_mode says how precise the total has to be: 'exact' counts every
+    match; 'estimate' accepts a total with a bounded error; 'none' only needs
+    the page, so the repository may stop looking once the page is filled.
+    Repositories may always answer more precisely than asked.
     """
 
     text: str = ""
@@ -41,6 +71,65 @@ class SearchQuery:
     page_size: int = 10
     sort_field: str = "id"
     sort_order: Literal["asc", "desc"] = "asc"
+    cursor: str | None = None
+    facets: tuple[SearchFacet, ...] = field(default_factory=tuple)
+    explain: bool = False
+    total_mode: Literal["exact", "estimate", "none"] = "exact"
+
+
+TotalRelation = Literal["eq", "gte", "approx"]
+
+
+@dataclass(frozen=True)
+class SearchCount:
+    """
+    Number of rows a query matches, as precise as its total_mode asked for.
+
+    - relation: 'eq' when total is exact, 'gte' when it is a lower bound,
+                'approx' when it is an estimate
+    - error:    for estimates, the half-width of a 95% confidence interval
+                around total; 0 otherwise
+    """
+
+    total: int
+    relation: TotalRelation = "eq"
+    error: int = 0
+
+
+@dataclass(frozen=True)
+class FieldSuggestion:
+    """
+    One existing value of a string field offered while the user types it,
+    with the number of employees holding it (ignoring case).
+    """
+
+    value: str
+    count: int
+
+
+ReloadState = Literal["idle", "running", "failed"]
+
+
+@dataclass(frozen=True)
+class ReloadStatus:
+    """
+    Where reloading the dataset stands.
+
+    - state:      'running' while a new dataset is being loaded, 'failed'
+                  when the last reload raised (the previous dataset is still
+                  served), 'idle' otherwise
+    - generation: number of the dataset being served; 1 is the one loaded
+                  at startup, and each successful reload adds one
+    - rows:       rows of the dataset being served, when its source counts them
+    - seconds:    how long loading the dataset being served took
+    - error:      why the last reload failed
+    """
+
+    state: ReloadState
+    generation: int
+    rows: int | None = None
+    seconds: float | None = None
+    error: str | None = None
 
 
 @dataclass(frozen=True)
@@ -48,11 +137,80 @@ class SearchResult:
     """
     Immutable result returned by the repository after applying a SearchQuery.
 
-    data contains employee dicts (camelCase) ready for serialisation.
+    data contains read-only camelCase employee mappings (Employee.view) ready
+    for serialisation.
+    next_cursor is only set in cursor mode, when more rows follow this page.
+    facets holds one FacetResult per requested SearchFacet, in request order.
+    explanation is only set when the query asked for it.
+    total_relation and total_error qualify total like the fields of
+    SearchCount: a query whose total_mode is not 'exact' may get a lower
+    bound or an estimate, and total_pages is derived from it.
     """
 
-    data: tuple[dict, ...]
+    data: tuple[Mapping[str, Any], ...]
     total: int
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
+    facets: tuple["FacetResult", ...] = ()
+    explanation: "QueryExplanation | None" = None
+    total_relation: TotalRelation = "eq"
+    total_error: int = 0
+
+
+@dataclass(frozen=True)
+class FacetBucket:
+    """
+    One group of a facet: a distinct value (counts, ratio) or the half-open
+    range [low, high) of a histogram — the last bucket also includes high.
+    """
+
+    count: int
+    value: Any = None
+    low: float | None = None
+    high: float | None = None
+
+
+@dataclass(frozen=True)
+class FacetResult:
+    """
+    Aggregation of one field over the matched rows.
+
+    - kind:    'counts' | 'ratio' | 'histogram'
+    - missing: matched rows whose value is None
+    - ratio:   share of true among the non-missing values (ratio facets)
+    """
+
+    field: str
+    kind: str
+    buckets: tuple[FacetBucket, ...]
+    missing: int = 0
+    ratio: float | None = None
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """
+    One stage of an evaluated query, in execution order.
+
+    - operation:      how the stage runs, e.g. 'sort index', 'text index',
+                      'candidate set', 'scan', 'filter'
+    - description:    what it evaluates, e.g. "age greater_than 40"
+    - estimated_rows: rows expected to satisfy this stage on its own, or
+                      None when the engine does not publish estimates
+    """
+
+    operation: str
+    description: str
+    estimated_rows: int | None
+
+
+@dataclass(frozen=True)
+class QueryExplanation:
+    """How a repository evaluated a query: the plan it chose and its outcome."""
+
+    combinator: str
+    steps: tuple[PlanStep, ...]
+    matched_rows: int
+    cached: bool = False  # the matched rows came from the result cache
@@ -2,33 +2,198 @@
 Exposition Layer — Dependency Injection
 
 Wires use cases to their repository implementation using FastAPI's dependency
-injection system. The repository is cached as a singleton so the in-memory
-dataset is shared across all requests.
+injection system. One repository serves every request, so the in-memory
+dataset is shared across all of them.
+
+The adapter is selected with the EMPLOYEE_REPOSITORY environment variable:
+  memory    — InMemoryEmployeeRepository (default)
+  columnar  — ColumnarEmployeeRepository (NumPy, vectorised filters)
+  sqlite    — SqliteEmployeeRepository (SQL over the database file named by
+              EMPLOYEE_DATABASE; a private in-memory database when unset)
+  sharded   — ShardedEmployeeRepository (the dataset split across
+              EMPLOYEE_SHARDS worker processes, one per CPU core when unset)
+
+EMPLOYEE_STORAGE=compact makes the memory and sharded repositories keep
+the employees column-wise, with repeated strings stored once, instead of
+as one Employee object per row: less memory per row, for slightly slower
+page rendering. The default is objects.
+
+EMPLOYEE_DATA names a .csv or .jsonl file to load the dataset from instead
+of the sample data; the file is streamed into the repository, and the load
+time and peak memory are logged.
+
+The repository is held by a BackgroundDatasetReloader. POST /api/admin/reload
+builds a new one from the same source (the EMPLOYEE_DATA file is read again)
+on a background thread and swaps it in once complete. For the sqlite
+repository without EMPLOYEE_DATA the database file is the source: a reload
+opens it again, so a file replaced on disk (mv new.db employees.db) is
+served from then on. The admin endpoints require the EMPLOYEE_ADMIN_TOKEN
+in the X-Admin-Token header, and are disabled while it is unset.
+
+EXPORT_CHUNK_SIZE sets the approximate size, in characters, of each chunk
+streamed by the CSV and NDJSON exports (default 65536).
 """
 
+import logging
+import os
+import secrets
+from collections.abc import Callable
 from functools import lru_cache
 
-from app.application.use_cases.export_csv import ExportCsvUseCase
+from fastapi import Header, HTTPException, Query, status
+
+from app.application.use_cases.batch_search_employees import BatchSearchEmployeesUseCase
+from app.application.use_cases.count_employees import CountEmployeesUseCase
+from app.application.use_cases.export_arrow import ExportArrowUseCase
+from app.application.use_cases.export_csv import DEFAULT_CHUNK_SIZE, ExportCsvUseCase
+from app.application.use_cases.export_ndjson import ExportNdjsonUseCase
 from app.application.use_cases.get_fields import GetFieldsUseCase
+from app.application.use_cases.get_reload_status import GetReloadStatusUseCase
+from app.application.use_cases.reload_dataset import ReloadDatasetUseCase
 from app.application.use_cases.search_employees import SearchEmployeesUseCase
+from app.application.use_cases.suggest_field_values import SuggestFieldValuesUseCase
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.exposition.schemas import ExportFormat
+from app.infrastructure.dataset_loader import LoadReport, load_repository
+from app.infrastructure.dataset_reloader import BackgroundDatasetReloader
+from app.infrastructure.repositories.columnar_employee_repository import (
+    ColumnarEmployeeRepository,
+)
 from app.infrastructure.repositories.in_memory_employee_repository import (
     InMemoryEmployeeRepository,
 )
+from app.infrastructure.repositories.sharded_employee_repository import (
+    ShardedEmployeeRepository,
+)
+from app.infrastructure.repositories.sqlite_employee_repository import (
+    SqliteEmployeeRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Each factory builds its adapter from the given employees, or from its
+# default dataset when called without arguments
+_REPOSITORIES: dict[str, Callable[..., EmployeeRepository]] = {
+    "memory": lambda *employees: InMemoryEmployeeRepository(*employees, compact=_is_compact()),
+    "columnar": ColumnarEmployeeRepository,
+    "sqlite": lambda employees=None: SqliteEmployeeRepository(
+        employees, database=os.environ.get("EMPLOYEE_DATABASE", ":memory:")
+    ),
+    "sharded": lambda *employees: ShardedEmployeeRepository(
+        *employees, shards=_get_shard_count(), compact=_is_compact()
+    ),
+}
 
 
 @lru_cache(maxsize=1)
-def _get_repository() -> InMemoryEmployeeRepository:
-    """Singleton repository — the in-memory dataset lives here."""
-    return InMemoryEmployeeRepository()
+def _get_reloader() -> BackgroundDatasetReloader:
+    """Singleton reloader — it holds the repository, where the in-memory dataset lives."""
+    return BackgroundDatasetReloader(_build_repository)
+
+
+def _get_repository() -> EmployeeRepository:
+    """
+    The repository serving the current dataset. Use cases keep the one they
+    were given, so a request finishes on it even if a reload swaps in another.
+    """
+    return _get_reloader().repository
+
+
+def _build_repository() -> tuple[EmployeeRepository, LoadReport | None]:
+    name = os.environ.get("EMPLOYEE_REPOSITORY", "memory")
+    if name not in _REPOSITORIES:
+        raise RuntimeError(
+            f"Unknown EMPLOYEE_REPOSITORY {name!r}; expected one of {sorted(_REPOSITORIES)}"
+        )
+    factory = _REPOSITORIES[name]
+
+    path = os.environ.get("EMPLOYEE_DATA")
+    if not path:
+        return factory(), None
+    repository, report = load_repository(factory, path)
+    logger.info(report.summary())
+    return repository, report
+
+
+def _get_shard_count() -> int | None:
+    raw = os.environ.get("EMPLOYEE_SHARDS")
+    if not raw:
+        return None  # one shard per CPU core
+    try:
+        shards = int(raw)
+    except ValueError:
+        shards = 0
+    if shards < 1:
+        raise RuntimeError(f"EMPLOYEE_SHARDS must be a positive integer, got {raw!r}")
+    return shards
+
+
+def _is_compact() -> bool:
+    storage = os.environ.get("EMPLOYEE_STORAGE", "objects")
+    if storage not in ("objects", "compact"):
+        raise RuntimeError(f"EMPLOYEE_STORAGE must be 'objects' or 'compact', got {storage!r}")
+    return storage == "compact"
+
+
+@lru_cache(maxsize=1)
+def _get_export_chunk_size() -> int:
+    raw = os.environ.get("EXPORT_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE))
+    try:
+        size = int(raw)
+    except ValueError:
+        size = 0
+    if size < 1:
+        raise RuntimeError(f"EXPORT_CHUNK_SIZE must be a positive integer, got {raw!r}")
+    return size
+
+
+def require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """Reject admin requests without the EMPLOYEE_ADMIN_TOKEN; all of them while none is set."""
+    token = os.environ.get("EMPLOYEE_ADMIN_TOKEN")
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled; set EMPLOYEE_ADMIN_TOKEN to enable them",
+        )
+    if not secrets.compare_digest((x_admin_token or "").encode(), token.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
 
 
 def get_fields_use_case() -> GetFieldsUseCase:
     return GetFieldsUseCase(_get_repository())
 
 
+def get_suggest_use_case() -> SuggestFieldValuesUseCase:
+    return SuggestFieldValuesUseCase(_get_repository())
+
+
 def get_search_use_case() -> SearchEmployeesUseCase:
     return SearchEmployeesUseCase(_get_repository())
 
 
-def get_export_use_case() -> ExportCsvUseCase:
-    return ExportCsvUseCase(_get_repository())
+def get_batch_search_use_case() -> BatchSearchEmployeesUseCase:
+    return BatchSearchEmployeesUseCase(_get_repository())
+
+
+def get_count_use_case() -> CountEmployeesUseCase:
+    return CountEmployeesUseCase(_get_repository())
+
+
+def get_reload_use_case() -> ReloadDatasetUseCase:
+    return ReloadDatasetUseCase(_get_reloader())
+
+
+def get_reload_status_use_case() -> GetReloadStatusUseCase:
+    return GetReloadStatusUseCase(_get_reloader())
+
+
+def get_export_use_case(
+    format: ExportFormat = Query("csv"),
+) -> ExportCsvUseCase | ExportNdjsonUseCase | ExportArrowUseCase:
+    match format:
+        case "ndjson":
+            return ExportNdjsonUseCase(_get_repository(), _get_export_chunk_size())
+        case "arrow" | "parquet":
+            return ExportArrowUseCase(_get_repository(), format)
+        case _:
+            return ExportCsvUseCase(_get_repository(), _get_export_chunk_size())
@@ -0,0 +1,45 @@
+"""
+Exposition Layer — Admin Router
+
+Exposes two endpoints:
+  POST /api/admin/reload — start reloading the dataset from its source; the
+                           response (202) is sent at once, and searches keep
+                           being served from the current dataset until the
+                           new one is complete
+  GET  /api/admin/reload — the state of the latest reload and the dataset
+                           generation being served
+
+Both require the EMPLOYEE_ADMIN_TOKEN in the X-Admin-Token header, and
+answer 403 to every request while no token is configured.
+"""
+
+from fastapi import APIRouter, Depends, status
+
+from app.application.use_cases.get_reload_status import GetReloadStatusUseCase
+from app.application.use_cases.reload_dataset import ReloadDatasetUseCase
+from app.domain.value_objects import ReloadStatus
+from app.exposition.dependencies import get_reload_status_use_case, get_reload_use_case, require_admin
+from app.exposition.schemas import ReloadStatusSchema
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.post("/admin/reload", response_model=ReloadStatusSchema, status_code=status.HTTP_202_ACCEPTED)
+def reload(use_case: ReloadDatasetUseCase = Depends(get_reload_use_case)):
+    """Load the dataset again in the background and swap it in once complete."""
+    return _status_to_dict(use_case.execute())
+
+
+@router.get("/admin/reload", response_model=ReloadStatusSchema)
+def reload_status(use_case: GetReloadStatusUseCase = Depends(get_reload_status_use_case)):
+    return _status_to_dict(use_case.execute())
+
+
+def _status_to_dict(reload_status: ReloadStatus) -> dict:
+    return {
+        "state": reload_status.state,
+        "generation": reload_status.generation,
+        "rows": reload_status.rows,
+        "seconds": reload_status.seconds,
+        "error": reload_status.error,
+    }
@@ -1,15 +1,22 @@
 """
 Exposition Layer — Fields Router
 
-Exposes GET /api/fields, which returns the list of field definitions so the
-Angular filter builder can dynamically render type-aware filter rows.
+Exposes two endpoints:
+  GET /api/fields                  — the list of field definitions, so the
+                                     Angular filter builder can render
+                                     type-aware filter rows
+  GET /api/fields/{field}/suggest  — the most frequent values of a string
+                                     field starting with ?prefix=, to
+                                     autocomplete a filter value
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.application.use_cases.get_fields import GetFieldsUseCase
-from app.exposition.dependencies import get_fields_use_case
-from app.exposition.schemas import FieldDefinitionSchema
+from app.application.use_cases.suggest_field_values import SuggestFieldValuesUseCase
+from app.domain.exceptions import InvalidQueryError
+from app.exposition.dependencies import get_fields_use_case, get_suggest_use_case
+from app.exposition.schemas import FieldDefinitionSchema, FieldSuggestionSchema
 
 router = APIRouter()
 
@@ -18,3 +25,18 @@ router = APIRouter()
 def get_fields(use_case: GetFieldsUseCase = Depends(get_fields_use_case)):
     fields = use_case.execute()
     return [{"field": f.field, "label": f.label, "type": f.type} for f in fields]
+
+
+@router.get("/fields/{field}/suggest", response_model=list[FieldSuggestionSchema])
+def suggest(
+    field: str,
+    prefix: str = Query("", max_length=200),
+    limit: int = Query(10, ge=1, le=100),
+    use_case: SuggestFieldValuesUseCase = Depends(get_suggest_use_case),
+):
+    """Values of the field starting with prefix (ignoring case), most frequent first."""
+    try:
+        suggestions = use_case.execute(field, prefix, limit)
+    except InvalidQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    return [{"value": s.value, "count": s.count} for s in suggestions]
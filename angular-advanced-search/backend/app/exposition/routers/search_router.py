@@ -1,24 +1,62 @@
 """
 Exposition Layer — Search Router
 
-Exposes two endpoints:
-  POST /api/search         — paginated search, returns JSON
-  POST /api/search/export  — same query but returns a CSV file download
+Exposes four endpoints:
+  POST /api/search         — paginated search, returns JSON (with optional facets)
+  POST /api/search/batch   — several searches in one request, answered in
+                             order; shared filters are evaluated once
+  POST /api/search/count   — number of matching rows only (exact or estimated)
+  POST /api/search/export  — same query but returns a file download; the
+                             ?format= query parameter selects csv (default),
+                             ndjson, arrow (Arrow IPC stream) or parquet
 """
 
-import io
+from collections.abc import Mapping
+from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
+from app.application.use_cases.batch_search_employees import BatchSearchEmployeesUseCase
+from app.application.use_cases.count_employees import CountEmployeesUseCase
+from app.application.use_cases.export_arrow import ExportArrowUseCase
 from app.application.use_cases.export_csv import ExportCsvUseCase
+from app.application.use_cases.export_ndjson import ExportNdjsonUseCase
 from app.application.use_cases.search_employees import SearchEmployeesUseCase
-from app.domain.value_objects import SearchFilter, SearchQuery
-from app.exposition.dependencies import get_export_use_case, get_search_use_case
-from app.exposition.schemas import SearchQuerySchema, SearchResponseSchema
+from app.domain.entities import EmployeeView
+from app.domain.exceptions import InvalidQueryError
+from app.domain.value_objects import (
+    FacetResult,
+    QueryExplanation,
+    SearchFacet,
+    SearchFilter,
+    SearchQuery,
+    SearchResult,
+)
+from app.exposition.dependencies import (
+    get_batch_search_use_case,
+    get_count_use_case,
+    get_export_use_case,
+    get_search_use_case,
+)
+from app.exposition.schemas import (
+    CountResponseSchema,
+    SearchBatchSchema,
+    SearchQuerySchema,
+    SearchResponseSchema,
+)
 
 router = APIRouter()
 
+# Export format → (media type, file extension)
+_EXPORT_FORMATS: dict[str, tuple[str, str]] = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrow"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
 
 def _to_domain_query(schema: SearchQuerySchema) -> SearchQuery:
     """Translate the HTTP schema (camelCase) into the domain value object (snake_case)."""
@@ -34,35 +72,128 @@ def _to_domain_query(schema: SearchQuerySchema) -> SearchQuery:
         page_size=schema.pageSize,
         sort_field=schema.sortField,
         sort_order=schema.sortOrder,
+        cursor=schema.cursor,
+        facets=tuple(SearchFacet(field=f.field, buckets=f.buckets, limit=f.limit) for f in schema.facets),
+        explain=schema.explain,
+        total_mode=schema.totalMode,
     )
 
 
+def _facet_to_dict(facet: FacetResult) -> dict:
+    return {
+        "field": facet.field,
+        "kind": facet.kind,
+        "buckets": [
+            {"count": b.count, "value": b.value, "low": b.low, "high": b.high} for b in facet.buckets
+        ],
+        "missing": facet.missing,
+        "ratio": facet.ratio,
+    }
+
+
+def _explanation_to_dict(explanation: QueryExplanation | None) -> dict | None:
+    if explanation is None:
+        return None
+    return {
+        "combinator": explanation.combinator,
+        "steps": [
+            {"operation": s.operation, "description": s.description, "estimatedRows": s.estimated_rows}
+            for s in explanation.steps
+        ],
+        "matchedRows": explanation.matched_rows,
+        "cached": explanation.cached,
+    }
+
+
+def _row_json(row: Mapping[str, Any]) -> bytes:
+    # Employee views carry their encoding; any other mapping is encoded here
+    return row.json if isinstance(row, EmployeeView) else to_json(row, inf_nan_mode="null")
+
+
+def _search_json(result: SearchResult) -> bytes:
+    """
+    The SearchResponseSchema JSON of a result, assembled without validating
+    it: the rows are the cached encodings of their views, joined as they
+    are, and only the small envelope around them is serialised.
+    """
+    envelope = to_json({
+        "total": result.total,
+        "page": result.page,
+        "pageSize": result.page_size,
+        "totalPages": result.total_pages,
+        "nextCursor": result.next_cursor,
+        "facets": [_facet_to_dict(f) for f in result.facets],
+        "explanation": _explanation_to_dict(result.explanation),
+        "totalRelation": result.total_relation,
+        "totalError": result.total_error,
+    }, inf_nan_mode="null")
+    data = b",".join(map(_row_json, result.data))
+    return b'{"data":[' + data + b"]," + envelope[1:]
+
+
+def _search_response(result: SearchResult) -> Response:
+    return Response(_search_json(result), media_type="application/json")
+
+
 @router.post("/search", response_model=SearchResponseSchema)
 def search(
     body: SearchQuerySchema,
     use_case: SearchEmployeesUseCase = Depends(get_search_use_case),
 ):
     query = _to_domain_query(body)
-    result = use_case.execute(query)
-    return {
-        "data": list(result.data),
-        "total": result.total,
-        "page": result.page,
-        "pageSize": result.page_size,
-        "totalPages": result.total_pages,
-    }
+    try:
+        result = use_case.execute(query)
+    except InvalidQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    # A Response is sent as is: response_model only documents the shape
+    return _search_response(result)
+
+
+@router.post("/search/batch", response_model=list[SearchResponseSchema])
+def search_batch(
+    body: SearchBatchSchema,
+    use_case: BatchSearchEmployeesUseCase = Depends(get_batch_search_use_case),
+):
+    """One search result per query, in order; an invalid query fails the whole batch."""
+    queries = [_to_domain_query(query) for query in body]
+    try:
+        results = use_case.execute(queries)
+    except InvalidQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    # A Response is sent as is: response_model only documents the shape
+    return Response(b"[" + b",".join(map(_search_json, results)) + b"]", media_type="application/json")
+
+
+@router.post("/search/count", response_model=CountResponseSchema)
+def count(
+    body: SearchQuerySchema,
+    use_case: CountEmployeesUseCase = Depends(get_count_use_case),
+):
+    """Count the matching rows; paging, sorting and facets in the body are ignored."""
+    query = _to_domain_query(body)
+    try:
+        result = use_case.execute(query)
+    except InvalidQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    return {"total": result.total, "relation": result.relation, "error": result.error}
 
 
 @router.post("/search/export")
-def export_csv(
+def export_results(
     body: SearchQuerySchema,
-    use_case: ExportCsvUseCase = Depends(get_export_use_case),
+    use_case: ExportCsvUseCase | ExportNdjsonUseCase | ExportArrowUseCase = Depends(get_export_use_case),
 ):
-    """Return a CSV file containing all records matching the query (no pagination)."""
+    """Stream a file containing all records matching the query (no pagination)."""
     query = _to_domain_query(body)
-    csv_content = use_case.execute(query)
+    try:
+        chunks = use_case.execute(query)
+    except InvalidQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    # ?format= is declared by get_export_use_case alone, so a bad value is
+    # reported once; the use case it selected names the format it writes
+    media_type, extension = _EXPORT_FORMATS[use_case.format]
     return StreamingResponse(
-        io.StringIO(csv_content),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=search-results.csv"},
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=search-results.{extension}"},
     )
@@ -6,9 +6,12 @@ They use camelCase field names to match the Angular frontend's API expectations.
 The exposition layer translates between these schemas and domain value objects.
 """
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+
+ExportFormat = Literal["csv", "ndjson", "arrow", "parquet"]
 
 
 class FilterSchema(BaseModel):
@@ -18,6 +21,12 @@ class FilterSchema(BaseModel):
     value: Any = None
 
 
+class FacetSchema(BaseModel):
+    field: str
+    buckets: int = Field(10, ge=1, le=1000)  # histogram buckets (number fields)
+    limit: int = Field(20, ge=1)  # most frequent values returned (string fields)
+
+
 class SearchQuerySchema(BaseModel):
     text: str = ""
     filters: list[FilterSchema] = []
@@ -26,6 +35,18 @@ class SearchQuerySchema(BaseModel):
     pageSize: int = 10
     sortField: str = "id"
     sortOrder: Literal["asc", "desc"] = "asc"
+    # Keyset pagination (opt-in): "" for the first page, then the previous nextCursor
+    cursor: str | None = None
+    # Aggregations over every matched row, returned alongside the page
+    facets: list[FacetSchema] = []
+    # Also return the evaluation plan the repository chose
+    explain: bool = False
+    # How precise `total` must be: exact, an estimate, or none (page only)
+    totalMode: Literal["exact", "estimate", "none"] = "exact"
+
+
+# Body of POST /api/search/batch: the queries, answered in the same order
+SearchBatchSchema = Annotated[list[SearchQuerySchema], Field(min_length=1, max_length=100)]
 
 
 class FieldDefinitionSchema(BaseModel):
@@ -34,9 +55,63 @@ class FieldDefinitionSchema(BaseModel):
     type: str
 
 
+class FieldSuggestionSchema(BaseModel):
+    value: str
+    count: int
+
+
+class FacetBucketSchema(BaseModel):
+    count: int
+    value: Any = None
+    low: float | None = None
+    high: float | None = None
+
+
+class FacetResultSchema(BaseModel):
+    field: str
+    kind: Literal["counts", "ratio", "histogram"]
+    buckets: list[FacetBucketSchema]
+    missing: int
+    ratio: float | None = None
+
+
+class PlanStepSchema(BaseModel):
+    operation: str
+    description: str
+    estimatedRows: int | None
+
+
+class QueryExplanationSchema(BaseModel):
+    combinator: str
+    steps: list[PlanStepSchema]
+    matchedRows: int
+    cached: bool
+
+
 class SearchResponseSchema(BaseModel):
     data: list[dict]
     total: int
     page: int
     pageSize: int
     totalPages: int
+    nextCursor: str | None = None
+    facets: list[FacetResultSchema] = []
+    explanation: QueryExplanationSchema | None = None
+    # "eq": total is exact; "gte": a lower bound; "approx": an estimate ± totalError
+    totalRelation: Literal["eq", "gte", "approx"] = "eq"
+    totalError: int = 0
+
+
+class CountResponseSchema(BaseModel):
+    total: int
+    relation: Literal["eq", "gte", "approx"] = "eq"
+    error: int = 0
+
+
+class ReloadStatusSchema(BaseModel):
+    # "running" while a new dataset loads, "failed" if the last reload raised
+    state: Literal["idle", "running", "failed"]
+    generation: int
+    rows: int | None = None
+    seconds: float | None = None
+    error: str | None = None
@@ -0,0 +1,122 @@
+"""
+Infrastructure Layer — Batch Planner
+
+Plans several queries that are evaluated together, such as the panels of a
+dashboard sent in one batch request. Their predicates are split into terms:
+
+  - the text search
+  - each filter of an AND group (a single filter is an AND group)
+  - an OR group as a whole
+
+A term used by several queries of the batch is evaluated once, by
+planning it as a query of its own, so its access path is whatever the
+planner picks for it alone. The rows it matches then become the candidate
+set of each query using it: a query sharing several terms reads the
+intersection of their rows and evaluates only its other terms on them
+(QueryPlanner.refine). A query sharing nothing, or whose own plan reads
+fewer rows than its shared terms match, is planned as it would be on its
+own.
+
+A term is evaluated only when at least two of its queries would read at
+least as many rows as it is expected to match, and evaluating it reads
+fewer rows than they do together: a wide filter shared by queries that each
+have a narrow index span of their own is left to them. Filters are compared
+by their compiled form, as in the candidate cache, so identical filters
+written differently are shared too.
+"""
+
+from collections.abc import Sequence
+from dataclasses import replace
+
+from app.infrastructure.candidate_cache import filter_key
+from app.infrastructure.query_compiler import QueryPlan
+from app.infrastructure.query_planner import ExecutionPlan, PlannedFilter, QueryPlanner
+
+Term = tuple
+
+
+def _terms(plan: QueryPlan) -> dict[Term, QueryPlan]:
+    """Each term of the plan, mapped to the query matching exactly its rows; {} when an operand is unhashable."""
+    terms: dict[Term, QueryPlan] = {}
+    if plan.needle:
+        terms[("text", plan.needle)] = QueryPlan(plan.needle, (), "and")
+    try:
+        keys = [filter_key(f) for f in plan.filters]
+        hash(tuple(keys))
+    except TypeError:
+        return {}
+    if plan.combinator == "and" or len(plan.filters) == 1:
+        for key, f in zip(keys, plan.filters):
+            terms[("filter", key)] = QueryPlan("", (f,), "and")
+    elif plan.filters:
+        terms[("any", frozenset(keys))] = QueryPlan("", plan.filters, "or")
+    return terms
+
+
+def _without(plan: QueryPlan, shared: set[Term]) -> QueryPlan:
+    """The part of the plan its shared terms do not guarantee."""
+    needle = "" if ("text", plan.needle) in shared else plan.needle
+    if plan.combinator == "and" or len(plan.filters) == 1:
+        filters = tuple(f for f in plan.filters if ("filter", filter_key(f)) not in shared)
+    else:
+        filters = () if ("any", frozenset(map(filter_key, plan.filters))) in shared else plan.filters
+    return replace(plan, needle=needle, filters=filters)
+
+
+class BatchPlanner:
+    def __init__(self, planner: QueryPlanner) -> None:
+        self._planner = planner
+
+    def plan(self, plans: Sequence[QueryPlan]) -> list[ExecutionPlan]:
+        """One execution plan per query plan, in the same order; terms shared by several are run here."""
+        planner = self._planner
+        texts: dict[str, PlannedFilter] = {}  # each needle's trigram postings are intersected once
+        fresh = [planner.plan(plan, texts=texts) for plan in plans]
+        terms = [_terms(plan) for plan in plans]
+        shared = self._shared_terms(terms, fresh, texts)
+
+        members: dict[Term, set[int]] = {}
+        executions: list[ExecutionPlan] = []
+        for plan, own, execution in zip(plans, terms, fresh):
+            # A term's rows replace the plan's source only when there are no more of them
+            used = sorted(
+                (term for term in own if term in shared and len(shared[term]) <= execution.read_rows()),
+                key=lambda term: len(shared[term]),
+            )
+            if not used:
+                executions.append(execution)
+                continue
+            candidates = shared[used[0]]
+            for term in used[1:]:
+                if term not in members:
+                    members[term] = set(shared[term])
+                candidates = [row for row in candidates if row in members[term]]
+            remaining = _without(plan, set(used))
+            executions.append(planner.refine(plan, remaining, candidates, "rows of terms shared with the batch"))
+        return executions
+
+    def _shared_terms(
+        self, terms: list[dict[Term, QueryPlan]], fresh: list[ExecutionPlan], texts: dict[str, PlannedFilter]
+    ) -> dict[Term, list[int]]:
+        """
+        The matching rows (ascending) of each term worth evaluating once: at
+        least two plans using it read at least as many rows as it is expected
+        to match, and evaluating it reads fewer rows than those plans do.
+        """
+        term_plans: dict[Term, QueryPlan] = {}
+        users: dict[Term, list[ExecutionPlan]] = {}
+        for own, execution in zip(terms, fresh):
+            for term, term_plan in own.items():
+                term_plans[term] = term_plan
+                users.setdefault(term, []).append(execution)
+
+        shared: dict[Term, list[int]] = {}
+        for term, executions in users.items():
+            if len(executions) < 2:
+                continue
+            term_execution = self._planner.plan(term_plans[term], texts=texts)
+            expected = term_execution.selectivity() * len(term_execution.table)
+            reads = [e.read_rows() for e in executions if e.read_rows() >= expected]
+            if len(reads) >= 2 and term_execution.read_rows() < sum(reads):
+                shared[term] = term_execution.run()
+        return shared
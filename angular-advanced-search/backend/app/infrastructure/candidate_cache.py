@@ -0,0 +1,144 @@
+"""
+Infrastructure Layer — Candidate Cache
+
+Small LRU of the rows matched by recent queries, used to answer a query
+that refines one of them. The Angular filter builder produces exactly such
+sequences: one more filter under AND, one filter fewer under OR, a few more
+characters typed into the text box. Every row matching the refined query
+matches the earlier one, so only the earlier query's rows need to be read,
+and only the conditions the earlier query did not already guarantee need to
+be tested.
+
+Query B refines query A when both hold:
+  - A's text needle is a substring of B's (or A has none)
+  - A's filter group is implied by B's: A has no filters; both are AND and
+    A's filters are a subset of B's; both are OR and B's filters are a
+    non-empty subset of A's; or A is OR and B is AND and they share a filter
+
+Filters are compared by their compiled form (field, operator and parsed
+operand), so "Engineering" and "engineering" are the same string filter.
+A single filter is an AND group, whatever the combinator says.
+
+Unlike the result cache this one is consulted on a miss, and it returns the
+narrowest cached superset together with the part of the query left to
+evaluate.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from app.infrastructure.query_compiler import CompiledFilter, QueryPlan
+
+FilterKey = tuple
+
+
+@dataclass(frozen=True)
+class _Signature:
+    needle: str
+    combinator: str  # "and" for groups of at most one filter
+    filters: frozenset[FilterKey]
+
+
+def filter_key(f: CompiledFilter) -> FilterKey:
+    """Comparable form of a compiled filter; hashable unless its operand is not."""
+    return f.field, f.operator, f.column, f.operand
+
+
+def _signature(plan: QueryPlan) -> _Signature | None:
+    """Comparable form of a plan, or None when an operand is unhashable."""
+    try:
+        filters = frozenset(map(filter_key, plan.filters))
+    except TypeError:
+        return None
+    combinator = plan.combinator if len(filters) > 1 else "and"
+    return _Signature(plan.needle, combinator, filters)
+
+
+def _implies(narrow: _Signature, broad: _Signature) -> bool:
+    """Whether every row matching `narrow` also matches `broad`."""
+    if broad.needle not in narrow.needle:
+        return False
+    if not broad.filters:
+        return True
+    if not narrow.filters:
+        return False
+    match narrow.combinator, broad.combinator:
+        case "and", "and":
+            return broad.filters <= narrow.filters
+        case "or", "or":
+            return narrow.filters <= broad.filters
+        case "and", "or":
+            return not narrow.filters.isdisjoint(broad.filters)
+        case _:
+            return False
+
+
+def _remaining(plan: QueryPlan, narrow: _Signature, broad: _Signature) -> QueryPlan:
+    """The part of `plan` (signature `narrow`) that rows of `broad` may still fail."""
+    needle = "" if narrow.needle == broad.needle else plan.needle
+    if narrow.combinator == "and":
+        implied = broad.filters if broad.combinator == "and" else frozenset()
+        filters = tuple(f for f in plan.filters if filter_key(f) not in implied)
+    else:  # OR group: either implied as a whole or evaluated as a whole
+        filters = () if narrow.filters == broad.filters else plan.filters
+    return replace(plan, needle=needle, filters=filters)
+
+
+@dataclass(frozen=True)
+class Refinement:
+    """Superset of a query's rows, and what is left to evaluate on them."""
+
+    rows: array        # ascending
+    remaining: QueryPlan
+
+
+class CandidateCache:
+    def __init__(self, maxsize: int = 8) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[_Signature, array] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, plan: QueryPlan) -> Refinement | None:
+        """The narrowest cached row set the plan refines, counted as a hit or a miss."""
+        signature = _signature(plan)
+        with self._lock:
+            best: _Signature | None = None
+            if signature is not None:
+                for cached, rows in self._entries.items():
+                    if (best is None or len(rows) < len(self._entries[best])) and _implies(signature, cached):
+                        best = cached
+            if best is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best)
+            self.hits += 1
+            return Refinement(self._entries[best], _remaining(plan, signature, best))
+
+    def put(self, plan: QueryPlan, rows: array) -> None:
+        signature = _signature(plan)
+        if self._maxsize <= 0 or signature is None:
+            return
+        with self._lock:
+            self._entries[signature] = rows
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+            }
@@ -0,0 +1,76 @@
+"""
+Infrastructure Layer — Compact Rows
+
+A read-only sequence of Employees stored column-wise instead of as one
+object per employee: one list per attribute, and row i is rebuilt as an
+Employee when it is read. EmployeeTable uses these lists as its raw columns,
+so in compact mode each value is held once, by its column.
+
+Strings are dictionary-encoded while the rows are loaded. Equal strings of
+a field are stored as one shared object, so a department or a status exists
+once however many employees hold it. The same goes for the lower-cased
+values the full-text search matches against. Each field's dictionary stops
+growing after _POOL_SIZE distinct strings, so fields of unique values
+(timestamps, emails) cost no more than a plain list. The dictionaries only
+live while the rows are loaded.
+
+Reads pay for the saving. A row's Employee, its view and the view's JSON
+encoding are built each time the row is returned, where a list of Employee
+objects builds them once and keeps them.
+"""
+
+from collections.abc import Iterable, Sequence
+from operator import attrgetter
+from typing import Any
+
+from app.domain.entities import EMPLOYEE_FIELDS, Employee
+
+# Distinct strings per field above which new values are stored as they come
+_POOL_SIZE = 1 << 16
+
+# Every attribute of an Employee, in constructor order
+_VALUES = attrgetter(*EMPLOYEE_FIELDS.values())
+
+
+def _pooled(pool: dict[str, str], value: Any) -> Any:
+    """The shared copy of a string value, added to the pool while it has room."""
+    if type(value) is not str:
+        return value
+    shared = pool.get(value)
+    if shared is None:
+        if len(pool) >= _POOL_SIZE:
+            return value
+        shared = pool[value] = value
+    return shared
+
+
+class CompactRows(Sequence[Employee]):
+    """
+    Employees as one list per camelCase field (columns). With texts=True,
+    texts holds the Employee.search_text of every row, dictionary-encoded
+    like the values.
+    """
+
+    def __init__(self, employees: Iterable[Employee], texts: bool = False) -> None:
+        pools: list[dict[str, str]] = [{} for _ in EMPLOYEE_FIELDS]
+        columns: list[list[Any]] = [[] for _ in EMPLOYEE_FIELDS]
+        appends = [column.append for column in columns]
+        documents: list[tuple[str, ...]] = []
+        for employee in employees:
+            values = [_pooled(pool, value) for pool, value in zip(pools, _VALUES(employee))]
+            for append, value in zip(appends, values):
+                append(value)
+            if texts:
+                documents.append(tuple(_pooled(pool, str(v).lower()) for pool, v in zip(pools, values)))
+
+        self._columns = columns
+        self.columns: dict[str, list[Any]] = dict(zip(EMPLOYEE_FIELDS, columns))
+        self.texts: list[tuple[str, ...]] | None = documents if texts else None
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, row: int | slice) -> Employee | list[Employee]:
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        return Employee(*[column[row] for column in self._columns])
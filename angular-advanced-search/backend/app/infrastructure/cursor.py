@@ -0,0 +1,88 @@
+"""
+Infrastructure Layer — Keyset Cursors
+
+Opaque tokens for keyset pagination. A cursor remembers where the previous
+page ended: the sort field and order it was issued for, the sort key and id
+of the last row returned, and — so that adapters can resume in O(log n)
+without ambiguity — the row number and dataset version it was read from.
+
+Tokens are URL-safe base64 of a compact JSON document. They are not signed:
+a forged cursor can only move the starting point of a page.
+
+Every dataset an adapter loads takes a new version from new_version().
+Versions are unique within the process and keep growing across restarts, so
+a cursor whose version differs from the dataset's was read from another
+dataset, and its row number means nothing there: adapters then look the row
+up by the cursor's employee id.
+"""
+
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+from app.domain.exceptions import InvalidQueryError
+from app.domain.value_objects import SearchQuery
+
+
+# Seeded from the clock, so a restarted process does not reissue old versions
+_VERSIONS = count(time.time_ns() // 1000)
+
+
+def new_version() -> int:
+    """A dataset version no other dataset has had."""
+    return next(_VERSIONS)
+
+
+@dataclass(frozen=True)
+class Cursor:
+    sort_field: str
+    sort_order: str
+    key: tuple | None  # sort key of the last row (see sort_index.sort_key)
+    id: Any            # Employee.id of the last row
+    row: int
+    version: int
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    payload = {
+        "f": cursor.sort_field,
+        "o": cursor.sort_order,
+        "k": cursor.key,
+        "i": cursor.id,
+        "r": cursor.row,
+        "v": cursor.version,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(query: SearchQuery) -> Cursor | None:
+    """
+    The cursor carried by a query, or None for the first page of a cursor
+    walk (empty token). Rejects malformed tokens and tokens issued for a
+    different sort.
+    """
+    if not query.cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(query.cursor + "=" * (-len(query.cursor) % 4))
+        payload = json.loads(raw)
+        key = payload["k"]
+        cursor = Cursor(
+            sort_field=payload["f"],
+            sort_order=payload["o"],
+            key=None if key is None else tuple(key),
+            id=payload["i"],
+            row=int(payload["r"]),
+            version=int(payload["v"]),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidQueryError("Malformed pagination cursor") from None
+
+    if (cursor.sort_field, cursor.sort_order) != (query.sort_field, query.sort_order):
+        raise InvalidQueryError("Pagination cursor was issued for a different sort order")
+    return cursor
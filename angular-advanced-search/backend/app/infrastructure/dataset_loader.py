@@ -0,0 +1,166 @@
+"""
+Infrastructure Layer — Dataset Loader
+
+Reads the employee dataset from a file on local disk instead of the sample
+data module. Two formats are accepted, matching what the export endpoint
+writes:
+
+  .csv            a header row of camelCase field names, then one row per
+                  employee (numbers as text, booleans as true/false/1/0)
+  .jsonl, .ndjson one JSON object per line, keyed by camelCase field name
+
+The file is streamed: records are parsed one at a time and handed straight
+to the repository, which builds its own structures as they arrive, so no
+intermediate list of the whole dataset is ever held. load_repository also
+measures how long the load took and the process's peak memory.
+
+In CSV files an empty cell is None for number, boolean and date fields and
+"" for string fields; columns the Employee entity does not have are ignored
+and missing ones are None.
+"""
+
+import csv
+import json
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.domain.entities import EMPLOYEE_FIELDS, Employee
+from app.infrastructure.sample_data import FIELD_DEFINITIONS
+
+try:  # Unix only; elsewhere peak memory is reported as None
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+_FIELD_TYPES: dict[str, str] = {f.field: f.type for f in FIELD_DEFINITIONS}
+
+_TRUE = frozenset({"true", "1"})
+_FALSE = frozenset({"false", "0"})
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    path: str
+    rows: int
+    seconds: float
+    peak_memory: int | None  # peak resident set size of the process, in bytes
+
+    def summary(self) -> str:
+        memory = "n/a" if self.peak_memory is None else f"{self.peak_memory / 2**20:,.0f} MiB"
+        return f"loaded {self.rows:,} employees from {self.path} in {self.seconds:.2f}s (peak memory {memory})"
+
+
+def read_employees(path: str | Path) -> Iterator[Employee]:
+    """Stream the employees stored in a .csv or .jsonl / .ndjson file, in file order."""
+    path = Path(path)
+    match path.suffix.lower():
+        case ".csv":
+            return _read_csv(path)
+        case ".jsonl" | ".ndjson":
+            return _read_jsonl(path)
+        case suffix:
+            raise ValueError(f"Unsupported dataset format {suffix!r} for {path}; expected .csv, .jsonl or .ndjson")
+
+
+def load_repository(factory: Callable[[Iterable[Employee]], R], path: str | Path) -> tuple[R, LoadReport]:
+    """Build a repository from a dataset file; return it with a report of the load."""
+    rows = 0
+
+    def counted(employees: Iterator[Employee]) -> Iterator[Employee]:
+        nonlocal rows
+        for rows, employee in enumerate(employees, 1):
+            yield employee
+
+    start = time.perf_counter()
+    repository = factory(counted(read_employees(path)))
+    seconds = time.perf_counter() - start
+    return repository, LoadReport(str(path), rows, seconds, peak_memory())
+
+
+def peak_memory() -> int | None:
+    """Peak resident set size of this process so far, in bytes (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# ── Readers ───────────────────────────────────────────────────────────────────
+
+def _read_csv(path: Path) -> Iterator[Employee]:
+    with path.open(newline="", encoding="utf-8") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return
+        position = {name: i for i, name in enumerate(header) if name in EMPLOYEE_FIELDS}
+        # (cell index or None when the column is missing, converter) in Employee field order
+        columns = [(position.get(field), _CONVERTERS[_FIELD_TYPES.get(field, "string")])
+                   for field in EMPLOYEE_FIELDS]
+        for record in reader:
+            if not record:
+                continue
+            try:
+                values = [None if i is None or i >= len(record) else convert(record[i]) for i, convert in columns]
+            except ValueError as error:
+                raise ValueError(f"{path}, line {reader.line_num}: {error}") from None
+            yield Employee(*values)
+
+
+def _read_jsonl(path: Path) -> Iterator[Employee]:
+    fields = list(EMPLOYEE_FIELDS)
+    with path.open(encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                raise ValueError(f"{path}, line {line_number}: {error}") from None
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}, line {line_number}: expected a JSON object")
+            yield Employee(*map(record.get, fields))
+
+
+# ── CSV cell conversion ───────────────────────────────────────────────────────
+
+def _number(raw: str) -> int | float | None:
+    if raw == "":
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            raise ValueError(f"invalid number {raw!r}") from None
+
+
+def _boolean(raw: str) -> bool | None:
+    value = raw.strip().lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    if value == "":
+        return None
+    raise ValueError(f"invalid boolean {raw!r}")
+
+
+def _optional(raw: str) -> str | None:
+    return raw or None
+
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "string": str,
+    "number": _number,
+    "boolean": _boolean,
+    "date": _optional,
+}
@@ -0,0 +1,94 @@
+"""
+Infrastructure Layer — Background Dataset Reloader
+
+Implements the DatasetReloader port by rebuilding the whole repository. The
+repository is the snapshot: its rows, its indexes, its caches and, for the
+sharded adapter, its worker processes all belong to one dataset. A reload
+builds a complete new repository on a background thread, then swaps the
+served reference under a lock. Swapping a reference is a single step:
+
+  - a request reads `repository` once, when its use case is created, and
+    keeps that repository until it returns, exports included, so it never
+    sees half of one dataset and half of another
+  - requests arriving while the new dataset is built are served by the
+    previous repository without waiting for the load
+  - the previous repository is released once its last request returns;
+    the sharded adapter's workers stop when it is garbage collected
+
+Both repositories live in memory until the swap, so a reload needs room for
+two datasets. A reload that raises leaves the served repository in place
+and reports the error in the status.
+
+The build callable returns the repository with the LoadReport of the file
+it was read from, or None for the built-in sample data.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import replace
+
+from app.domain.ports.dataset_reloader import DatasetReloader
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import ReloadStatus
+from app.infrastructure.dataset_loader import LoadReport
+
+logger = logging.getLogger(__name__)
+
+RepositoryBuilder = Callable[[], tuple[EmployeeRepository, LoadReport | None]]
+
+
+class BackgroundDatasetReloader(DatasetReloader):
+    """Holds the served repository; the first one is built when it is created."""
+
+    def __init__(self, build: RepositoryBuilder) -> None:
+        self._build = build
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._repository, self._status = self._load(generation=1)
+
+    @property
+    def repository(self) -> EmployeeRepository:
+        """The repository serving the current dataset."""
+        return self._repository
+
+    def reload(self) -> ReloadStatus:
+        with self._lock:
+            if self._status.state != "running":
+                self._status = replace(self._status, state="running", error=None)
+                self._thread = threading.Thread(target=self._run, name="dataset-reload", daemon=True)
+                self._thread.start()
+            return self._status
+
+    def status(self) -> ReloadStatus:
+        return self._status
+
+    def wait(self, timeout: float | None = None) -> ReloadStatus:
+        """Block until the running reload, if any, has finished; return the status."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._status
+
+    # ── Internal helpers ──────────────────────────────────────────────────────
+
+    def _load(self, generation: int) -> tuple[EmployeeRepository, ReloadStatus]:
+        start = time.perf_counter()
+        repository, report = self._build()
+        seconds = time.perf_counter() - start
+        rows = None if report is None else report.rows
+        return repository, ReloadStatus("idle", generation, rows, seconds)
+
+    def _run(self) -> None:
+        try:
+            repository, status = self._load(self._status.generation + 1)
+        except Exception as error:  # the served dataset stays; the error is reported
+            logger.exception("Dataset reload failed; still serving generation %d", self._status.generation)
+            with self._lock:
+                self._status = replace(self._status, state="failed", error=str(error))
+            return
+        with self._lock:
+            self._repository = repository
+            self._status = status
+        logger.info("Dataset reloaded in %.2fs; serving generation %d", status.seconds, status.generation)
@@ -0,0 +1,29 @@
+"""
+Infrastructure Layer — Date Helpers
+
+ISO-8601 parsing and integer encodings shared by the repository adapters and
+the query compiler. Naive timestamps are taken to be UTC so that stored values
+and filter operands can always be compared.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def parse_datetime(value: Any) -> datetime | None:
+    """Parse an ISO-8601 string (a trailing 'Z' is accepted); None if invalid."""
+    if value is None:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def epoch_us(dt: datetime) -> int:
+    """Microseconds since the Unix epoch — an integer that orders like the instant."""
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
@@ -0,0 +1,109 @@
+"""
+Infrastructure Layer — Employee Table
+
+Column-oriented view of an employee dataset, built once when a repository
+loads its data. Every searchable field gets a Python list indexed by row
+number, so filters and sorts read plain values instead of re-deriving them
+from Employee objects on every query.
+
+Date fields are parsed at load time into two extra integer columns:
+  "<field>:instant" — microseconds since the Unix epoch (None if unparseable)
+  "<field>:day"     — ordinal of the calendar date in the value's own offset
+The raw ISO strings stay in "<field>"; they are what the API returns.
+
+In compact mode the rows are CompactRows rather than a list of Employee
+objects. Their column lists, with repeated strings stored once, are the
+table's raw columns, and their dictionary-encoded search texts are the
+documents of the trigram index.
+
+The table also owns the indexes derived from its rows: the trigram index
+behind the full-text search, one sort index per field, a bitmap index per
+low-cardinality string or boolean field, a range index per number and date
+field, a prefix index per string field, plus the field statistics the query
+planner reads from those sort indexes. A new dataset means a new table, so
+every index always matches the rows.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from app.domain.entities import FIELD_ACCESSORS, Employee
+from app.infrastructure.compact_rows import CompactRows
+from app.infrastructure.dates import epoch_us, parse_datetime
+from app.infrastructure.field_statistics import FieldStatistics
+from app.infrastructure.indexes.bitmap_index import BitmapIndex
+from app.infrastructure.indexes.prefix_index import PrefixIndex
+from app.infrastructure.indexes.range_index import RangeIndex
+from app.infrastructure.indexes.sort_index import SortIndex
+from app.infrastructure.indexes.trigram_index import TrigramIndex
+from app.infrastructure.sample_data import FIELD_DEFINITIONS
+
+_DATE_FIELDS = frozenset(f.field for f in FIELD_DEFINITIONS if f.type == "date")
+
+
+def instant_column(field: str) -> str:
+    return f"{field}:instant"
+
+
+def day_column(field: str) -> str:
+    return f"{field}:day"
+
+
+class EmployeeTable:
+    """Rows plus one list per column; row i of every column describes rows[i]."""
+
+    def __init__(self, employees: Iterable[Employee], compact: bool = False) -> None:
+        self.rows: Sequence[Employee]
+        if compact:
+            self.rows = rows = CompactRows(employees, texts=True)
+            raw_columns, documents = rows.columns, rows.texts
+        else:
+            self.rows = list(employees)
+            raw_columns = {field: list(map(get, self.rows)) for field, get in FIELD_ACCESSORS.items()}
+            documents = [e.search_text for e in self.rows]
+        self.columns: dict[str, list[Any]] = {}
+        self.row_of_id: dict[Any, int] = {id_: i for i, id_ in enumerate(raw_columns["id"])}
+
+        for f in FIELD_DEFINITIONS:
+            raw = raw_columns[f.field]
+            self.columns[f.field] = raw
+            if f.type == "date":
+                parsed = [parse_datetime(v) for v in raw]
+                self.columns[instant_column(f.field)] = [epoch_us(dt) if dt else None for dt in parsed]
+                self.columns[day_column(f.field)] = [dt.date().toordinal() if dt else None for dt in parsed]
+
+        # Full-text search matches the lower-cased str() of every view value
+        self.text_index = TrigramIndex(documents)
+        self.sort_indexes: dict[str, SortIndex] = {
+            f.field: SortIndex(self.sort_column(f.field)) for f in FIELD_DEFINITIONS
+        }
+        # Field → bitmap index, for string and boolean fields with few distinct values
+        self.bitmap_indexes: dict[str, BitmapIndex] = {}
+        for f in FIELD_DEFINITIONS:
+            if f.type in ("string", "boolean"):
+                index = BitmapIndex.build(self.columns[f.field])
+                if index is not None:
+                    self.bitmap_indexes[f.field] = index
+        # Field → range index over its sort index, for number and date fields
+        self.range_indexes: dict[str, RangeIndex] = {
+            f.field: RangeIndex(self.sort_indexes[f.field]) for f in FIELD_DEFINITIONS if f.type in ("number", "date")
+        }
+        # Field → prefix index over its sort index, for string fields (starts_with, suggestions)
+        self.prefix_indexes: dict[str, PrefixIndex] = {
+            f.field: PrefixIndex(self.sort_indexes[f.field], self.columns[f.field])
+            for f in FIELD_DEFINITIONS
+            if f.type == "string"
+        }
+        self.statistics: dict[str, FieldStatistics] = {
+            f.field: FieldStatistics.from_index(f.field, f.type, self.sort_indexes[f.field])
+            for f in FIELD_DEFINITIONS
+        }
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def sort_column(self, field: str) -> list[Any] | None:
+        """Values to sort by for a field (epoch integers for dates), or None if unknown."""
+        if field in _DATE_FIELDS:
+            return self.columns[instant_column(field)]
+        return self.columns.get(field)
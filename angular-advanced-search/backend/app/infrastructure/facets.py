@@ -0,0 +1,83 @@
+"""
+Infrastructure Layer — Facets
+
+Turns per-value counts of the matched rows into FacetResults. Adapters only
+have to count how often each raw value of a field occurs among the rows a
+query matched (None included), which they do from their own storage in one
+pass over the matched set; grouping, ratios and histogram buckets are
+derived here from those counts, so every adapter returns identical facets.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from app.domain.exceptions import InvalidQueryError
+from app.domain.value_objects import FacetBucket, FacetResult, SearchFacet
+from app.infrastructure.sample_data import FIELD_DEFINITIONS
+
+_FIELD_TYPES: dict[str, str] = {f.field: f.type for f in FIELD_DEFINITIONS}
+
+# Field type → facet kind; date fields cannot be faceted
+_FACET_KINDS = {"string": "counts", "boolean": "ratio", "number": "histogram"}
+
+ValueCounts = Mapping[Any, int]
+
+
+def validate_facets(facets: tuple[SearchFacet, ...]) -> None:
+    """Raise InvalidQueryError for facets that cannot be computed."""
+    for facet in facets:
+        field_type = _FIELD_TYPES.get(facet.field)
+        if field_type is None:
+            raise InvalidQueryError(f"Cannot facet on unknown field '{facet.field}'")
+        if field_type not in _FACET_KINDS:
+            raise InvalidQueryError(f"Cannot facet on {field_type} field '{facet.field}'")
+        if facet.buckets < 1 or facet.limit < 1:
+            raise InvalidQueryError(f"Facet '{facet.field}' needs positive buckets and limit")
+
+
+def compute_facets(
+    facets: tuple[SearchFacet, ...],
+    count_values: Callable[[str], ValueCounts],
+) -> tuple[FacetResult, ...]:
+    """
+    Build every requested facet; count_values(field) returns how many matched
+    rows hold each raw value of that field.
+    """
+    validate_facets(facets)
+    return tuple(build_facet(facet, count_values(facet.field)) for facet in facets)
+
+
+def build_facet(facet: SearchFacet, counts: ValueCounts) -> FacetResult:
+    missing = counts.get(None, 0)
+    present = [(value, n) for value, n in counts.items() if value is not None and n]
+
+    match _FACET_KINDS[_FIELD_TYPES[facet.field]]:
+        case "counts":
+            present.sort(key=lambda item: (-item[1], str(item[0])))
+            buckets = tuple(FacetBucket(count=n, value=value) for value, n in present[: facet.limit])
+            return FacetResult(facet.field, "counts", buckets, missing)
+        case "ratio":
+            true = sum(n for value, n in present if value)
+            false = sum(n for value, n in present if not value)
+            buckets = (FacetBucket(count=true, value=True), FacetBucket(count=false, value=False))
+            ratio = true / (true + false) if true + false else None
+            return FacetResult(facet.field, "ratio", buckets, missing, ratio)
+        case _:
+            return FacetResult(facet.field, "histogram", _histogram(present, facet.buckets), missing)
+
+
+def _histogram(present: list[tuple[Any, int]], size: int) -> tuple[FacetBucket, ...]:
+    """size equal-width buckets spanning [min, max]; one bucket when all values are equal."""
+    if not present:
+        return ()
+    low = float(min(value for value, _ in present))
+    high = float(max(value for value, _ in present))
+    if low == high:
+        return (FacetBucket(count=sum(n for _, n in present), low=low, high=high),)
+
+    width = (high - low) / size
+    totals = [0] * size
+    for value, n in present:
+        totals[min(int((float(value) - low) / width), size - 1)] += n
+    edges = [low + i * width for i in range(size)] + [high]
+    return tuple(FacetBucket(count=totals[i], low=edges[i], high=edges[i + 1]) for i in range(size))
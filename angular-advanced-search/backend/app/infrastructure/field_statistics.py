@@ -0,0 +1,64 @@
+"""
+Infrastructure Layer — Field Statistics
+
+Per-field summary collected when a dataset is loaded: row and null counts,
+cardinality, and the value distribution. The distribution is the field's
+sort index itself — its distinct keys plus the number of rows holding each —
+so the number of rows in any value range is an exact count obtained by two
+binary searches. The query planner uses these counts to estimate how
+selective each filter is.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.indexes.sort_index import NULL_KEY, SortIndex
+
+
+@dataclass(frozen=True)
+class FieldStatistics:
+    field: str
+    type: str
+    rows: int
+    nulls: int     # rows without a comparable value (None, unparseable dates)
+    distinct: int  # distinct non-null values
+    min: Any
+    max: Any
+    distribution: SortIndex
+
+    @classmethod
+    def from_index(cls, field: str, field_type: str, index: SortIndex) -> "FieldStatistics":
+        nulls = index.count(NULL_KEY)
+        values = [key[1] for key in index.keys if key != NULL_KEY]
+        return cls(
+            field=field,
+            type=field_type,
+            rows=len(index),
+            nulls=nulls,
+            distinct=len(values),
+            min=values[0] if values else None,
+            max=values[-1] if values else None,
+            distribution=index,
+        )
+
+    def count_between(
+        self,
+        low: tuple | None,
+        high: tuple | None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> int:
+        """Exact number of rows whose sort key lies in the range (see SortIndex.span)."""
+        start, end = self.distribution.span(low, high, include_low, include_high)
+        return end - start
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "field": self.field,
+            "type": self.type,
+            "rows": self.rows,
+            "nulls": self.nulls,
+            "distinct": self.distinct,
+            "min": self.min,
+            "max": self.max,
+        }
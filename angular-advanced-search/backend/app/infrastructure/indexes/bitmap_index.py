@@ -0,0 +1,92 @@
+"""
+Infrastructure Layer — Bitmap Index
+
+Rows of each distinct value of a low-cardinality column (status, department,
+the booleans), as bitsets: bit i is set when row i holds the value. The
+bitsets are Python integers, so AND / OR / NOT over whole columns run in C
+one machine word at a time, and bit_count() gives exact row counts without
+touching any row.
+
+A filter on an indexed column is resolved without reading rows: its
+compiled test runs once per distinct value, and the bitsets of the values
+it accepts are OR-ed together. Any operator works that way, with exactly
+the semantics of the row-by-row predicate, None included.
+
+The index belongs to the EmployeeTable and is built with it, so it is
+rebuilt whenever the repository loads a new dataset. Columns with more than
+max_values distinct values, or more than one per _ROWS_PER_VALUE rows, get
+no index.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from itertools import compress
+from typing import Any
+
+# Distinct values above which a column is not worth a bitmap per value
+MAX_VALUES = 64
+_ROWS_PER_VALUE = 4
+
+_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+_NONZERO = re.compile(rb"[^\x00]")
+_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+# Bitmaps with fewer set bits than 1/_SPARSE_RATIO of their length are
+# decoded byte by byte, skipping the empty bytes
+_SPARSE_RATIO = 16
+
+
+class BitmapIndex:
+    def __init__(self, bitmaps: dict[tuple[type, Any], int]) -> None:
+        # Keyed by type too: True, 1 and 1.0 are equal but may pass different tests
+        self.bitmaps = bitmaps
+
+    @classmethod
+    def build(cls, values: Sequence[Any], max_values: int = MAX_VALUES) -> "BitmapIndex | None":
+        """The index of a column, or None when it has too many distinct values."""
+        max_values = min(max_values, max(len(values) // _ROWS_PER_VALUE, 1))
+        size = (len(values) + 7) // 8
+        bytesets: dict[tuple[type, Any], bytearray] = {}
+        try:
+            for row, value in enumerate(values):
+                key = (type(value), value)
+                bits = bytesets.get(key)
+                if bits is None:
+                    if len(bytesets) == max_values:
+                        return None
+                    bits = bytesets[key] = bytearray(size)
+                bits[row >> 3] |= 1 << (row & 7)
+        except TypeError:  # unhashable values
+            return None
+        return cls({key: int.from_bytes(bits, "little") for key, bits in bytesets.items()})
+
+    def select(self, test: Callable[[Any], bool]) -> int:
+        """Bitmap of the rows whose value passes test; the test runs once per distinct value."""
+        bitmap = 0
+        for (_, value), bits in self.bitmaps.items():
+            if test(value):
+                bitmap |= bits
+        return bitmap
+
+
+def bitmap_of(rows: Iterable[int], size: int) -> int:
+    """Bitset of the given row numbers, all below size."""
+    data = bytearray((size + 7) // 8)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(data, "little")
+
+
+def bitmap_rows(bitmap: int) -> list[int]:
+    """Row numbers of the set bits, ascending."""
+    length = bitmap.bit_length()
+    if bitmap.bit_count() * _SPARSE_RATIO < length:
+        data = bitmap.to_bytes((length + 7) // 8, "little")
+        rows: list[int] = []
+        for match in _NONZERO.finditer(data):
+            position = match.start()
+            base = position << 3
+            rows.extend([base + bit for bit in _BITS[data[position]]])
+        return rows
+    flags = bin(bitmap)[:1:-1].encode().translate(_FLAGS)  # one byte per row, lowest row first
+    return list(compress(range(length), flags))
@@ -0,0 +1,89 @@
+"""
+Infrastructure Layer — Prefix Index
+
+The distinct values of a string field in lower-cased order, with how many
+rows hold each: the sorted-string form of a prefix trie, where the values
+starting with a prefix are one contiguous run found by two binary searches.
+
+It is a view of the field's sort index, whose keys are exactly those
+lower-cased strings and whose starts give the rows of each key as one slice
+of the ascending order, so it adds a few integers per distinct value and
+nothing per row:
+
+  - span(prefix): the slice of the ascending order holding the rows whose
+    value starts with prefix — what a starts_with filter matches
+  - suggest(prefix, limit): the most frequent values starting with prefix,
+    most frequent first, ties in alphabetical order
+  - values(prefix): every value starting with prefix with its count, for
+    callers merging the suggestions of several indexes
+
+Matching ignores case like the starts_with filter, so values that differ
+only by case are one suggestion, spelled as the smallest of them. None and
+the empty string are never suggested.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any
+
+from app.infrastructure.indexes.sort_index import NULL_KEY, SortIndex
+
+# Walk the values by frequency when at least 1/_DENSE_RATIO of them start
+# with the prefix: the walk then stops after about limit * _DENSE_RATIO steps.
+_DENSE_RATIO = 4
+
+
+class PrefixIndex:
+    def __init__(self, index: SortIndex, values: Sequence[Any]) -> None:
+        size = bisect_left(index.keys, NULL_KEY)  # None values sort last
+        starts = index.starts
+        self.starts = starts
+        self.texts: list[str] = [key[1] for key in index.keys[:size]]
+        self.counts = array("I", (starts[r + 1] - starts[r] for r in range(size)))
+        # Ranks by decreasing frequency; the sort is stable, so ties stay alphabetical
+        self.by_count = array("I", sorted(range(size), key=self.counts.__getitem__, reverse=True))
+        spelled = list(map(values.__getitem__, index.ascending[: starts[size]]))
+        self.spellings: list[str] = [min(spelled[starts[r] : starts[r + 1]]) for r in range(size)]
+
+    def ranks(self, prefix: str) -> tuple[int, int]:
+        """Ranks [low, high) of the distinct values starting with prefix (already lower-cased)."""
+        texts = self.texts
+        low = bisect_left(texts, prefix)
+        upper = successor(prefix)
+        return low, len(texts) if upper is None else bisect_left(texts, upper, low)
+
+    def span(self, prefix: str) -> tuple[int, int]:
+        """Positions [start, end) in the sort index's ascending order of the rows starting with prefix."""
+        low, high = self.ranks(prefix)
+        return self.starts[low], self.starts[high]
+
+    def suggest(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """(value, rows) of the `limit` most frequent non-empty values starting with prefix."""
+        low, high = self._suggested(prefix)
+        counts = self.counts
+        if (high - low) * _DENSE_RATIO >= len(counts):
+            ranks = list(islice((r for r in self.by_count if low <= r < high), limit))
+        else:
+            ranks = heapq.nsmallest(limit, range(low, high), key=lambda r: (-counts[r], r))
+        return [(self.spellings[r], counts[r]) for r in ranks]
+
+    def values(self, prefix: str) -> list[tuple[str, str, int]]:
+        """(lower-cased value, spelling, rows) of every non-empty value starting with prefix."""
+        low, high = self._suggested(prefix)
+        return list(zip(self.texts[low:high], self.spellings[low:high], self.counts[low:high]))
+
+    def _suggested(self, prefix: str) -> tuple[int, int]:
+        """ranks() without the empty string: the empty prefix reaches it, but it is never suggested."""
+        low, high = self.ranks(prefix)
+        if low < high and self.texts[low] == "":
+            low += 1
+        return low, high
+
+
+def successor(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with prefix; None when there is none."""
+    stem = prefix.rstrip(chr(0x10FFFF))  # the last code point has no successor
+    return stem[:-1] + chr(ord(stem[-1]) + 1) if stem else None
@@ -0,0 +1,53 @@
+"""
+Infrastructure Layer — Range Index
+
+Range-encoded bitsets over a field's sort index, so that the rows of any
+key range — found by two binary searches in the sort index — can be had as
+a bitset and combined with other filters' bitsets by AND / OR:
+
+  - the ascending order is cut into `buckets` slices of equal length, and
+    prefixes[i] is the bitset of every row in the first i slices
+  - the rows before any position are the prefix of the nearest slice
+    boundary, plus or minus the rows between that boundary and the
+    position — at most half a slice, set one by one
+  - the rows of positions [start, end) are prefix(end) AND NOT prefix(start)
+
+So a range costs at most one slice of rows however many rows it holds,
+where building its bitset from its rows would cost every one of them.
+Number and date fields get one; it is built with the EmployeeTable and
+rebuilt with it whenever the repository loads a new dataset.
+"""
+
+from app.infrastructure.indexes.bitmap_index import bitmap_of
+from app.infrastructure.indexes.sort_index import SortIndex
+
+# Slices of the ascending order; memory is buckets / 8 bytes per row
+_BUCKETS = 64
+
+
+class RangeIndex:
+    def __init__(self, index: SortIndex, buckets: int = _BUCKETS) -> None:
+        self._ascending = index.ascending
+        self._size = size = len(index.ascending)
+        self._step = step = max(-(-size // buckets), 1)  # ceiling division
+        prefixes, bits = [0], 0
+        for start in range(0, size, step):
+            bits |= bitmap_of(self._ascending[start : start + step], size)
+            prefixes.append(bits)
+        self._prefixes = prefixes
+
+    def bitmap(self, start: int, end: int) -> int:
+        """Bitset of the rows at positions [start, end) of the ascending order."""
+        if end - start <= self._step:
+            return bitmap_of(self._ascending[start:end], self._size)
+        return self._prefix(end) & ~self._prefix(start)
+
+    def _prefix(self, position: int) -> int:
+        """Bitset of the rows before the position."""
+        slice_, offset = divmod(position, self._step)
+        if offset == 0:
+            return self._prefixes[slice_]
+        if offset <= self._step // 2:
+            return self._prefixes[slice_] | bitmap_of(self._ascending[position - offset : position], self._size)
+        end = min(position - offset + self._step, self._size)
+        return self._prefixes[slice_ + 1] & ~bitmap_of(self._ascending[position:end], self._size)
@@ -0,0 +1,178 @@
+"""
+Infrastructure Layer — Sort Index
+
+Precomputed orderings of every row by one field, in both directions, so a
+search never has to sort its whole result set to serve one page:
+
+  - ascending / descending: the row permutations, None values last when
+    ascending (first when descending), ties kept in row order — exactly what
+    a stable list.sort(key=sort_key, reverse=...) would produce
+  - rank: dense rank of each row's key, so any subset of rows can be ordered
+    by comparing small integers instead of building sort keys
+  - keys: the distinct sort keys in ascending order; keys[rank[row]] is the
+    sort key of row
+  - starts: starts[r] is the position in `ascending` of the first row whose
+    key has rank r, so the rows of any key range form one contiguous slice
+    of `ascending` and can be counted without touching them
+
+top() picks the cheaper of two strategies for the first k matches: walk the
+permutation and stop after k hits when most rows match, or run a heap-based
+top-k over the matched rows when the filters are selective. Both accept a
+keyset bound, so a page that resumes after a cursor costs the same as the
+first page.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from array import array
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any
+
+# Walk the permutation when at least 1/_DENSE_RATIO of the rows match: the
+# walk is then expected to stop after about k * _DENSE_RATIO steps.
+_DENSE_RATIO = 4
+
+NULL_KEY = (1, "")
+
+
+def sort_key(value: Any) -> tuple:
+    """Sort key of one value: None last, booleans as ints, strings case-insensitive."""
+    if value is None:
+        return NULL_KEY      # None → sorts after non-None values
+    if isinstance(value, bool):
+        return (0, int(value))
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (0, str(value).lower())
+
+
+class SortIndex:
+    def __init__(self, values: Sequence[Any]) -> None:
+        keys = [sort_key(v) for v in values]
+        ascending = sorted(range(len(keys)), key=keys.__getitem__)
+
+        rank = array("I", bytes(4 * len(keys)))
+        starts = array("I")
+        distinct: list[tuple] = []
+        for position, row in enumerate(ascending):
+            if not distinct or keys[row] != distinct[-1]:
+                distinct.append(keys[row])
+                starts.append(position)
+            rank[row] = len(distinct) - 1
+        starts.append(len(keys))
+
+        self.keys = distinct
+        self.rank = rank
+        self.starts = starts
+        self.ascending = array("I", ascending)
+        self.descending = array("I", sorted(range(len(keys)), key=rank.__getitem__, reverse=True))
+
+    def __len__(self) -> int:
+        return len(self.rank)
+
+    def order(self, descending: bool) -> array:
+        return self.descending if descending else self.ascending
+
+    # ── Key ranges ────────────────────────────────────────────────────────────
+
+    def span(
+        self,
+        low: tuple | None,
+        high: tuple | None,
+        include_low: bool = True,
+        include_high: bool = True,
+    ) -> tuple[int, int]:
+        """
+        Positions [start, end) in `ascending` of the rows whose sort key lies
+        between low and high. None leaves that side open, but the range never
+        extends into the None values at the end.
+        """
+        keys = self.keys
+        lo = 0 if low is None else (bisect_left if include_low else bisect_right)(keys, low)
+        if high is None:
+            hi = bisect_left(keys, NULL_KEY)
+        else:
+            hi = (bisect_right if include_high else bisect_left)(keys, high)
+        if hi <= lo:
+            return 0, 0
+        return self.starts[lo], self.starts[hi]
+
+    def count(self, key: tuple) -> int:
+        """Number of rows whose sort key equals key."""
+        start, end = self.span(key, key)
+        return end - start
+
+    def rows_in(self, start: int, end: int) -> list[int]:
+        """The rows of a span, in ascending row order."""
+        return sorted(self.ascending[start:end])
+
+    # ── Keyset bounds ─────────────────────────────────────────────────────────
+    # A bound (rank, row) marks a position in the ascending order; the rows
+    # after it are those whose (rank, row) compares greater. A fractional rank
+    # falls between two distinct keys.
+
+    def bound(self, key: tuple, row: int | None) -> tuple[float, int]:
+        """
+        Bound right after the row with this sort key, or after every row with
+        that key when the row is unknown or no longer carries it.
+        """
+        position = bisect_left(self.keys, key)
+        if position == len(self.keys) or self.keys[position] != key:
+            return position - 0.5, 0
+        if row is None or row >= len(self.rank) or self.rank[row] != position:
+            return position, len(self.rank)
+        return position, row
+
+    def bound_of(self, row: int) -> tuple[float, int]:
+        return self.rank[row], row
+
+    def seek(self, order: "array | list[int]", bound: tuple[float, int], descending: bool) -> int:
+        """Index of the first row of `order` (a sorted subset of rows) past the bound."""
+        rank = self.rank
+        if descending:
+            return bisect_right(order, (-bound[0], bound[1]), key=lambda r: (-rank[r], r))
+        return bisect_right(order, bound, key=lambda r: (rank[r], r))
+
+    def _beyond(self, rows: "array | list[int]", bound: tuple[float, int], descending: bool) -> list[int]:
+        rank, (b, b_row) = self.rank, bound
+        if descending:
+            return [r for r in rows if rank[r] < b or (rank[r] == b and r > b_row)]
+        return [r for r in rows if rank[r] > b or (rank[r] == b and r > b_row)]
+
+    # ── Ordering ──────────────────────────────────────────────────────────────
+
+    def top(
+        self,
+        matched: "array | list[int] | None",
+        k: int,
+        descending: bool,
+        after: tuple[float, int] | None = None,
+    ) -> list[int]:
+        """
+        The first k rows of `matched` (ascending row numbers; None = every row)
+        in sort order, optionally only those past a keyset bound.
+        """
+        if k <= 0:
+            return []
+        order = self.order(descending)
+        start = 0 if after is None else self.seek(order, after, descending)
+        if matched is None:
+            return order[start : start + k].tolist()
+        if len(matched) * _DENSE_RATIO >= len(order):
+            members = set(matched)
+            return list(islice((row for row in islice(order, start, None) if row in members), k))
+        if after is not None:
+            matched = self._beyond(matched, after, descending)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(k, matched, key=self.rank.__getitem__)
+
+    def sort(self, matched: "array | list[int] | None", descending: bool) -> list[int]:
+        """All of `matched` (ascending row numbers; None = every row) in sort order."""
+        order = self.order(descending)
+        if matched is None:
+            return order.tolist()
+        if len(matched) * _DENSE_RATIO >= len(order):
+            members = set(matched)
+            return [row for row in order if row in members]
+        return sorted(matched, key=self.rank.__getitem__, reverse=descending)
@@ -0,0 +1,103 @@
+"""
+Infrastructure Layer — Trigram Index
+
+Inverted index from every 3-character substring (trigram) to the rows whose
+searchable values contain it. A needle of length >= 3 can only occur in a
+row that contains all of the needle's trigrams, so intersecting their
+posting lists yields a small candidate set. Candidates are then verified
+with a plain substring test, which keeps the exact semantics of a full scan.
+
+Needles shorter than three characters carry no trigram and fall back to a
+scan of the pre-lower-cased documents.
+"""
+
+from array import array
+from collections.abc import Iterable, Sequence
+
+_N = 3
+
+
+def _trigrams(value: str) -> set[str]:
+    return {value[i : i + _N] for i in range(len(value) - _N + 1)}
+
+
+class TrigramIndex:
+    """
+    Each document is the tuple of lower-cased values of one row. Trigrams are
+    taken per value, never across value boundaries, because a match must lie
+    entirely inside one value.
+    """
+
+    def __init__(self, documents: Iterable[Sequence[str]]) -> None:
+        self._documents: list[Sequence[str]] = list(documents)
+        postings: dict[str, array] = {}
+        for row, values in enumerate(self._documents):
+            grams: set[str] = set()
+            for value in values:
+                grams |= _trigrams(value)
+            for gram in grams:
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(row)  # rows are visited in order → postings stay sorted
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @property
+    def gram_count(self) -> int:
+        return len(self._postings)
+
+    def candidates(self, needle: str) -> list[int] | None:
+        """
+        Rows that contain every trigram of the (lower-cased) needle, ascending.
+        Returns None when the needle is too short for the index to narrow.
+        """
+        grams = _trigrams(needle)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            rows.intersection_update(posting)
+            if not rows:
+                return []
+        return sorted(rows)
+
+    def bound(self, needle: str) -> int:
+        """
+        Upper bound on len(candidates(needle)) that needs no intersection: the
+        length of the shortest posting list among the needle's trigrams.
+        """
+        rarest = self.rarest(needle)
+        return len(self) if rarest is None else len(rarest)
+
+    def rarest(self, needle: str) -> Sequence[int] | None:
+        """
+        The shortest posting list among the needle's trigrams, ascending: a
+        superset of candidates(needle) that needs no intersection. None when
+        the needle is too short for the index to narrow.
+        """
+        grams = _trigrams(needle)
+        if not grams:
+            return None
+        return min((self._postings.get(gram, ()) for gram in grams), key=len)
+
+    def matches(self, row: int, needle: str) -> bool:
+        """Whether one of the row's values contains the (lower-cased) needle."""
+        return any(needle in value for value in self._documents[row])
+
+    def search(self, needle: str) -> list[int]:
+        """Rows with at least one value containing the needle, ascending."""
+        documents = self._documents
+        candidates = self.candidates(needle)
+        rows = range(len(documents)) if candidates is None else candidates
+        return [row for row in rows if any(needle in value for value in documents[row])]
@@ -0,0 +1,257 @@
+"""
+Infrastructure Layer — Query Compiler
+
+Turns a SearchQuery into a QueryPlan once per request instead of re-deriving
+the same facts for every row: the field definition of each filter is looked
+up, its operand is parsed (numbers, dates, "between" bounds), and a
+predicate specialised for the (type, operator) pair is selected.
+
+Plans only depend on the predicate part of the query (text, filters,
+combinator), never on the dataset, so identical queries share one cached
+plan. Malformed operands raise InvalidQueryError at compile time rather than
+silently failing every row.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from app.domain.exceptions import InvalidQueryError
+from app.domain.value_objects import SearchFilter, SearchQuery
+from app.infrastructure.dates import epoch_us, parse_datetime
+from app.infrastructure.employee_table import day_column, instant_column
+from app.infrastructure.sample_data import FIELD_DEFINITIONS
+
+_FIELD_TYPES: dict[str, str] = {f.field: f.type for f in FIELD_DEFINITIONS}
+
+_PLAN_CACHE_SIZE = 256
+
+Predicate = Callable[[Any], bool]
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    """
+    A SearchFilter resolved against the field definitions.
+
+    - type:    the field's data type, or None when the field is unknown
+    - column:  the stored representation the test reads — the field itself,
+               or one of the integer date columns built by EmployeeTable
+    - operand: the pre-parsed comparison value — lower-cased str, float,
+               bool, epoch microseconds or date ordinal for dates, or a
+               (low, high) tuple for "between"
+    - test:    predicate over one value of that column
+    """
+
+    field: str
+    type: str | None
+    operator: str
+    column: str
+    operand: Any
+    test: Predicate
+
+    def describe(self) -> str:
+        """Readable form for query explanations, e.g. "age greater_than 40.0"."""
+        return f"{self.column} {self.operator}" + ("" if self.operand is None else f" {self.operand!r}")
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Compiled, dataset-independent form of a SearchQuery's predicate part."""
+
+    needle: str  # lower-cased text search, "" when there is none
+    filters: tuple[CompiledFilter, ...]
+    combinator: str
+
+    def bind(self, accessor: Callable[[str], Callable[[Any], Any]]) -> list[Predicate]:
+        """
+        Attach each filter to the storage: accessor(column) returns a function
+        reading that column from one record. Returns one predicate per filter.
+        """
+        predicates: list[Predicate] = []
+        for f in self.filters:
+            if f.type is None:
+                predicates.append(_never)
+            else:
+                read, test = accessor(f.column), f.test
+                predicates.append(lambda record, read=read, test=test: test(read(record)))
+        return predicates
+
+
+def predicate_key(query: SearchQuery) -> tuple | None:
+    """
+    Hashable identity of the query's predicate part (text, filters without
+    their UI ids, combinator), or None when an operand is unhashable.
+    """
+    filters = tuple((f.field, f.operator, type(f.value).__name__, f.value) for f in query.filters)
+    key = (query.text, filters, query.combinator)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def compile_query(query: SearchQuery) -> QueryPlan:
+    """Return the (possibly cached) plan for the query's text, filters and combinator."""
+    key = predicate_key(query)
+    if key is None:  # unhashable operand (e.g. a JSON list) — compile without caching
+        filters = tuple((f.field, f.operator, "", f.value) for f in query.filters)
+        return _compile(query.text, filters, query.combinator)
+    return _compile_cached(*key)
+
+
+def _compile(text: str, filters: tuple[tuple, ...], combinator: str) -> QueryPlan:
+    return QueryPlan(
+        needle=text.lower() if text.strip() else "",
+        filters=tuple(compile_filter(SearchFilter("", field, op, value)) for field, op, _, value in filters),
+        combinator=combinator,
+    )
+
+
+_compile_cached = lru_cache(maxsize=_PLAN_CACHE_SIZE)(_compile)
+
+
+def compile_filter(f: SearchFilter) -> CompiledFilter:
+    field_type = _FIELD_TYPES.get(f.field)
+    column = f.field
+    match field_type:
+        case "string":
+            operand, test = _compile_string(f.operator, f.value)
+        case "number":
+            operand, test = _compile_number(f)
+        case "date":
+            column, operand, test = _compile_date(f)
+        case "boolean":
+            operand, test = _compile_boolean(f.operator, f.value)
+        case _:
+            operand, test = f.value, _never
+    return CompiledFilter(f.field, field_type, f.operator, column, operand, test)
+
+
+# ── Per-type compilation ──────────────────────────────────────────────────────
+
+
+def _never(_: Any) -> bool:
+    return False
+
+
+def _not_none(raw: Any) -> bool:
+    return raw is not None
+
+
+def _is_none(raw: Any) -> bool:
+    return raw is None
+
+
+def _compile_string(operator: str, value: Any) -> tuple[Any, Predicate]:
+    if operator == "is_empty":
+        return None, lambda raw: raw is None or str(raw).strip() == ""
+    if operator == "is_not_empty":
+        return None, lambda raw: raw is not None and str(raw).strip() != ""
+
+    fv = str(value).lower() if value is not None else ""
+    match operator:
+        case "contains":     test = lambda raw: raw is not None and fv in str(raw).lower()
+        case "not_contains": test = lambda raw: raw is not None and fv not in str(raw).lower()
+        case "equals":       test = lambda raw: raw is not None and str(raw).lower() == fv
+        case "not_equals":   test = lambda raw: raw is not None and str(raw).lower() != fv
+        case "starts_with":  test = lambda raw: raw is not None and str(raw).lower().startswith(fv)
+        case "ends_with":    test = lambda raw: raw is not None and str(raw).lower().endswith(fv)
+        case _:              test = _not_none
+    return fv, test
+
+
+def _parse_number(f: SearchFilter, value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        raise InvalidQueryError(
+            f"Filter '{f.field} {f.operator}' expects a number, got {value!r}"
+        ) from None
+
+
+def _parse_range(f: SearchFilter, parse: Callable[[SearchFilter, Any], Any]) -> tuple[Any, Any]:
+    parts = str(f.value).split(",", 1)
+    if len(parts) != 2:
+        raise InvalidQueryError(
+            f"Filter '{f.field} between' expects two comma-separated values, got {f.value!r}"
+        )
+    return parse(f, parts[0].strip()), parse(f, parts[1].strip())
+
+
+def _compile_number(f: SearchFilter) -> tuple[Any, Predicate]:
+    match f.operator:
+        case "is_empty":
+            return None, _is_none
+        case "is_not_empty":
+            return None, _not_none
+        case "between":
+            lo, hi = _parse_range(f, _parse_number)
+            return (lo, hi), lambda raw: raw is not None and lo <= raw <= hi
+        case "equals" | "not_equals" | "greater_than" | "greater_than_or_equal" | "less_than" | "less_than_or_equal":
+            x = _parse_number(f, f.value)
+        case _:
+            return f.value, _not_none
+
+    match f.operator:
+        case "equals":                test = lambda raw: raw is not None and raw == x
+        case "not_equals":            test = lambda raw: raw is not None and raw != x
+        case "greater_than":          test = lambda raw: raw is not None and raw > x
+        case "greater_than_or_equal": test = lambda raw: raw is not None and raw >= x
+        case "less_than":             test = lambda raw: raw is not None and raw < x
+        case _:                       test = lambda raw: raw is not None and raw <= x
+    return x, test
+
+
+def _parse_date(f: SearchFilter, value: Any) -> datetime:
+    dt = parse_datetime(value)
+    if dt is None:
+        raise InvalidQueryError(
+            f"Filter '{f.field} {f.operator}' expects an ISO-8601 date, got {value!r}"
+        )
+    return dt
+
+
+def _parse_instant(f: SearchFilter, value: Any) -> int:
+    return epoch_us(_parse_date(f, value))
+
+
+def _compile_date(f: SearchFilter) -> tuple[str, Any, Predicate]:
+    """Date filters read the integer columns parsed at load time (see employee_table)."""
+    instant = instant_column(f.field)
+    match f.operator:
+        case "is_empty":
+            return f.field, None, _is_none
+        case "is_not_empty":
+            return f.field, None, _not_none
+        case "between":
+            start, end = _parse_range(f, _parse_instant)
+            return instant, (start, end), lambda dv: dv is not None and start <= dv <= end
+        case "equals" | "not_equals":
+            day = _parse_date(f, f.value).date().toordinal()
+            if f.operator == "equals":
+                return day_column(f.field), day, lambda d: d is not None and d == day
+            return day_column(f.field), day, lambda d: d is not None and d != day
+        case "before" | "after" | "before_or_equals" | "after_or_equals":
+            x = _parse_instant(f, f.value)
+        case _:
+            return instant, f.value, _not_none
+
+    match f.operator:
+        case "before":            test = lambda dv: dv is not None and dv < x
+        case "after":             test = lambda dv: dv is not None and dv > x
+        case "before_or_equals":  test = lambda dv: dv is not None and dv <= x
+        case _:                   test = lambda dv: dv is not None and dv >= x
+    return instant, x, test
+
+
+def _compile_boolean(operator: str, value: Any) -> tuple[Any, Predicate]:
+    fv = value is True or str(value).lower() == "true"
+    match operator:
+        case "equals":     test = lambda raw: raw is not None and bool(raw) == fv
+        case "not_equals": test = lambda raw: raw is not None and bool(raw) != fv
+        case _:            test = _not_none
+    return fv, test
@@ -0,0 +1,544 @@
+"""
+Infrastructure Layer — Query Planner
+
+Decides how a compiled QueryPlan is evaluated against an EmployeeTable,
+using the field statistics collected when the table was loaded:
+
+  - every filter gets an estimated row count — exact for equality and range
+    filters, which are counted in the field's sort index, and for prefix
+    filters, counted in its prefix index; a fixed share of the non-null rows
+    for substring tests
+  - filters on low-cardinality fields (status, department, the booleans)
+    are resolved to exact row bitsets by their bitmap indexes, and range
+    filters on number and date fields by their range indexes; an AND or OR
+    group of such filters becomes one bitset by bitwise operations
+  - the candidate rows come from the cheapest access path available: the
+    sort index span of the most selective indexable filter, the bitset of
+    the bitmap-indexed filters, the trigram index for the full-text search,
+    or a scan of every row
+  - the remaining filters run in selectivity order, weighted by the cost of
+    evaluating them: AND filters by cost / (1 - selectivity), so a cheap
+    filter that rejects most rows runs first and shrinks the input of the
+    next; OR filters by cost / selectivity, so any() reaches a hit sooner.
+    With equal costs this is most to least selective for AND and least to
+    most selective for OR.
+
+A filter answered by a sort index span matches exactly the rows of the span,
+so it is not evaluated again. When the caller already knows a superset of
+the matching rows — those of a broader query run moments ago — the plan
+reads only those rows and evaluates what the broader query did not
+guarantee. An ExecutionPlan runs itself and describes itself for explain
+mode.
+
+When an exact total is not needed, a plan also tests single rows (so a
+caller can walk a sort order and stop once a page is filled) and estimates
+its match count from a uniform sample of the rows its source would read.
+"""
+
+import math
+import random
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from typing import Any
+
+from app.domain.value_objects import PlanStep, QueryExplanation, SearchCount
+from app.infrastructure.employee_table import EmployeeTable
+from app.infrastructure.field_statistics import FieldStatistics
+from app.infrastructure.indexes.bitmap_index import bitmap_rows
+from app.infrastructure.indexes.sort_index import SortIndex
+from app.infrastructure.query_compiler import CompiledFilter, Predicate, QueryPlan
+
+# An index span replaces the scan only when it holds at most this share of
+# the rows; wider spans cost more to sort back into row order than a scan.
+_NARROW_RATIO = 0.25
+
+# Share of the non-null rows assumed to pass filters the statistics cannot count
+_GUESSED_SELECTIVITY = {"contains": 0.1, "ends_with": 0.1, "not_contains": 0.9}
+
+# Decoding a bitset into row numbers costs about as much as reading one row
+# in this many; added to a bitmap source's row count when choosing a source
+_BITMAP_DECODE_RATIO = 20
+
+# Relative cost of evaluating one predicate on one row
+_COSTS = {"string": 3, "number": 1, "date": 1, "boolean": 1}
+_TEXT_COST = 8
+
+# Rows tested to estimate a match count; sources reading fewer rows are counted
+_SAMPLE_SIZE = 2000
+_Z_95 = 1.96
+
+Bounds = tuple[tuple | None, tuple | None, bool, bool]
+
+
+@dataclass
+class PlannedFilter:
+    """
+    One filter (or the full-text search) with its estimate.
+
+    - estimate: rows expected to pass this filter on its own
+    - index / span: when set, rows index.ascending[span] are exactly the
+      rows passing the filter
+    - candidates: for the full-text search, rows holding every trigram of
+      the needle, or only its rarest one when the postings were not
+      intersected (None when the needle is too short for the index); for a
+      candidate set source, the rows to read
+    - bitmap: when set, exactly the rows passing the filter, as a bitset
+      (bit i is row i)
+    """
+
+    description: str
+    estimate: int
+    cost: int
+    predicate: Predicate | None = None
+    index: SortIndex | None = None
+    span: tuple[int, int] | None = None
+    candidates: Sequence[int] | None = None
+    needle: str = ""
+    bitmap: int | None = None
+
+    @property
+    def indexed(self) -> bool:
+        return self.span is not None
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    Candidate rows come from `sources` (every row when empty): the one text
+    or sort index source of an AND query, or the union of the sort index
+    spans of an OR query. Rows then have to pass every group of `steps`,
+    where a group passes when any of its filters does.
+    """
+
+    table: EmployeeTable
+    combinator: str
+    source: str  # 'scan' | 'text index' | 'sort index' | 'bitmap index' | 'candidate set'
+    sources: tuple[PlannedFilter, ...]
+    steps: tuple[tuple[PlannedFilter, ...], ...]
+
+    def run(self) -> list[int]:
+        """The matching row numbers, ascending."""
+        rows = self._source_rows()
+        for group in self.steps:
+            predicates = [self._predicate(f) for f in group]
+            if len(predicates) == 1:
+                predicate = predicates[0]
+                rows = [row for row in rows if predicate(row)]
+            else:
+                rows = [row for row in rows if any(p(row) for p in predicates)]
+        return list(rows)
+
+    def matcher(self) -> Predicate:
+        """Test of one row against the whole query, for callers visiting rows in their own order."""
+        groups = [[self._row_test(f) for f in group] for group in self.steps]
+        if self.sources:
+            groups.insert(0, [self._row_test(f) for f in self.sources])
+        tests = [group[0] if len(group) == 1 else _any(group) for group in groups]
+        return lambda row: all(test(row) for test in tests)
+
+    def read_rows(self) -> int:
+        """Rows run() reads from its source before any filter."""
+        return sum(f.estimate for f in self.sources) if self.sources else len(self.table)
+
+    def selectivity(self) -> float:
+        """Expected share of the rows matching, assuming the filters are independent."""
+        size = max(len(self.table), 1)
+        share = 1.0
+        for group in ((self.sources, *self.steps) if self.sources else self.steps):
+            share *= min(1.0, sum(f.estimate for f in group) / size)
+        return share
+
+    def exact_count(self) -> int | None:
+        """The match count when the source is exactly the result (one span or bitset), without reading a row."""
+        if self.source in ("sort index", "bitmap index") and len(self.sources) == 1 and not self.steps:
+            return self.sources[0].estimate
+        return None
+
+    def estimate_count(self, sample_size: int = _SAMPLE_SIZE) -> SearchCount:
+        """
+        Number of matching rows, from a uniform sample of the rows the source
+        reads: exact when the source reads at most sample_size rows, otherwise
+        an estimate with the half-width of its 95% confidence interval.
+        """
+        exact = self.exact_count()
+        if exact is not None:
+            return SearchCount(exact)
+        parts = self._source_parts()
+        size = sum(map(len, parts))
+        if size <= sample_size:
+            return SearchCount(len(self.run()))
+
+        # A row in several spans of an OR source is counted in the first only
+        earlier = [[f.predicate for f in self.sources[:i]] for i in range(len(parts))]
+        offsets = list(accumulate(map(len, parts), initial=0))
+        matches = self.matcher()
+        hits = 0
+        for position in random.Random(size).sample(range(size), sample_size):
+            i = bisect_right(offsets, position) - 1
+            row = parts[i][position - offsets[i]]
+            hits += matches(row) and not any(p(row) for p in earlier[i])
+
+        share = hits / sample_size
+        variance = max(share * (1 - share), 1 / sample_size) / sample_size * (size - sample_size) / (size - 1)
+        return SearchCount(round(share * size), "approx", math.ceil(_Z_95 * math.sqrt(variance) * size))
+
+    def explain(self, matched_rows: int, cached: bool = False) -> QueryExplanation:
+        steps = [PlanStep(self.source, f.description, f.estimate) for f in self.sources]
+        if not self.sources:
+            steps.append(PlanStep("scan", "all rows", len(self.table)))
+        for group in self.steps:
+            operation = "filter" if len(group) == 1 else "any filter"
+            steps.extend(PlanStep(operation, f.description, f.estimate) for f in group)
+        return QueryExplanation(self.combinator, tuple(steps), matched_rows, cached)
+
+    def _source_rows(self) -> Iterable[int]:
+        if not self.sources:
+            return range(len(self.table))
+        if self.source == "candidate set":
+            return self.sources[0].candidates
+        if self.source == "bitmap index":
+            return bitmap_rows(self.sources[0].bitmap)
+        if self.source == "text index":
+            text = self.sources[0]
+            rows = range(len(self.table)) if text.candidates is None else text.candidates
+            matches = self.table.text_index.matches
+            return [row for row in rows if matches(row, text.needle)]
+        if len(self.sources) == 1:
+            (f,) = self.sources
+            return f.index.rows_in(*f.span)
+        union: set[int] = set()
+        for f in self.sources:
+            union.update(f.index.ascending[f.span[0] : f.span[1]])
+        return sorted(union)
+
+    def _source_parts(self) -> list[Sequence[int]]:
+        """The rows the source reads, unverified and in no particular order; spans may overlap."""
+        if not self.sources:
+            return [range(len(self.table))]
+        if self.source in ("candidate set", "text index"):
+            f = self.sources[0]
+            return [range(len(self.table)) if f.candidates is None else f.candidates]
+        if self.source == "bitmap index":
+            return [bitmap_rows(self.sources[0].bitmap)]
+        return [f.index.ascending[f.span[0] : f.span[1]] for f in self.sources]
+
+    def _row_test(self, f: PlannedFilter) -> Predicate:
+        """
+        Like _predicate, for callers testing few rows: the text search
+        verifies the needle without building a set of its candidates.
+        """
+        if f.predicate is not None:
+            return f.predicate
+        if self.source == "candidate set" and f is self.sources[0]:
+            return set(f.candidates).__contains__
+        matches, needle = self.table.text_index.matches, f.needle
+        return lambda row: matches(row, needle)
+
+    def _predicate(self, f: PlannedFilter) -> Predicate:
+        if f.predicate is not None:
+            return f.predicate
+        matches, needle = self.table.text_index.matches, f.needle
+        if f.candidates is None:
+            return lambda row: matches(row, needle)
+        members = set(f.candidates)
+        return lambda row: row in members and matches(row, needle)
+
+
+class QueryPlanner:
+    def __init__(self, table: EmployeeTable) -> None:
+        self._table = table
+
+    def plan(
+        self, plan: QueryPlan, candidates: bool = True, texts: dict[str, PlannedFilter] | None = None
+    ) -> ExecutionPlan:
+        """
+        With candidates=False the trigram postings of the needle are not
+        intersected: the text search reads the rows of its rarest trigram
+        instead. For callers that only test single rows with matcher() or
+        sample them with estimate_count(), where the intersection would
+        cost more than the rows it saves.
+
+        `texts` keeps the planned text searches by needle, for callers
+        planning several queries at once: each needle is intersected once.
+        """
+        filters = self._plan_filters(plan)
+        text = None
+        if plan.needle and texts is not None and candidates:
+            text = texts.get(plan.needle)
+            if text is None:
+                text = texts[plan.needle] = self._plan_text(plan.needle)
+        elif plan.needle:
+            text = self._plan_text(plan.needle, candidates)
+        if plan.combinator == "and":
+            return self._plan_and(text, filters)
+        return self._plan_or(text, filters)
+
+    def refine(
+        self,
+        plan: QueryPlan,
+        remaining: QueryPlan,
+        candidates: Sequence[int],
+        origin: str = "rows of a broader recent query",
+    ) -> ExecutionPlan:
+        """
+        Plan a query whose matching rows are known to lie within candidates
+        (ascending), rows that already satisfy everything but `remaining`.
+        The candidates are read only when there are fewer of them than rows
+        a fresh plan of the whole query would read. `origin` describes them
+        in explain mode.
+        """
+        if len(candidates) > self._fresh_rows(plan):
+            return self.plan(plan)
+        return self._plan_refinement(remaining, candidates, self._plan_filters(remaining), origin)
+
+    def _plan_filters(self, plan: QueryPlan) -> list[PlannedFilter]:
+        table = self._table
+        predicates = plan.bind(lambda column: table.columns[column].__getitem__)
+        return [self._plan_filter(f, p) for f, p in zip(plan.filters, predicates)]
+
+    # ── Access path selection ─────────────────────────────────────────────────
+
+    def _plan_and(self, text: PlannedFilter | None, filters: list[PlannedFilter]) -> ExecutionPlan:
+        limit = len(self._table) * _NARROW_RATIO
+        eligible = [f for f in filters if f.indexed and f.estimate <= limit]
+        if text is not None:
+            eligible.append(text)
+        bitmapped = [f for f in filters if f.bitmap is not None]
+        if bitmapped:
+            eligible.append(self._bitmap_group("and", bitmapped))
+        source = min(eligible, key=self._source_rank, default=None)
+
+        resolved = bitmapped if self._source_kind(source) == "bitmap index" else [source]
+        remaining = [f for f in filters + [text] if f is not None and all(f is not r for r in resolved)]
+        remaining.sort(key=self._and_rank)
+        return ExecutionPlan(
+            table=self._table,
+            combinator="and",
+            source=self._source_kind(source),
+            sources=() if source is None else (source,),
+            steps=tuple((f,) for f in remaining),
+        )
+
+    def _plan_or(self, text: PlannedFilter | None, filters: list[PlannedFilter]) -> ExecutionPlan:
+        union = sum(f.estimate for f in filters)
+        indexable = bool(filters) and all(f.indexed for f in filters) and union <= len(self._table) * _NARROW_RATIO
+        group = tuple(sorted(filters, key=self._or_rank))
+
+        bitmap = None
+        if filters and all(f.bitmap is not None for f in filters):
+            bitmap = self._bitmap_group("or", filters)
+
+        if bitmap is not None and (text is None or self._source_rank(bitmap) <= text.estimate):
+            sources, source, steps = (bitmap,), "bitmap index", () if text is None else ((text,),)
+        elif indexable and (text is None or union <= text.estimate):
+            sources, source, steps = group, "sort index", () if text is None else ((text,),)
+        elif text is not None:
+            sources, source, steps = (text,), "text index", (group,) if group else ()
+        else:
+            sources, source, steps = (), "scan", (group,) if group else ()
+        return ExecutionPlan(self._table, "or", source, sources, steps)
+
+    def _plan_refinement(
+        self, plan: QueryPlan, candidates: Sequence[int], filters: list[PlannedFilter], origin: str
+    ) -> ExecutionPlan:
+        source = PlannedFilter(
+            description=origin,
+            estimate=len(candidates),
+            cost=0,
+            candidates=candidates,
+        )
+        # Tested row by row on the candidates; the trigram postings span the whole table
+        text = None
+        if plan.needle:
+            estimate = int(len(candidates) * _GUESSED_SELECTIVITY["contains"])
+            text = PlannedFilter(f"text contains {plan.needle!r}", estimate, _TEXT_COST, needle=plan.needle)
+
+        if plan.combinator == "and":
+            steps = [(f,) for f in sorted(filters + ([text] if text else []), key=self._and_rank)]
+        else:
+            steps = [tuple(sorted(filters, key=self._or_rank))] if filters else []
+            steps += [(text,)] if text else []
+        return ExecutionPlan(self._table, plan.combinator, "candidate set", (source,), tuple(steps))
+
+    def _fresh_rows(self, plan: QueryPlan) -> int:
+        """
+        Lower bound on the rows a fresh plan reads from its source, from
+        cheap estimates only: the shortest trigram posting list of the needle
+        and the narrow sort index spans of the filters.
+        """
+        size = len(self._table)
+        text = self._table.text_index.bound(plan.needle) if plan.needle else size
+        spans = [self._narrow_span(f) for f in plan.filters]
+        if plan.combinator == "and":
+            return min([text] + [s for s in spans if s is not None])
+        if spans and None not in spans:
+            return min(text, sum(spans))
+        return text
+
+    def _narrow_span(self, f: CompiledFilter) -> int | None:
+        """Rows in the filter's sort index span when the planner would read it."""
+        stats = self._table.statistics.get(f.field)
+        span = None if f.type is None or stats is None else self._span(f, stats)
+        if span is None:
+            return None
+        start, end = span
+        return end - start if end - start <= len(self._table) * _NARROW_RATIO else None
+
+    def _span(self, f: CompiledFilter, stats: FieldStatistics) -> tuple[int, int] | None:
+        """
+        Positions [start, end) in the field's ascending sort order of exactly
+        the rows that pass the filter, or None when no index answers it.
+        """
+        prefixes = self._table.prefix_indexes.get(f.field)
+        if f.operator == "starts_with" and prefixes is not None:
+            return prefixes.span(f.operand)
+        bounds = _index_bounds(f)
+        return None if bounds is None else stats.distribution.span(*bounds)
+
+    def _and_rank(self, f: PlannedFilter) -> float:
+        """Expected cost per rejected row: lowest first."""
+        rejected = 1 - f.estimate / max(len(self._table), 1)
+        return f.cost / rejected if rejected > 0 else float("inf")
+
+    def _or_rank(self, f: PlannedFilter) -> float:
+        """Expected cost per accepted row: lowest first."""
+        accepted = f.estimate / max(len(self._table), 1)
+        return f.cost / accepted if accepted > 0 else float("inf")
+
+    def _source_rank(self, f: PlannedFilter) -> float:
+        """Rows a source reads, plus the decoding of a bitset."""
+        if self._source_kind(f) != "bitmap index":
+            return f.estimate
+        return f.estimate + len(self._table) / _BITMAP_DECODE_RATIO
+
+    @staticmethod
+    def _bitmap_group(combinator: str, filters: list[PlannedFilter]) -> PlannedFilter:
+        """
+        One source standing for bitmap-indexed filters combined with AND or
+        OR; read through its bitset even when a single filter also has a
+        sort index span.
+        """
+        if len(filters) == 1:
+            return replace(filters[0], index=None, span=None)
+        bitmap = filters[0].bitmap
+        for f in filters[1:]:
+            bitmap = bitmap & f.bitmap if combinator == "and" else bitmap | f.bitmap
+        predicates = [f.predicate for f in filters]
+        return PlannedFilter(
+            description=f" {combinator.upper()} ".join(f.description for f in filters),
+            estimate=bitmap.bit_count(),
+            cost=sum(f.cost for f in filters),
+            predicate=_all(predicates) if combinator == "and" else _any(predicates),
+            bitmap=bitmap,
+        )
+
+    @staticmethod
+    def _source_kind(source: PlannedFilter | None) -> str:
+        if source is None:
+            return "scan"
+        if source.indexed:
+            return "sort index"
+        return "text index" if source.bitmap is None else "bitmap index"
+
+    # ── Estimates ─────────────────────────────────────────────────────────────
+
+    def _plan_text(self, needle: str, intersect: bool = True) -> PlannedFilter:
+        description = f"text contains {needle!r}"
+        index = self._table.text_index
+        candidates = index.candidates(needle) if intersect else index.rarest(needle)
+        estimate = len(self._table) if candidates is None else len(candidates)
+        return PlannedFilter(
+            description=description,
+            estimate=estimate,
+            cost=_TEXT_COST,
+            candidates=candidates,
+            needle=needle,
+        )
+
+    def _plan_filter(self, f: CompiledFilter, predicate: Predicate) -> PlannedFilter:
+        description = f.describe()
+        stats = self._table.statistics.get(f.field)
+        if f.type is None or stats is None:  # unknown field → matches nothing
+            return PlannedFilter(description, 0, 0, predicate)
+
+        cost = _COSTS.get(f.type, 1)
+        span = self._span(f, stats)
+        if span is None:
+            planned = PlannedFilter(description, _estimate(f, stats), cost, predicate)
+        else:
+            planned = PlannedFilter(description, span[1] - span[0], cost, predicate, stats.distribution, span)
+            ranges = self._table.range_indexes.get(f.field)
+            if ranges is not None:
+                planned.bitmap = ranges.bitmap(*span)
+        bitmaps = self._table.bitmap_indexes.get(f.column)
+        if bitmaps is not None:
+            planned.bitmap = bitmaps.select(f.test)
+            planned.estimate = planned.bitmap.bit_count()
+        return planned
+
+
+def _index_bounds(f: CompiledFilter) -> Bounds | None:
+    """
+    Sort-key range holding exactly the rows that pass the filter, or None
+    when the filter cannot be answered by the field's sort index.
+    """
+    x = f.operand
+    if _has_nan(x):
+        return None
+    match f.type, f.operator:
+        case ("number", "equals") | ("string", "equals"):
+            return (0, x), (0, x), True, True
+        case ("number", "greater_than") | ("date", "after"):
+            return (0, x), None, False, True
+        case ("number", "greater_than_or_equal") | ("date", "after_or_equals"):
+            return (0, x), None, True, True
+        case ("number", "less_than") | ("date", "before"):
+            return None, (0, x), True, False
+        case ("number", "less_than_or_equal") | ("date", "before_or_equals"):
+            return None, (0, x), True, True
+        case ("number", "between") | ("date", "between"):
+            return (0, x[0]), (0, x[1]), True, True
+        case ("number", "is_not_empty"):
+            return None, None, True, True
+        case ("boolean", "equals"):
+            return (0, int(x)), (0, int(x)), True, True
+        case ("boolean", "not_equals"):
+            return (0, int(not x)), (0, int(not x)), True, True
+        case _:
+            return None
+
+
+def _estimate(f: CompiledFilter, stats: FieldStatistics) -> int:
+    """Rows expected to pass a filter that has no exact index range."""
+    non_null = stats.rows - stats.nulls
+    empty = stats.nulls + (stats.distribution.count((0, "")) if f.type == "string" else 0)
+    match f.operator:
+        case "is_empty":
+            return empty
+        case "is_not_empty":
+            return stats.rows - empty
+        case "equals" | "not_equals":
+            if f.type == "string":
+                equal = stats.distribution.count((0, f.operand))
+            else:  # dates compare calendar days; assume values spread evenly
+                equal = non_null // max(stats.distinct, 1)
+            return equal if f.operator == "equals" else non_null - equal
+        case operator if operator in _GUESSED_SELECTIVITY:
+            return int(non_null * _GUESSED_SELECTIVITY[operator])
+        case _:
+            return non_null
+
+
+def _any(predicates: list[Predicate]) -> Predicate:
+    return lambda row: any(p(row) for p in predicates)
+
+
+def _all(predicates: list[Predicate]) -> Predicate:
+    return lambda row: all(p(row) for p in predicates)
+
+
+def _has_nan(operand: Any) -> bool:
+    values = operand if isinstance(operand, tuple) else (operand,)
+    return any(isinstance(v, float) and v != v for v in values)
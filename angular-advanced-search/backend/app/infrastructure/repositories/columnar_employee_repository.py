@@ -0,0 +1,545 @@
+"""
+Infrastructure Layer — Columnar Employee Repository
+
+Driven adapter that implements the EmployeeRepository port on top of NumPy.
+Every field listed in FIELD_DEFINITIONS is stored as one typed array, so each
+filter is evaluated as a vectorised boolean mask over the whole dataset
+instead of a Python loop over Employee objects.
+
+Filter, sort, pagination and facet semantics mirror InMemoryEmployeeRepository:
+the same SearchQuery returns the same SearchResult from either adapter.
+A batch of queries computes the mask of each distinct filter and text
+search once. Filters on string and boolean fields with few distinct values
+are tested once per value and expanded through the column's dictionary
+codes. String columns also keep their rows in value order, so a starts_with
+filter and the value suggestions of a prefix are one binary-searched run of
+that order instead of a test of every row.
+
+Values keep their exact Python meaning: a number column holding only
+integers is int64, so ids and amounts above 2**53 compare and sort exactly,
+and string columns hold the str objects themselves (object dtype) rather
+than fixed-width NumPy strings padded to the longest value.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+
+from app.domain.entities import FIELD_ACCESSORS, Employee, FieldDefinition
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.exceptions import InvalidQueryError
+from app.domain.value_objects import (
+    FieldSuggestion,
+    PlanStep,
+    QueryExplanation,
+    SearchCount,
+    SearchQuery,
+    SearchResult,
+)
+from app.infrastructure.candidate_cache import filter_key
+from app.infrastructure.cursor import Cursor, decode_cursor, encode_cursor, new_version
+from app.infrastructure.dates import epoch_us, parse_datetime
+from app.infrastructure.facets import compute_facets
+from app.infrastructure.indexes.bitmap_index import MAX_VALUES
+from app.infrastructure.indexes.prefix_index import successor
+from app.infrastructure.query_compiler import CompiledFilter, compile_query
+from app.infrastructure.sample_data import EMPLOYEES, FIELD_DEFINITIONS
+
+
+# Joins a row's search_text values: a needle without it matches within one value
+_TEXT_SEPARATOR = "\0"
+
+
+@dataclass
+class _Column:
+    """
+    One field stored column-wise.
+
+    - values: the comparison representation (int64 for integer numbers,
+      float64 for the others, bool for booleans, lower-cased str objects for
+      strings, epoch microseconds for dates); a missing number is stored as
+      0 in an int64 column, and masked by nulls
+    - nulls:  True where the raw value is None
+    - valid:  False where the value cannot be compared (blank strings for
+      is_empty, unparseable dates)
+    - days:   date ordinal of each date value (date columns only)
+    - sort:   the sort key representation, matching the in-memory sort key
+    - codes:  dictionary encoding of the raw values — index into labels
+      (string and boolean columns only, used to count facets)
+    - order:  the rows sorted by value (string columns only), the prefix
+      index behind starts_with filters and value suggestions
+    - ranks:  each row's position among the distinct values in that order
+      (string columns only): sorting compares these integers instead of
+      the strings
+    """
+
+    type: str
+    values: np.ndarray
+    nulls: np.ndarray
+    valid: np.ndarray
+    sort: np.ndarray
+    days: np.ndarray | None = None
+    codes: np.ndarray | None = None
+    labels: list[Any] | None = None
+    order: np.ndarray | None = None
+    ranks: np.ndarray | None = None
+
+
+class ColumnarEmployeeRepository(EmployeeRepository):
+    """Concrete implementation storing one NumPy array per searchable field."""
+
+    def __init__(self, employees: Iterable[Employee] = EMPLOYEES) -> None:
+        self._employees: list[Employee] = list(employees)
+        self._size = len(self._employees)
+        self._version = new_version()
+        self._columns: dict[str, _Column] = {
+            f.field: self._build_column(f, list(map(FIELD_ACCESSORS[f.field], self._employees)))
+            for f in FIELD_DEFINITIONS
+        }
+        # Each employee's search_text joined into one string, for text search
+        self._text_rows: list[str] = [_TEXT_SEPARATOR.join(e.search_text) for e in self._employees]
+
+    def get_field_definitions(self) -> list[FieldDefinition]:
+        return list(FIELD_DEFINITIONS)
+
+    # ── Public search interface ───────────────────────────────────────────────
+
+    def search(self, query: SearchQuery) -> SearchResult:
+        return self._respond(query, self._apply_query(query))
+
+    def search_batch(self, queries: Sequence[SearchQuery]) -> list[SearchResult]:
+        masks: dict[tuple, np.ndarray] = {}  # shared by every query of the batch
+        return [self._respond(query, self._apply_query(query, masks)) for query in queries]
+
+    def _respond(self, query: SearchQuery, matched: np.ndarray) -> SearchResult:
+        facets = compute_facets(query.facets, lambda field: self._value_counts(field, matched))
+        total = len(matched)
+        total_pages = max(1, -(-total // query.page_size))  # ceiling division
+
+        next_cursor = None
+        if query.cursor is not None:
+            cursor = decode_cursor(query)
+            start = 0 if cursor is None else self._resume_position(matched, cursor, query)
+            page_slice = matched[start : start + query.page_size]
+            if start + query.page_size < total:
+                next_cursor = self._cursor_after(int(page_slice[-1]), query)
+        else:
+            start = (query.page - 1) * query.page_size
+            end = start + query.page_size
+            page_slice = matched[max(start, 0) : max(end, 0)]
+
+        return SearchResult(
+            data=tuple(self._employees[i].view for i in page_slice),
+            total=total,
+            page=query.page,
+            page_size=query.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            facets=facets,
+            explanation=self._explain(query, total) if query.explain else None,
+        )
+
+    def count(self, query: SearchQuery) -> SearchCount:
+        # Every mask covers the whole column anyway, so counts are always exact
+        return SearchCount(int(np.count_nonzero(self._mask(query))))
+
+    def suggest(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        column = self._columns.get(field)
+        if column is None or column.order is None:
+            return []
+        low, high = self._prefix_range(column, prefix.lower())
+        rows = column.order[low:high]
+        rows = rows[column.values[rows] != ""]  # None is stored as "" too
+        if not len(rows):
+            return []
+        keys = column.values[rows]  # in order: each distinct value is one run
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        counts = np.diff(np.append(starts, len(keys)))
+        ranked = np.lexsort((starts, -counts))[:limit]  # most frequent first, then alphabetical
+        suggestions = []
+        for i in ranked.tolist():
+            run = rows[starts[i] : starts[i] + counts[i]]
+            spelling = min(column.labels[code] for code in np.unique(column.codes[run]).tolist())
+            suggestions.append(FieldSuggestion(spelling, int(counts[i])))
+        return suggestions
+
+    def get_all_matching(self, query: SearchQuery) -> list[Employee]:
+        return list(self.iter_matching(query))
+
+    def iter_matching(self, query: SearchQuery) -> Iterator[Employee]:
+        return map(self._employees.__getitem__, self._apply_query(query))
+
+    def iter_matching_columns(self, query: SearchQuery, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        return self._column_batches(self._apply_query(query), batch_size)
+
+    def _column_batches(self, matched: np.ndarray, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        # The NumPy columns hold comparison values (lower-cased strings, floats),
+        # so the exported values are read from the Employee attributes instead.
+        for start in range(0, len(matched), batch_size):
+            batch = [self._employees[i] for i in matched[start : start + batch_size]]
+            yield {field: list(map(get, batch)) for field, get in FIELD_ACCESSORS.items()}
+
+    # ── Column construction ───────────────────────────────────────────────────
+
+    @staticmethod
+    def _build_column(field_def: FieldDefinition, raw: list[Any]) -> _Column:
+        nulls = np.array([v is None for v in raw], dtype=bool)
+
+        match field_def.type:
+            case "number":
+                values = ColumnarEmployeeRepository._number_values(raw)
+                return _Column("number", values, nulls, ~nulls, values)
+            case "boolean":
+                values = np.array([bool(v) for v in raw], dtype=bool)
+                codes, labels = ColumnarEmployeeRepository._dictionary_encode(raw)
+                return _Column("boolean", values, nulls, ~nulls, values.astype(np.int8), codes=codes, labels=labels)
+            case "date":
+                parsed = [parse_datetime(v) for v in raw]
+                valid = np.array([dt is not None for dt in parsed], dtype=bool)
+                values = np.array([epoch_us(dt) if dt else 0 for dt in parsed], dtype=np.int64)
+                days = np.array([dt.date().toordinal() if dt else 0 for dt in parsed], dtype=np.int64)
+                return _Column("date", values, nulls, valid, values, days)
+            case _:
+                # Each distinct value is lowered once; its rows share the result
+                codes, labels = ColumnarEmployeeRepository._dictionary_encode(raw)
+                lowered = ColumnarEmployeeRepository._object_array(["" if v is None else str(v).lower() for v in labels])
+                values = lowered[codes]
+                blank = np.array([v is None or str(v).strip() == "" for v in labels], dtype=bool)[codes]
+                order = np.argsort(values, kind="stable")
+                ordered = values[order]
+                ranks = np.empty(len(raw), dtype=np.int32)
+                ranks[order] = np.cumsum(np.concatenate(([False], ordered[1:] != ordered[:-1])))
+                return _Column(
+                    "string", values, nulls, ~blank, values, codes=codes, labels=labels, order=order, ranks=ranks
+                )
+
+    @staticmethod
+    def _number_values(raw: list[Any]) -> np.ndarray:
+        """
+        int64 when every value is an integer (missing ones stored as 0), so
+        integers above 2**53 keep their exact value; object when one does not
+        fit in 64 bits; float64, with NaN for missing values, otherwise.
+        """
+        present = [v for v in raw if v is not None]
+        if all(isinstance(v, int) for v in present):
+            values = [0 if v is None else v for v in raw]
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:
+                return ColumnarEmployeeRepository._object_array(values)
+        return np.array([np.nan if v is None else float(v) for v in raw], dtype=np.float64)
+
+    @staticmethod
+    def _object_array(values: Sequence[Any]) -> np.ndarray:
+        """A 1-d object array of the values themselves (np.array would widen sequences)."""
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    @staticmethod
+    def _dictionary_encode(raw: list[Any]) -> tuple[np.ndarray, list[Any]]:
+        """Map each raw value (None included) to a small integer code."""
+        index: dict[Any, int] = {}
+        codes = np.array([index.setdefault(v, len(index)) for v in raw], dtype=np.int32)
+        return codes, list(index)
+
+    # ── Query evaluation ──────────────────────────────────────────────────────
+
+    def _apply_query(self, query: SearchQuery, shared: dict[tuple, np.ndarray] | None = None) -> np.ndarray:
+        matched = np.flatnonzero(self._mask(query, shared))
+        return self._sorted(matched, query.sort_field, query.sort_order == "desc")
+
+    def _mask(self, query: SearchQuery, shared: dict[tuple, np.ndarray] | None = None) -> np.ndarray:
+        """Rows matching the query; `shared` keeps the text and filter masks for later queries."""
+        plan = compile_query(query)
+        mask = np.ones(self._size, dtype=bool)
+
+        # 1. Full-text search across all string-serialisable values
+        if plan.needle:
+            mask &= self._shared_mask(shared, ("text", plan.needle), lambda: self._text_mask(plan.needle))
+
+        # 2. Attribute filters combined with AND / OR
+        if plan.filters:
+            masks = [
+                self._shared_mask(shared, ("filter", filter_key(f)), lambda f=f: self._filter_mask(f))
+                for f in plan.filters
+            ]
+            combined = np.logical_and.reduce(masks) if plan.combinator == "and" else np.logical_or.reduce(masks)
+            mask &= combined
+        return mask
+
+    @staticmethod
+    def _shared_mask(
+        shared: dict[tuple, np.ndarray] | None, key: tuple, compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        if shared is None:
+            return compute()
+        try:
+            mask = shared.get(key)
+        except TypeError:  # unhashable operand
+            return compute()
+        if mask is None:
+            mask = shared[key] = compute()
+        return mask
+
+    def _explain(self, query: SearchQuery, matched_rows: int) -> QueryExplanation:
+        """
+        Every mask is evaluated over the whole column, so the plan is fixed;
+        the row counts reported for each step are exact.
+        """
+        plan = compile_query(query)
+        steps = []
+        if plan.needle:
+            count = int(self._text_mask(plan.needle).sum())
+            steps.append(PlanStep("vectorised mask", f"text contains {plan.needle!r}", count))
+        for f in plan.filters:
+            steps.append(PlanStep("vectorised mask", f.describe(), int(self._filter_mask(f).sum())))
+        if not steps:
+            steps.append(PlanStep("scan", "all rows", self._size))
+        return QueryExplanation(plan.combinator, tuple(steps), matched_rows)
+
+    def _text_mask(self, needle: str) -> np.ndarray:
+        if _TEXT_SEPARATOR in needle:  # could match across two values of a joined row
+            matches = (any(needle in v for v in e.search_text) for e in self._employees)
+        else:
+            matches = (needle in text for text in self._text_rows)
+        return np.fromiter(matches, dtype=bool, count=self._size)
+
+    def _filter_mask(self, f: CompiledFilter) -> np.ndarray:
+        column = self._columns.get(f.field)
+        if column is None:
+            return np.zeros(self._size, dtype=bool)
+
+        if column.labels is not None and len(column.labels) <= MAX_VALUES and f.type is not None:
+            # Few distinct values: test each one once, then look the rows' codes up
+            accepted = np.fromiter(map(f.test, column.labels), dtype=bool, count=len(column.labels))
+            return accepted[column.codes]
+
+        match column.type:
+            case "string":
+                return self._string_mask(column, f.operator, f.operand)
+            case "number":
+                return self._number_mask(column, f.operator, f.operand)
+            case "date":
+                return self._date_mask(column, f.operator, f.operand)
+            case "boolean":
+                return self._boolean_mask(column, f.operator, f.operand)
+            case _:
+                return np.ones(self._size, dtype=bool)
+
+    # ── Per-type vectorised filter logic ──────────────────────────────────────
+    # Operands arrive pre-parsed from the query compiler.
+
+    @staticmethod
+    def _string_mask(column: _Column, operator: str, fv: str) -> np.ndarray:
+        if operator == "is_empty":
+            return ~column.valid
+        if operator == "is_not_empty":
+            return column.valid.copy()
+
+        sv = column.values
+        match operator:
+            case "contains":         mask = ColumnarEmployeeRepository._contains(sv, fv)
+            case "not_contains":     mask = ~ColumnarEmployeeRepository._contains(sv, fv)
+            case "equals":           mask = sv == fv
+            case "not_equals":       mask = sv != fv
+            case "starts_with":      return ColumnarEmployeeRepository._prefix_mask(column, fv)
+            case "ends_with":        mask = np.fromiter((v.endswith(fv) for v in sv.tolist()), dtype=bool, count=len(sv))
+            case _:                  mask = np.ones(len(sv), dtype=bool)
+        return mask & ~column.nulls
+
+    @staticmethod
+    def _contains(values: np.ndarray, needle: str) -> np.ndarray:
+        """Rows of an object array of str whose value contains needle."""
+        return np.fromiter((needle in v for v in values.tolist()), dtype=bool, count=len(values))
+
+    @staticmethod
+    def _prefix_mask(column: _Column, prefix: str) -> np.ndarray:
+        low, high = ColumnarEmployeeRepository._prefix_range(column, prefix)
+        mask = np.zeros(len(column.values), dtype=bool)
+        mask[column.order[low:high]] = True
+        return mask & ~column.nulls
+
+    @staticmethod
+    def _prefix_range(column: _Column, prefix: str) -> tuple[int, int]:
+        """Positions [low, high) in column.order of the rows whose value starts with prefix."""
+        low = int(np.searchsorted(column.values, prefix, "left", sorter=column.order))
+        upper = successor(prefix)
+        if upper is None:
+            return low, len(column.order)
+        return low, int(np.searchsorted(column.values, upper, "left", sorter=column.order))
+
+    @staticmethod
+    def _number_mask(column: _Column, operator: str, operand: Any) -> np.ndarray:
+        if operator == "is_empty":
+            return column.nulls.copy()
+        if operator == "is_not_empty":
+            return ~column.nulls
+
+        num = column.values
+        if num.dtype != np.float64:
+            operand = ColumnarEmployeeRepository._integral(operand)
+        match operator:
+            case "equals":                mask = num == operand
+            case "not_equals":            mask = num != operand
+            case "greater_than":          mask = num > operand
+            case "greater_than_or_equal": mask = num >= operand
+            case "less_than":             mask = num < operand
+            case "less_than_or_equal":    mask = num <= operand
+            case "between":
+                lo, hi = operand
+                mask = (lo <= num) & (num <= hi)
+            case _:
+                mask = np.ones(len(num), dtype=bool)
+        return mask & ~column.nulls
+
+    @staticmethod
+    def _integral(operand: Any) -> Any:
+        """
+        Float operands holding a whole number as int, so an int64 column is
+        compared with them exactly rather than converted to float64.
+        """
+        if isinstance(operand, tuple):
+            return tuple(map(ColumnarEmployeeRepository._integral, operand))
+        return int(operand) if isinstance(operand, float) and operand.is_integer() else operand
+
+    @staticmethod
+    def _date_mask(column: _Column, operator: str, operand: Any) -> np.ndarray:
+        if operator == "is_empty":
+            return column.nulls.copy()
+        if operator == "is_not_empty":
+            return ~column.nulls
+
+        dv = column.values
+        match operator:
+            case "before":            mask = dv < operand
+            case "after":             mask = dv > operand
+            case "before_or_equals":  mask = dv <= operand
+            case "after_or_equals":   mask = dv >= operand
+            case "equals":            mask = column.days == operand
+            case "not_equals":        mask = column.days != operand
+            case "between":
+                start, end = operand
+                mask = (start <= dv) & (dv <= end)
+            case _:
+                mask = np.ones(len(dv), dtype=bool)
+        return mask & column.valid
+
+    @staticmethod
+    def _boolean_mask(column: _Column, operator: str, fv: bool) -> np.ndarray:
+        match operator:
+            case "equals":     mask = column.values == fv
+            case "not_equals": mask = column.values != fv
+            case _:            mask = np.ones(len(column.values), dtype=bool)
+        return mask & ~column.nulls
+
+    # ── Sort ──────────────────────────────────────────────────────────────────
+
+    def _sorted(self, rows: np.ndarray, field: str, descending: bool) -> np.ndarray:
+        """
+        Stable sort of the matched row indices, None values last, identical to
+        the in-memory adapter's sort (dates compare by epoch value).
+        """
+        column = self._columns.get(field)
+        if column is None or len(rows) < 2:
+            return rows
+        if descending:
+            # A stable descending sort keeps ties in their original order:
+            # sort the reversed input ascending, then reverse the result.
+            rows = rows[::-1]
+        # Unparseable dates have no epoch value and sort with the None values
+        missing = ~column.valid if column.type == "date" else column.nulls
+        sort = column.sort if column.ranks is None else column.ranks
+        order = np.lexsort((sort[rows], missing[rows]))
+        ordered = rows[order]
+        return ordered[::-1] if descending else ordered
+
+    # ── Facets ────────────────────────────────────────────────────────────────
+
+    def _value_counts(self, field: str, matched: np.ndarray) -> dict[Any, int]:
+        """How many matched rows hold each raw value of the field (None included)."""
+        column = self._columns[field]
+        if column.codes is not None:
+            counts = np.bincount(column.codes[matched], minlength=len(column.labels))
+            return {label: int(n) for label, n in zip(column.labels, counts) if n}
+        values = column.values[matched]
+        missing = np.isnan(values) if values.dtype == np.float64 else column.nulls[matched]
+        distinct, counts = np.unique(values[~missing], return_counts=True)
+        result: dict[Any, int] = dict(zip(distinct.tolist(), counts.tolist()))
+        if missing.any():
+            result[None] = int(missing.sum())
+        return result
+
+    # ── Keyset pagination ─────────────────────────────────────────────────────
+
+    def _resume_position(self, matched: np.ndarray, cursor: Cursor, query: SearchQuery) -> int:
+        if cursor.version == self._version:
+            # The dataset never changes after construction, so the row number of
+            # a cursor it issued identifies the last row of the previous page exactly.
+            hits = np.flatnonzero(matched == cursor.row)
+            if len(hits) == 0:
+                raise InvalidQueryError("Pagination cursor does not belong to this result set")
+            return int(hits[0]) + 1
+        return self._seek(matched, cursor, query)
+
+    def _seek(self, matched: np.ndarray, cursor: Cursor, query: SearchQuery) -> int:
+        """
+        Position in the sorted matched rows right after a cursor issued on
+        another dataset, found by its sort key and its employee's row here.
+        When the employee is gone or no longer has that sort key, the page
+        resumes after every row with the key (or at its row, in dataset
+        order), like the in-memory adapter.
+        """
+        column = self._columns.get(query.sort_field)
+        if column is None:  # unknown sort field → dataset order
+            row = self._row_of_id.get(cursor.id, cursor.row)
+            return int(np.searchsorted(matched, row, side="right"))
+        if cursor.key is None or len(cursor.key) != 2:
+            raise InvalidQueryError("Malformed pagination cursor")
+        key = tuple(cursor.key)
+        row = self._row_of_id.get(cursor.id)
+        if row is None or self._sort_key(column, row) != key:
+            row = self._size
+
+        flag, value = key
+        missing = (~column.valid if column.type == "date" else column.nulls)[matched]
+        later = matched > row
+        descending = query.sort_order == "desc"
+        try:
+            if flag:  # missing values sort last ascending, first descending
+                after = (~missing | later) if descending else (missing & later)
+            else:
+                sort = column.sort[matched]
+                beyond = (sort < value) if descending else (sort > value)
+                present = ~missing & (beyond | ((sort == value) & later))
+                after = present if descending else missing | present
+        except TypeError:  # a sort value of the wrong type
+            raise InvalidQueryError("Malformed pagination cursor") from None
+        positions = np.flatnonzero(after)
+        return int(positions[0]) if len(positions) else len(matched)
+
+    @cached_property
+    def _row_of_id(self) -> dict[Any, int]:
+        """Row of each employee id; only built for cursors issued on another dataset."""
+        return {employee.id: row for row, employee in enumerate(self._employees)}
+
+    @staticmethod
+    def _sort_key(column: _Column, row: int) -> tuple:
+        """Cursor sort key of a row: (1, "") when its value is missing, else (0, value)."""
+        missing = ~column.valid[row] if column.type == "date" else column.nulls[row]
+        return (1, "") if missing else (0, column.sort.item(row))
+
+    def _cursor_after(self, row: int, query: SearchQuery) -> str:
+        column = self._columns.get(query.sort_field)
+        key = None if column is None else self._sort_key(column, row)
+        return encode_cursor(Cursor(
+            sort_field=query.sort_field,
+            sort_order=query.sort_order,
+            key=key,
+            id=self._employees[row].id,
+            row=row,
+            version=self._version,
+        ))
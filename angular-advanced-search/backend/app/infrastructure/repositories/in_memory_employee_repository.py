@@ -2,214 +2,432 @@
 Infrastructure Layer — In-Memory Employee Repository
 
 Driven adapter (secondary adapter) that implements the EmployeeRepository port
-using an in-memory list. Contains all the filter, sort, and pagination logic.
+using an in-memory list. Filters are compiled once per request by the query
+compiler and planned against per-field statistics: the most selective
+indexed filter (or the trigram index, for full-text search) supplies the
+candidate rows, the other filters run most selective first, and ordering
+comes from precomputed per-field sort indexes. This module paginates;
+matched rows are kept in a versioned LRU cache so later pages and the CSV
+export of the same query skip the scan, and a query that refines a recent
+one (one more AND filter, a longer text) only re-checks that query's rows.
+A batch of queries evaluates the filters and text searches they share once.
+Cursor (keyset) pagination seeks
+into the sort index instead of counting past an offset. Facets count the
+column values of the matched rows and are cached with them. Value
+suggestions are read from the prefix index of the field without touching
+a row.
+
+With compact=True the employees are kept column-wise with repeated strings
+stored once (CompactRows), for a fraction of the memory per row; the
+Employee objects and views of the rows a request returns are then rebuilt
+for it.
+
+A query that does not need an exact total (total_mode 'estimate' or 'none')
+walks its sort order testing rows one at a time and stops once the page is
+filled, when that is expected to read fewer rows than matching them all;
+the total is then a lower bound, or an estimate sampled by the plan. So
+does a query whose plan knows its exact count without reading a row (one
+sort index span, or one bitset of bitmap and range index filters), with
+that count as the total.
 
 This is the only place in the codebase that knows about the physical layout of
 the data — all other layers work through the port abstraction.
 """
 
-from datetime import datetime, timezone
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from dataclasses import replace
+from itertools import islice
 from typing import Any
 
-from app.domain.entities import Employee, FieldDefinition
+from app.domain.entities import FIELD_ACCESSORS, Employee, FieldDefinition
 from app.domain.ports.employee_repository import EmployeeRepository
-from app.domain.value_objects import SearchFilter, SearchQuery, SearchResult
+from app.domain.value_objects import (
+    FacetResult,
+    FieldSuggestion,
+    PlanStep,
+    QueryExplanation,
+    SearchCount,
+    SearchQuery,
+    SearchResult,
+)
+from app.infrastructure.batch_planner import BatchPlanner
+from app.infrastructure.candidate_cache import CandidateCache
+from app.infrastructure.cursor import Cursor, decode_cursor, encode_cursor, new_version
+from app.infrastructure.employee_table import EmployeeTable
+from app.infrastructure.facets import compute_facets
+from app.infrastructure.field_statistics import FieldStatistics
+from app.infrastructure.indexes.sort_index import SortIndex
+from app.infrastructure.indexes.trigram_index import TrigramIndex
+from app.infrastructure.query_compiler import QueryPlan, compile_query, predicate_key
+from app.infrastructure.query_planner import ExecutionPlan, QueryPlanner
+from app.infrastructure.result_cache import CachedResult, ResultCache
 from app.infrastructure.sample_data import EMPLOYEES, FIELD_DEFINITIONS
 
-# Build a fast lookup: camelCase field name → FieldDefinition
-_FIELD_MAP: dict[str, FieldDefinition] = {f.field: f for f in FIELD_DEFINITIONS}
-
 
 class InMemoryEmployeeRepository(EmployeeRepository):
     """Concrete implementation storing employees in RAM."""
 
+    def __init__(
+        self,
+        employees: Iterable[Employee] = EMPLOYEES,
+        cache_size: int = 32,
+        refinement_size: int = 8,
+        compact: bool = False,
+    ) -> None:
+        # The dataset is fixed for the repository's lifetime; a reload builds a
+        # new repository and swaps it in whole (BackgroundDatasetReloader)
+        self._table = EmployeeTable(employees, compact)
+        self._planner = QueryPlanner(self._table)
+        self._batch_planner = BatchPlanner(self._planner)
+        self._version = new_version()
+        self._cache = ResultCache(cache_size)
+        self._candidates = CandidateCache(refinement_size)
+
     def get_field_definitions(self) -> list[FieldDefinition]:
         return list(FIELD_DEFINITIONS)
 
-    # ── Public search interface ───────────────────────────────────────────────
-
-    def search(self, query: SearchQuery) -> SearchResult:
-        matched = self._apply_query(query)
-        total = len(matched)
-        total_pages = max(1, -(-total // query.page_size))  # ceiling division
+    # ── Dataset management ────────────────────────────────────────────────────
 
-        start = (query.page - 1) * query.page_size
-        page_slice = matched[start : start + query.page_size]
+    @property
+    def version(self) -> int:
+        """
+        Unique to the dataset this repository was built with; cursors from
+        another version (an earlier dataset) are looked up by id.
+        """
+        return self._version
 
-        return SearchResult(
-            data=tuple(e.to_dict() for e in page_slice),
-            total=total,
-            page=query.page,
-            page_size=query.page_size,
-            total_pages=total_pages,
-        )
+    @property
+    def text_index(self) -> TrigramIndex:
+        """Trigram index over the searchable values, built at construction."""
+        return self._table.text_index
 
-    def get_all_matching(self, query: SearchQuery) -> list[Employee]:
-        return self._apply_query(query)
+    @property
+    def field_statistics(self) -> dict[str, FieldStatistics]:
+        """Per-field statistics collected at load time, used to plan queries."""
+        return self._table.statistics
 
-    # ── Internal helpers ──────────────────────────────────────────────────────
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Hit / miss counters of the result cache."""
+        return self._cache.stats()
 
-    def _apply_query(self, query: SearchQuery) -> list[Employee]:
-        results = list(EMPLOYEES)
+    @property
+    def refinement_stats(self) -> dict[str, int | float]:
+        """Hit / miss counters and hit rate of the candidate cache used for refinements."""
+        return self._candidates.stats()
 
-        # 1. Full-text search across all string-serialisable values
-        if query.text.strip():
-            results = [e for e in results if self._matches_text(e, query.text)]
+    # ── Public search interface ───────────────────────────────────────────────
 
-        # 2. Attribute filters combined with AND / OR
-        if query.filters:
-            if query.combinator == "and":
-                results = [e for e in results if all(self._apply_filter(e, f) for f in query.filters)]
+    def search(self, query: SearchQuery) -> SearchResult:
+        if not (query.facets or query.explain or self._is_cached(query)):
+            partial = self._partial_search(query)
+            if partial is not None:
+                return partial
+
+        cached = query.explain and self._is_cached(query)
+        return self._respond(query, self._result(query), cached)
+
+    def search_batch(self, queries: Sequence[SearchQuery]) -> list[SearchResult]:
+        """
+        Every distinct predicate of the batch is matched once: those in the
+        result cache are served from it, the others are planned together so
+        the terms they share are evaluated once (BatchPlanner). Each query is
+        then sorted and paginated on its own, with an exact total.
+        """
+        keys: list[Hashable] = []
+        results: dict[Hashable, CachedResult] = {}
+        cached: set[Hashable] = set()
+        pending: dict[Hashable, QueryPlan] = {}
+        for position, query in enumerate(queries):
+            predicate = predicate_key(query)
+            key = position if predicate is None else (self._version, predicate)  # unhashable → not shared
+            keys.append(key)
+            if key in results or key in pending:
+                continue
+            hit = None if predicate is None else self._cache.get(key)
+            if hit is not None:
+                results[key] = hit
+                cached.add(key)
             else:
-                results = [e for e in results if any(self._apply_filter(e, f) for f in query.filters)]
-
-        # 3. Sort
-        results.sort(
-            key=lambda e: self._sort_key(e.to_dict(), query.sort_field),
-            reverse=(query.sort_order == "desc"),
-        )
+                pending[key] = compile_query(query)
+
+        batch = {key: plan for key, plan in pending.items() if plan.needle or plan.filters}
+        for key in pending.keys() - batch.keys():
+            matched, explanation = self._match(pending[key])
+            results[key] = CachedResult(matched, explanation=explanation)
+        for (key, plan), execution in zip(batch.items(), self._batch_planner.plan(list(batch.values()))):
+            matched = array("I", execution.run())
+            self._candidates.put(plan, matched)
+            results[key] = CachedResult(matched, explanation=execution.explain(len(matched)))
+            if isinstance(key, tuple):
+                self._cache.put(key, results[key])
+        return [
+            self._respond(query, results[key], query.explain and key in cached)
+            for query, key in zip(queries, keys)
+        ]
+
+    def count(self, query: SearchQuery) -> SearchCount:
+        plan = compile_query(query)
+        if (plan.needle or plan.filters) and not self._is_cached(query):
+            execution = self._planner.plan(plan, candidates=False)
+            exact = execution.exact_count()
+            if exact is not None:
+                return SearchCount(exact)
+            if query.total_mode == "estimate":
+                return execution.estimate_count()
+        result = self._result(query)
+        return SearchCount(len(self._table) if result.matched is None else len(result.matched))
+
+    def suggest(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        index = self._table.prefix_indexes.get(field)
+        if index is None:
+            return []
+        return [FieldSuggestion(value, count) for value, count in index.suggest(prefix.lower(), limit)]
 
-        return results
-
-    # ── Text search ───────────────────────────────────────────────────────────
+    def get_all_matching(self, query: SearchQuery) -> list[Employee]:
+        return list(self.iter_matching(query))
 
-    @staticmethod
-    def _matches_text(employee: Employee, text: str) -> bool:
-        needle = text.lower()
-        return any(needle in str(v).lower() for v in employee.to_dict().values())
+    def iter_matching(self, query: SearchQuery) -> Iterator[Employee]:
+        # Only the row numbers are materialised (4 bytes each, shared with the
+        # result cache); Employee objects are handed out one at a time.
+        rows = self._table.rows
+        return map(rows.__getitem__, self._ordered(self._result(query), query))
 
-    # ── Attribute filter dispatch ─────────────────────────────────────────────
+    def iter_matching_columns(self, query: SearchQuery, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        return self._column_batches(self._table, self._ordered(self._result(query), query), batch_size)
 
-    def _apply_filter(self, employee: Employee, f: SearchFilter) -> bool:
-        field_def = _FIELD_MAP.get(f.field)
-        if not field_def:
-            return False
+    # ── Internal helpers ──────────────────────────────────────────────────────
 
-        raw = employee.to_dict().get(f.field)
+    def _respond(self, query: SearchQuery, result: CachedResult, cached: bool) -> SearchResult:
+        """The requested page of a matched result, with its facets and explanation."""
+        total = len(self._table) if result.matched is None else len(result.matched)
+        total_pages = max(1, -(-total // query.page_size))  # ceiling division
 
-        match field_def.type:
-            case "string":
-                return self._filter_string(raw, f.operator, f.value)
-            case "number":
-                return self._filter_number(raw, f.operator, f.value)
-            case "date":
-                return self._filter_date(raw, f.operator, f.value)
-            case "boolean":
-                return self._filter_boolean(raw, f.operator, f.value)
-            case _:
-                return True
+        next_cursor = None
+        if query.cursor is not None:
+            page_slice, next_cursor = self._cursor_page(result, query)
+        else:
+            # Only the rows up to the end of the requested page are ever ordered
+            start = (query.page - 1) * query.page_size
+            end = start + query.page_size
+            page_slice = self._ordered(result, query, end)[max(start, 0) : max(end, 0)]
 
-    # ── Per-type filter logic ─────────────────────────────────────────────────
+        rows = self._table.rows
+        return SearchResult(
+            data=tuple(rows[i].view for i in page_slice),
+            total=total,
+            page=query.page,
+            page_size=query.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+            facets=self._facets(result, query) if query.facets else (),
+            explanation=self._explain(result, cached) if query.explain else None,
+        )
 
-    @staticmethod
-    def _filter_string(raw: Any, operator: str, value: Any) -> bool:
-        if operator == "is_empty":
-            return raw is None or str(raw).strip() == ""
-        if operator == "is_not_empty":
-            return raw is not None and str(raw).strip() != ""
-
-        if raw is None:
-            return False
-        sv = str(raw).lower()
-        fv = str(value).lower() if value is not None else ""
-
-        match operator:
-            case "contains":         return fv in sv
-            case "not_contains":     return fv not in sv
-            case "equals":           return sv == fv
-            case "not_equals":       return sv != fv
-            case "starts_with":      return sv.startswith(fv)
-            case "ends_with":        return sv.endswith(fv)
-            case _:                  return True
+    def _result(self, query: SearchQuery) -> CachedResult:
+        """The matched rows of the query, from the result cache when possible."""
+        key = predicate_key(query)
+        if key is not None:
+            key = (self._version, key)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        matched, explanation = self._match(compile_query(query))
+        result = CachedResult(matched, explanation=explanation)
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def _match(self, plan: QueryPlan) -> tuple[array | None, QueryExplanation]:
+        """
+        The matching row numbers in ascending order (None for every row), and
+        how they were found. A query refining a recent one only evaluates
+        what that query left open, on that query's rows.
+        """
+        if not plan.needle and not plan.filters:
+            steps = (PlanStep("scan", "all rows", len(self._table)),)
+            return None, QueryExplanation(plan.combinator, steps, len(self._table))
+
+        refinement = self._candidates.find(plan)
+        execution: ExecutionPlan
+        if refinement is None:
+            execution = self._planner.plan(plan)
+        else:
+            execution = self._planner.refine(plan, refinement.remaining, refinement.rows)
+        matched = array("I", execution.run())
+        self._candidates.put(plan, matched)
+        return matched, execution.explain(len(matched))
+
+    def _is_cached(self, query: SearchQuery) -> bool:
+        key = predicate_key(query)
+        return key is not None and (self._version, key) in self._cache
 
     @staticmethod
-    def _filter_number(raw: Any, operator: str, value: Any) -> bool:
-        if operator == "is_empty":
-            return raw is None
-        if operator == "is_not_empty":
-            return raw is not None
-
-        if raw is None:
-            return False
-        try:
-            num = float(raw)
-        except (ValueError, TypeError):
-            return False
-
-        try:
-            match operator:
-                case "equals":               return num == float(value)
-                case "not_equals":           return num != float(value)
-                case "greater_than":         return num > float(value)
-                case "greater_than_or_equal": return num >= float(value)
-                case "less_than":            return num < float(value)
-                case "less_than_or_equal":   return num <= float(value)
-                case "between":
-                    lo, hi = (float(v.strip()) for v in str(value).split(",", 1))
-                    return lo <= num <= hi
-                case _:
-                    return True
-        except (ValueError, TypeError):
-            return False
+    def _explain(result: CachedResult, cached: bool) -> QueryExplanation:
+        return replace(result.explanation, cached=cached)
+
+    def _ordered(self, result: CachedResult, query: SearchQuery, limit: int | None = None) -> Sequence[int]:
+        """
+        The matching rows in the query's sort order. With a limit that fits in
+        the first page only the top rows are computed; anything deeper orders
+        the whole result once and keeps that ordering in the cache entry.
+        """
+        index = self._table.sort_indexes.get(query.sort_field)
+        if index is None:  # unknown sort field → dataset order
+            return range(len(self._table)) if result.matched is None else result.matched
+
+        descending = query.sort_order == "desc"
+        if result.matched is None:
+            return index.order(descending)
+
+        ordering = result.orderings.get((query.sort_field, descending))
+        if ordering is not None:
+            return ordering
+        if limit is not None and limit <= query.page_size:
+            return index.top(result.matched, limit, descending)
+        ordering = array("I", index.sort(result.matched, descending))
+        result.orderings[(query.sort_field, descending)] = ordering
+        return ordering
 
     @staticmethod
-    def _parse_dt(s: Any) -> datetime | None:
-        if s is None:
+    def _column_batches(table: EmployeeTable, ordered: Sequence[int], batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        # Values come straight from the table's columns, not from Employee objects
+        columns = [(field, table.columns[field].__getitem__) for field in FIELD_ACCESSORS]
+        for start in range(0, len(ordered), batch_size):
+            batch = ordered[start : start + batch_size]
+            yield {field: list(map(value, batch)) for field, value in columns}
+
+    def _facets(self, result: CachedResult, query: SearchQuery) -> tuple[FacetResult, ...]:
+        """Facets over the matched rows; each one is computed once per cache entry."""
+        pending = tuple(f for f in dict.fromkeys(query.facets) if f not in result.facets)
+        if pending:
+            table = self._table
+            rows = range(len(table)) if result.matched is None else result.matched
+            computed = compute_facets(
+                pending, lambda field: Counter(map(table.columns[field].__getitem__, rows))
+            )
+            result.facets.update(zip(pending, computed))
+        return tuple(result.facets[f] for f in query.facets)
+
+    # ── Page walks ────────────────────────────────────────────────────────────
+
+    def _partial_search(self, query: SearchQuery) -> SearchResult | None:
+        """
+        The page found by walking the sort order and testing each row until
+        the page and one more row are filled; the matches are neither all
+        found nor cached. None when an exact total is asked for and the plan
+        cannot count without matching, or when matching every row is
+        expected to read fewer rows than the walk.
+        """
+        plan = compile_query(query)
+        if (not plan.needle and not plan.filters) or query.page_size < 1:
             return None
-        try:
-            return datetime.fromisoformat(str(s).replace("Z", "+00:00"))
-        except ValueError:
+        execution = self._planner.plan(plan, candidates=False)
+        exact = execution.exact_count()
+        if query.total_mode == "exact" and exact is None:
+            return None
+        index = self._table.sort_indexes.get(query.sort_field)
+        descending = query.sort_order == "desc"
+        order = range(len(self._table)) if index is None else index.order(descending)
+
+        if query.cursor is None:
+            start, k = 0, max(query.page * query.page_size, 0) + 1
+        else:
+            cursor = decode_cursor(query)
+            if cursor is None:
+                start = 0
+            elif index is None:
+                start = self._cursor_row(cursor) + 1
+            else:
+                start = index.seek(order, self._cursor_bound(index, cursor), descending)
+            k = query.page_size + 1
+        if start + k / max(execution.selectivity(), 1 / max(len(self._table), 1)) >= execution.read_rows():
             return None
 
-    def _filter_date(self, raw: Any, operator: str, value: Any) -> bool:
-        if operator == "is_empty":
-            return raw is None
-        if operator == "is_not_empty":
-            return raw is not None
-
-        dv = self._parse_dt(raw)
-        fv = self._parse_dt(value)
-        if dv is None or (fv is None and operator != "between"):
-            return False
-
-        match operator:
-            case "before":            return dv < fv
-            case "after":             return dv > fv
-            case "before_or_equals":  return dv <= fv
-            case "after_or_equals":   return dv >= fv
-            case "equals":            return dv.date() == fv.date()
-            case "not_equals":        return dv.date() != fv.date()
-            case "between":
-                try:
-                    parts = str(value).split(",", 1)
-                    start = self._parse_dt(parts[0].strip())
-                    end   = self._parse_dt(parts[1].strip())
-                    return start <= dv <= end
-                except (IndexError, TypeError):
-                    return False
-            case _:
-                return True
-
-    @staticmethod
-    def _filter_boolean(raw: Any, operator: str, value: Any) -> bool:
-        if raw is None:
-            return False
-        bv = bool(raw)
-        fv = value is True or str(value).lower() == "true"
-        match operator:
-            case "equals":     return bv == fv
-            case "not_equals": return bv != fv
-            case _:            return True
-
-    # ── Sort key ──────────────────────────────────────────────────────────────
+        found = list(islice(filter(execution.matcher(), islice(order, start, None)), k))
+        more = len(found) == k
+        next_cursor = None
+        if query.cursor is None:
+            page = found[max((query.page - 1) * query.page_size, 0) : k - 1]
+        else:
+            page = found[: query.page_size]
+            if more:
+                next_cursor = self._next_cursor(query, index, page[-1])
+
+        if exact is not None:
+            count = SearchCount(exact)
+        elif not more and query.cursor is None:
+            count = SearchCount(len(found))  # the walk reached the end: every match was seen
+        elif query.total_mode == "estimate":
+            count = execution.estimate_count()
+            count = replace(count, total=max(count.total, len(found)))
+        else:
+            count = SearchCount(len(found), "gte")
+
+        rows = self._table.rows
+        return SearchResult(
+            data=tuple(rows[i].view for i in page),
+            total=count.total,
+            page=query.page,
+            page_size=query.page_size,
+            total_pages=max(1, -(-count.total // query.page_size)),  # ceiling division
+            next_cursor=next_cursor,
+            total_relation=count.relation,
+            total_error=count.error,
+        )
 
-    @staticmethod
-    def _sort_key(item: dict, field: str) -> tuple:
-        val = item.get(field)
-        if val is None:
-            return (1, "")       # None → sorts after non-None values
-        if isinstance(val, bool):
-            return (0, int(val))
-        if isinstance(val, (int, float)):
-            return (0, val)
-        return (0, str(val).lower())
+    # ── Keyset pagination ─────────────────────────────────────────────────────
+
+    def _cursor_page(self, result: CachedResult, query: SearchQuery) -> tuple[Sequence[int], str | None]:
+        """
+        The page right after the query's cursor, plus the cursor of the page
+        after it (None on the last page). The sort index seeks straight to the
+        cursor position, so deep pages cost the same as the first one.
+        """
+        cursor = decode_cursor(query)
+        index = self._table.sort_indexes.get(query.sort_field)
+        descending = query.sort_order == "desc"
+        k = query.page_size + 1  # one extra row tells whether another page follows
+
+        if index is None:  # unknown sort field → dataset order
+            rows = range(len(self._table)) if result.matched is None else result.matched
+            start = 0 if cursor is None else bisect_right(rows, self._cursor_row(cursor))
+            page = rows[start : start + k]
+        else:
+            bound = None if cursor is None else self._cursor_bound(index, cursor)
+            ordering = result.orderings.get((query.sort_field, descending))
+            if ordering is not None:
+                start = 0 if bound is None else index.seek(ordering, bound, descending)
+                page = ordering[start : start + k]
+            else:
+                page = index.top(result.matched, k, descending, after=bound)
+
+        if len(page) < k:
+            return page, None
+        page = page[: query.page_size]
+        return page, self._next_cursor(query, index, page[-1])
+
+    def _next_cursor(self, query: SearchQuery, index: SortIndex | None, last: int) -> str:
+        return encode_cursor(Cursor(
+            sort_field=query.sort_field,
+            sort_order=query.sort_order,
+            key=None if index is None else index.keys[index.rank[last]],
+            id=self._table.rows[last].id,
+            row=last,
+            version=self._version,
+        ))
+
+    def _cursor_row(self, cursor: Cursor) -> int:
+        """Row the cursor points at; across a reload it is looked up by id."""
+        if cursor.version == self._version:
+            return cursor.row
+        return self._table.row_of_id.get(cursor.id, cursor.row)
+
+    def _cursor_bound(self, index: SortIndex, cursor: Cursor) -> tuple[float, int]:
+        if cursor.version == self._version and 0 <= cursor.row < len(self._table):
+            return index.bound_of(cursor.row)
+        return index.bound(cursor.key, self._table.row_of_id.get(cursor.id))
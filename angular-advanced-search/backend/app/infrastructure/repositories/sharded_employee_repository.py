@@ -0,0 +1,574 @@
+"""
+Infrastructure Layer — Sharded Employee Repository
+
+Driven adapter that implements the EmployeeRepository port on several CPU
+cores. The dataset is split into contiguous row ranges (shards), and each
+shard lives in its own worker process with its own EmployeeTable, indexes
+and query planner, so one large query keeps every worker busy instead of
+one core:
+
+  - the coordinator compiles the query once (rejecting invalid ones before
+    any worker is involved) and sends it to every shard at the same time
+  - each shard matches its rows and returns its match count plus its first
+    rows in sort order, with their sort keys and global row numbers
+  - the coordinator sums the counts and k-way merges the shards' sorted
+    rows up to the end of the requested page; ties keep global row order,
+    so pages are identical to the single-process adapter's
+  - facets are counted per shard and summed, and so are value
+    suggestions: each shard lists the values of its prefix index starting
+    with the prefix, and the coordinator adds them up and keeps the most
+    frequent
+  - counts are summed too; estimated counts add their variances. Search
+    totals are always exact, whatever the query's total_mode
+
+Exports stream: each shard orders its matches once when the export opens
+and sends them a batch at a time as the coordinator's merge consumes them,
+so the coordinator never holds more than a batch per shard.
+
+An offset page makes every shard send its rows up to the end of the page,
+so deep offset pages cost more than on one process; keyset cursors only
+ask each shard for one page past the cursor.
+
+Each shard caches the rows its recent queries matched, so later pages of
+a query only merge. Shards are contiguous, so global row = shard offset + local row, and
+keyset cursors translate to a bound in every shard. The coordinator keeps
+the Employee objects to build responses; workers hold the indexes. Queries
+are exchanged with the workers one at a time, each using every shard; a
+batch of queries is sent to each shard in one message and matched there
+together, sharing the filters and text searches the queries have in common.
+
+With compact=True the coordinator and every shard keep their employees
+column-wise with repeated strings stored once (CompactRows).
+
+Worker processes are spawned, so they start from a clean interpreter even
+when the server runs threads. The constructor returns once every worker has
+built its shard.
+"""
+
+import heapq
+import itertools
+import math
+import multiprocessing
+import threading
+import weakref
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cached_property
+from itertools import islice
+from multiprocessing.connection import Connection
+from typing import Any
+
+from app.domain.entities import FIELD_ACCESSORS, Employee, FieldDefinition
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import (
+    FieldSuggestion,
+    PlanStep,
+    QueryExplanation,
+    SearchCount,
+    SearchQuery,
+    SearchResult,
+)
+from app.infrastructure.batch_planner import BatchPlanner
+from app.infrastructure.compact_rows import CompactRows
+from app.infrastructure.cursor import Cursor, decode_cursor, encode_cursor, new_version
+from app.infrastructure.employee_table import EmployeeTable
+from app.infrastructure.facets import compute_facets, validate_facets
+from app.infrastructure.indexes.sort_index import SortIndex
+from app.infrastructure.query_compiler import QueryPlan, compile_query, predicate_key
+from app.infrastructure.query_planner import QueryPlanner
+from app.infrastructure.result_cache import CachedResult, ResultCache
+from app.infrastructure.sample_data import EMPLOYEES, FIELD_DEFINITIONS
+
+# (sort key, global row) pairs of one shard, in sort order; keys are None
+# when the sort field is unknown and rows are in dataset order
+SortedRows = tuple[list[tuple] | None, list[int]]
+
+_SORT_FIELDS = frozenset(f.field for f in FIELD_DEFINITIONS)
+_EXPORT_BATCH = 1_000  # rows each shard sends at a time to iter_matching
+
+
+class ShardWorkerError(RuntimeError):
+    """A worker process exited and its shard could not answer."""
+
+
+class _Shard:
+    """One contiguous slice of the dataset, evaluated inside a worker process."""
+
+    def __init__(self, employees: list[Employee], offset: int, cache_size: int, compact: bool) -> None:
+        self._table = EmployeeTable(employees, compact)
+        self._planner = QueryPlanner(self._table)
+        self._batch_planner = BatchPlanner(self._planner)
+        self._offset = offset
+        self._cache = ResultCache(cache_size)
+        # Export id → (sort index or None, matching rows in sort order, next position)
+        self._exports: dict[int, tuple[SortIndex | None, Sequence[int], int]] = {}
+
+    def rows(self, query: SearchQuery, limit: int | None, after: tuple[tuple | None, int] | None) -> tuple[int, SortedRows]:
+        """
+        Match count, and the first `limit` matching rows (all when None) in
+        sort order, only those past the keyset position `after` — a (sort
+        key, global row) pair — when given.
+        """
+        return self._sorted_rows(self._result(query), query, limit, after)
+
+    def rows_batch(
+        self, requests: list[tuple[SearchQuery, int | None, tuple[tuple | None, int] | None]]
+    ) -> list[tuple[int, SortedRows]]:
+        """rows() of each (query, limit, after) request; the queries are matched together."""
+        results = self._results([query for query, _, _ in requests])
+        return [self._sorted_rows(result, *request) for result, request in zip(results, requests)]
+
+    def _sorted_rows(
+        self, result: CachedResult, query: SearchQuery, limit: int | None, after: tuple[tuple | None, int] | None
+    ) -> tuple[int, SortedRows]:
+        total = len(self._table) if result.matched is None else len(result.matched)
+        index = self._table.sort_indexes.get(query.sort_field)
+        offset = self._offset
+
+        if index is None:  # unknown sort field → dataset order
+            rows = range(len(self._table)) if result.matched is None else result.matched
+            if after is not None:
+                rows = rows[bisect_right(rows, after[1] - offset) :]
+            rows = rows if limit is None else rows[:limit]
+            return total, (None, [row + offset for row in rows])
+
+        descending = query.sort_order == "desc"
+        bound = None if after is None else self._bound(index, *after)
+        if limit is None and bound is None:
+            ordered = index.sort(result.matched, descending)
+        else:
+            ordered = index.top(result.matched, len(self._table) if limit is None else limit, descending, bound)
+        keys, rank = index.keys, index.rank
+        return total, ([keys[rank[row]] for row in ordered], [row + offset for row in ordered])
+
+    def open_export(self, export: int, query: SearchQuery) -> None:
+        """Order every matching row once; export_rows() then hands them out in batches."""
+        result = self._result(query)
+        index = self._table.sort_indexes.get(query.sort_field)
+        if index is None:  # unknown sort field → dataset order
+            ordered = range(len(self._table)) if result.matched is None else result.matched
+        else:
+            ordered = index.sort(result.matched, query.sort_order == "desc")
+        self._exports[export] = (index, ordered, 0)
+
+    def export_rows(self, export: int, size: int) -> SortedRows:
+        """The next `size` rows of an open export, like rows() answers them."""
+        index, ordered, start = self._exports[export]
+        rows = ordered[start : start + size]
+        self._exports[export] = (index, ordered, start + len(rows))
+        keys = None if index is None else [index.keys[index.rank[row]] for row in rows]
+        return keys, [row + self._offset for row in rows]
+
+    def close_export(self, export: int) -> None:
+        self._exports.pop(export, None)
+
+    def count(self, query: SearchQuery) -> SearchCount:
+        plan = compile_query(query)
+        key = predicate_key(query)
+        if query.total_mode == "estimate" and (plan.needle or plan.filters) and (key is None or key not in self._cache):
+            return self._planner.plan(plan, candidates=False).estimate_count()
+        result = self._result(query)
+        return SearchCount(len(self._table) if result.matched is None else len(result.matched))
+
+    def counts(self, query: SearchQuery, fields: list[str]) -> dict[str, Counter]:
+        result = self._result(query)
+        rows = range(len(self._table)) if result.matched is None else result.matched
+        return {field: Counter(map(self._table.columns[field].__getitem__, rows)) for field in fields}
+
+    def prefix_values(self, field: str, prefix: str) -> list[tuple[str, str, int]]:
+        index = self._table.prefix_indexes.get(field)
+        return [] if index is None else index.values(prefix)
+
+    def explain(self, query: SearchQuery) -> tuple[str, int]:
+        """The access path of the shard's plan and its match count."""
+        plan = compile_query(query)
+        result = self._result(query)
+        matched = len(self._table) if result.matched is None else len(result.matched)
+        if not plan.needle and not plan.filters:
+            return "scan", matched
+        return self._planner.plan(plan).source, matched
+
+    def _result(self, query: SearchQuery) -> CachedResult:
+        key = predicate_key(query)
+        cached = None if key is None else self._cache.get(key)
+        if cached is not None:
+            return cached
+        plan = compile_query(query)
+        matched = None if not plan.needle and not plan.filters else array("I", self._planner.plan(plan).run())
+        result = CachedResult(matched)
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def _results(self, queries: list[SearchQuery]) -> list[CachedResult]:
+        """
+        _result() of each query; the predicates missing from the cache are
+        planned together, so the terms they share are evaluated once.
+        """
+        keys = [predicate_key(query) for query in queries]
+        pending: dict[Any, QueryPlan] = {}
+        for position, (query, key) in enumerate(zip(queries, keys)):
+            if key is None or key not in self._cache:
+                plan = compile_query(query)
+                if plan.needle or plan.filters:
+                    pending.setdefault(position if key is None else key, plan)
+        matched = {
+            key: CachedResult(array("I", execution.run()))
+            for key, execution in zip(pending, self._batch_planner.plan(list(pending.values())))
+        }
+        for key, result in matched.items():
+            if not isinstance(key, int):
+                self._cache.put(key, result)
+        return [
+            matched.get(position if key is None else key) or self._result(query)
+            for position, (query, key) in enumerate(zip(queries, keys))
+        ]
+
+    def _bound(self, index: SortIndex, key: tuple, row: int) -> tuple[float, int]:
+        """Keyset bound in this shard for a position given by key and global row."""
+        local = row - self._offset
+        if 0 <= local < len(self._table):
+            return index.bound(key, local)
+        position, _ = index.bound(key, None)
+        if local < 0 and position == int(position):
+            return position, -1  # the row lies in an earlier shard: every row with the key follows it
+        return position, len(self._table)
+
+
+def _serve(connection: Connection, employees: list[Employee], offset: int, cache_size: int, compact: bool) -> None:
+    """Worker process loop: report the shard built, then answer (method, args) requests until None arrives."""
+    try:
+        shard = _Shard(employees, offset, cache_size, compact)
+    except Exception as error:
+        connection.send((False, error))
+        return
+    del employees
+    connection.send((True, None))
+    while (request := connection.recv()) is not None:
+        method, args = request
+        try:
+            connection.send((True, getattr(shard, method)(*args)))
+        except Exception as error:  # reported to the coordinator, which re-raises it
+            connection.send((False, error))
+
+
+def _shutdown(connections: list[Connection], processes: list[multiprocessing.Process]) -> None:
+    for connection in connections:
+        try:
+            connection.send(None)
+        except (OSError, ValueError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+
+class ShardedEmployeeRepository(EmployeeRepository):
+    """Concrete implementation evaluating queries in parallel on worker processes."""
+
+    def __init__(
+        self,
+        employees: Iterable[Employee] = EMPLOYEES,
+        shards: int | None = None,
+        cache_size: int = 32,
+        compact: bool = False,
+    ) -> None:
+        self._rows: Sequence[Employee] = CompactRows(employees) if compact else list(employees)
+        self._version = new_version()
+        self._export_ids = itertools.count()
+        count = max(1, min(shards or multiprocessing.cpu_count(), len(self._rows) or 1))
+        size = -(-len(self._rows) // count)  # ceiling division
+        self._bounds = [(lo, min(lo + size, len(self._rows))) for lo in range(0, max(len(self._rows), 1), size or 1)]
+
+        self._cache_size = cache_size
+        self._compact = compact
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+        for shard in range(len(self._bounds)):
+            connection, process = self._spawn(shard)
+            self._connections.append(connection)
+            self._processes.append(process)
+        # The lists are updated in place when a worker is replaced
+        weakref.finalize(self, _shutdown, self._connections, self._processes)
+        # Ready once every shard has built its indexes, so the first query never waits for a build
+        self._await_ready(range(len(self._bounds)))
+        self._lock = threading.Lock()
+
+    def get_field_definitions(self) -> list[FieldDefinition]:
+        return list(FIELD_DEFINITIONS)
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._connections)
+
+    # ── Public search interface ───────────────────────────────────────────────
+
+    def search(self, query: SearchQuery) -> SearchResult:
+        return self.search_batch([query])[0]
+
+    def search_batch(self, queries: Sequence[SearchQuery]) -> list[SearchResult]:
+        for query in queries:
+            compile_query(query)  # invalid queries fail here, before any shard is asked
+            validate_facets(query.facets)
+        windows = [self._window(query) for query in queries]
+        answers = self._ask("rows_batch", [(query, *window) for query, window in zip(queries, windows)])
+        return [
+            self._respond(query, [shard[i] for shard in answers])
+            for i, query in enumerate(queries)
+        ]
+
+    def count(self, query: SearchQuery) -> SearchCount:
+        compile_query(query)
+        counts = self._ask("count", query)
+        approximate = any(c.relation == "approx" for c in counts)
+        return SearchCount(
+            total=sum(c.total for c in counts),
+            relation="approx" if approximate else "eq",
+            error=math.ceil(math.sqrt(sum(c.error**2 for c in counts))),
+        )
+
+    def suggest(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        # A value's total is only known once every shard has counted it, so
+        # shards send all their values starting with prefix, not a top list
+        totals: Counter = Counter()
+        spellings: dict[str, str] = {}
+        for values in self._ask("prefix_values", field, prefix.lower()):
+            for key, spelling, count in values:
+                totals[key] += count
+                spellings[key] = min(spellings.get(key, spelling), spelling)
+        ranked = heapq.nsmallest(limit, totals.items(), key=lambda item: (-item[1], item[0]))
+        return [FieldSuggestion(spellings[key], count) for key, count in ranked]
+
+    def get_all_matching(self, query: SearchQuery) -> list[Employee]:
+        return list(self.iter_matching(query))
+
+    def iter_matching(self, query: SearchQuery) -> Iterator[Employee]:
+        return map(self._rows.__getitem__, self._export(query, _EXPORT_BATCH))
+
+    def iter_matching_columns(self, query: SearchQuery, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        return self._column_batches(self._rows, self._export(query, batch_size), batch_size)
+
+    # ── Coordination ──────────────────────────────────────────────────────────
+
+    def _ask_shard(self, shard: int, method: str, *args: Any) -> Any:
+        """
+        Send one request to one shard and return its answer. It is not
+        retried: the shard's open exports died with a worker that exited.
+        """
+        with self._lock:
+            answers, dead = self._exchange([shard], method, args)
+            if dead:
+                self._respawn(dead)
+                raise ShardWorkerError(f"Shard worker {shard} exited during {method}; it was restarted")
+        ok, value = answers[0]
+        if not ok:
+            raise value
+        return value
+
+    def _ask(self, method: str, *args: Any) -> list[Any]:
+        """
+        Send one request to every shard and collect their answers, in shard
+        order. Workers found dead are restarted and the request is sent again
+        once.
+        """
+        shards = range(len(self._connections))
+        with self._lock:
+            answers, dead = self._exchange(shards, method, args)
+            if dead:
+                self._respawn(dead)
+                answers, dead = self._exchange(shards, method, args)
+                if dead:
+                    raise ShardWorkerError(f"Shard workers {dead} exited again during {method}")
+        for ok, value in answers:
+            if not ok:
+                raise value
+        return [value for _, value in answers]
+
+    def _exchange(self, shards: Iterable[int], method: str, args: tuple) -> tuple[list[Any], list[int]]:
+        """
+        Answers of the shards that are alive, and the shards whose worker is
+        dead. Every live shard's answer is read, so no pipe is left holding
+        an answer that the next request would take for its own.
+        """
+        sent: list[int] = []
+        for shard in shards:
+            try:
+                self._connections[shard].send((method, args))
+                sent.append(shard)
+            except (OSError, ValueError):
+                pass
+        answers: dict[int, Any] = {}
+        for shard in sent:
+            try:
+                answers[shard] = self._connections[shard].recv()
+            except (EOFError, OSError):
+                pass
+        return [answers[shard] for shard in answers], [shard for shard in shards if shard not in answers]
+
+    # ── Worker processes ──────────────────────────────────────────────────────
+
+    def _spawn(self, shard: int) -> tuple[Connection, multiprocessing.Process]:
+        """Start the worker of a shard; it reports when its indexes are built."""
+        context = multiprocessing.get_context("spawn")
+        lo, hi = self._bounds[shard]
+        parent, child = context.Pipe()
+        args = (child, self._rows[lo:hi], lo, self._cache_size, self._compact)
+        process = context.Process(target=_serve, args=args, daemon=True)
+        process.start()
+        child.close()
+        return parent, process
+
+    def _await_ready(self, shards: Iterable[int]) -> None:
+        for shard in shards:
+            try:
+                ok, error = self._connections[shard].recv()
+            except (EOFError, OSError):
+                raise ShardWorkerError(f"Shard worker {shard} exited while building its shard") from None
+            if not ok:
+                raise error
+
+    def _respawn(self, shards: list[int]) -> None:
+        """Replace the workers of the given shards with new ones holding the same rows."""
+        for shard in shards:
+            self._connections[shard].close()
+            self._processes[shard].join(timeout=1)
+            self._connections[shard], self._processes[shard] = self._spawn(shard)
+        self._await_ready(shards)
+
+    def _window(self, query: SearchQuery) -> tuple[int, tuple[tuple | None, int] | None]:
+        """The rows each shard sends for the query's page: how many, and after which keyset position."""
+        if query.cursor is None:
+            return max(query.page * query.page_size, 0), None
+        cursor = decode_cursor(query)
+        if cursor is None:
+            return query.page_size + 1, None
+        return query.page_size + 1, (None if cursor.key is None else tuple(cursor.key), self._cursor_row(cursor))
+
+    def _cursor_row(self, cursor: Cursor) -> int:
+        """
+        Global row the cursor points at. A cursor issued on another dataset is
+        looked up by id; when its employee is gone, the page resumes after
+        every row with the cursor's sort key (or at its row, in dataset order).
+        """
+        if cursor.version == self._version:
+            return cursor.row
+        return self._row_of_id.get(cursor.id, cursor.row if cursor.key is None else len(self._rows))
+
+    @cached_property
+    def _row_of_id(self) -> dict[Any, int]:
+        """Row of each employee id; only built for cursors issued on another dataset."""
+        return {employee.id: row for row, employee in enumerate(self._rows)}
+
+    def _respond(self, query: SearchQuery, answers: list[tuple[int, SortedRows]]) -> SearchResult:
+        """The query's page from the shards' rows, with its facets and explanation."""
+        total, merged = self._merge(query, answers)
+        next_cursor = None
+        if query.cursor is not None:
+            page = list(merged)
+            if len(page) > query.page_size:
+                page = page[: query.page_size]
+                key, row = page[-1]
+                next_cursor = encode_cursor(Cursor(
+                    sort_field=query.sort_field,
+                    sort_order=query.sort_order,
+                    key=key,
+                    id=self._rows[row].id,
+                    row=row,
+                    version=self._version,
+                ))
+        else:
+            start = max((query.page - 1) * query.page_size, 0)
+            end = max(query.page * query.page_size, 0)
+            page = list(islice(merged, start, end))
+
+        rows = self._rows
+        return SearchResult(
+            data=tuple(rows[row].view for _, row in page),
+            total=total,
+            page=query.page,
+            page_size=query.page_size,
+            total_pages=max(1, -(-total // query.page_size)),  # ceiling division
+            next_cursor=next_cursor,
+            facets=self._facets(query) if query.facets else (),
+            explanation=self._explain(query, total) if query.explain else None,
+        )
+
+    @classmethod
+    def _merge(
+        cls, query: SearchQuery, answers: list[tuple[int, SortedRows]]
+    ) -> tuple[int, Iterator[tuple[tuple | None, int]]]:
+        """Total match count, and (sort key, global row) pairs of every shard merged in sort order."""
+        total = sum(count for count, _ in answers)
+        return total, cls._merge_streams(query, [cls._pairs(rows) for _, rows in answers])
+
+    @staticmethod
+    def _pairs(sorted_rows: SortedRows) -> Iterator[tuple[tuple | None, int]]:
+        keys, rows = sorted_rows
+        return zip(keys, rows) if keys is not None else ((None, row) for row in rows)
+
+    @staticmethod
+    def _merge_streams(
+        query: SearchQuery, streams: list[Iterator[tuple[tuple | None, int]]]
+    ) -> Iterator[tuple[tuple | None, int]]:
+        if query.sort_field not in _SORT_FIELDS:  # unknown sort field → global row order
+            return heapq.merge(*streams, key=lambda item: item[1])
+        if query.sort_order == "desc":  # keys descending, ties by ascending row
+            return heapq.merge(*streams, key=lambda item: (item[0], -item[1]), reverse=True)
+        return heapq.merge(*streams)
+
+    # ── Streaming exports ─────────────────────────────────────────────────────
+
+    def _export(self, query: SearchQuery, batch_size: int) -> Iterator[int]:
+        """
+        Global rows of every match in sort order. Each shard orders its
+        matches when the export opens, here, and then sends them batch_size
+        at a time as the merge consumes them, so the coordinator only ever
+        holds a batch per shard.
+        """
+        compile_query(query)
+        export = next(self._export_ids)
+        self._ask("open_export", export, query)
+        return self._exported_rows(query, export, batch_size)
+
+    def _exported_rows(self, query: SearchQuery, export: int, batch_size: int) -> Iterator[int]:
+        try:
+            streams = [self._shard_batches(shard, export, batch_size) for shard in range(len(self._connections))]
+            for _, row in self._merge_streams(query, streams):
+                yield row
+        finally:
+            try:
+                self._ask("close_export", export)
+            except (OSError, EOFError):  # the workers are already gone
+                pass
+
+    def _shard_batches(self, shard: int, export: int, batch_size: int) -> Iterator[tuple[tuple | None, int]]:
+        while True:
+            keys, rows = self._ask_shard(shard, "export_rows", export, batch_size)
+            yield from self._pairs((keys, rows))
+            if len(rows) < batch_size:
+                return
+
+    def _facets(self, query: SearchQuery):
+        fields = list(dict.fromkeys(f.field for f in query.facets))
+        totals: dict[str, Counter] = {field: Counter() for field in fields}
+        for counts in self._ask("counts", query, fields):
+            for field, counter in counts.items():
+                totals[field].update(counter)
+        return compute_facets(query.facets, totals.__getitem__)
+
+    def _explain(self, query: SearchQuery, matched_rows: int) -> QueryExplanation:
+        steps = tuple(
+            PlanStep(source, f"shard {i}: rows {lo}-{hi - 1}", matched)
+            for i, ((lo, hi), (source, matched)) in enumerate(zip(self._bounds, self._ask("explain", query)))
+        )
+        return QueryExplanation(compile_query(query).combinator, steps, matched_rows)
+
+    @staticmethod
+    def _column_batches(
+        employees: Sequence[Employee], rows: Iterator[int], batch_size: int
+    ) -> Iterator[dict[str, list[Any]]]:
+        while batch := list(map(employees.__getitem__, islice(rows, batch_size))):
+            yield {field: list(map(get, batch)) for field, get in FIELD_ACCESSORS.items()}
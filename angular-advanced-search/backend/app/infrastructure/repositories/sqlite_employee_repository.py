@@ -0,0 +1,595 @@
+"""
+Infrastructure Layer — SQLite Employee Repository
+
+Driven adapter that implements the EmployeeRepository port on SQLite, so the
+dataset can live in a database file that survives restarts and does not have
+to fit in memory. Every SearchQuery becomes one parameterized SQL statement
+(plus a COUNT over the same WHERE clause for the total, skipped when the
+query's total_mode is 'none'):
+
+  - filters are translated from the compiled plan (query_compiler) into
+    conditions over columns that hold exactly what the in-memory predicates
+    compare: a lower-cased copy of every string field, and the epoch
+    microseconds and day ordinal of every date field
+  - the text search finds candidate rows in an FTS5 trigram table over the
+    same lower-cased values the in-memory trigram index searches, then
+    confirms them with instr()
+  - ORDER BY places None values and breaks ties exactly like the in-memory
+    sort index; pages are LIMIT / OFFSET, or a keyset seek in cursor mode
+
+Value suggestions group the lower-cased column over the same index range
+a starts_with filter reads.
+
+Loading a dataset writes it to a new database, whose connection then
+replaces the current one, so queries running meanwhile are unaffected.
+
+Every filterable column has a B-tree index. Results match
+InMemoryEmployeeRepository exactly; benchmarks/conformance.py checks this.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import fields
+from itertools import chain, islice
+from typing import Any
+
+from app.domain.entities import EMPLOYEE_FIELDS, Employee, FieldDefinition
+from app.domain.exceptions import InvalidQueryError
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import (
+    FacetResult,
+    FieldSuggestion,
+    PlanStep,
+    QueryExplanation,
+    SearchCount,
+    SearchQuery,
+    SearchResult,
+)
+from app.infrastructure.cursor import Cursor, decode_cursor, encode_cursor, new_version
+from app.infrastructure.dates import epoch_us, parse_datetime
+from app.infrastructure.facets import compute_facets
+from app.infrastructure.query_compiler import CompiledFilter, QueryPlan, compile_query
+from app.infrastructure.sample_data import EMPLOYEES, FIELD_DEFINITIONS
+
+_FIELD_TYPES: dict[str, str] = {f.field: f.type for f in FIELD_DEFINITIONS}
+
+# Employee attributes in constructor order; each is stored in a column of the same name
+_ATTRIBUTES: list[str] = [f.name for f in fields(Employee)]
+_BOOLEAN_ATTRIBUTES = frozenset(EMPLOYEE_FIELDS[f.field] for f in FIELD_DEFINITIONS if f.type == "boolean")
+_SELECT = ", ".join(["row"] + _ATTRIBUTES)
+
+# Characters str.strip() removes — what "is_empty" treats as blank
+_WHITESPACE = "".join(chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace())
+
+_INSERT_BATCH = 10_000
+_FETCH_BATCH = 1_000  # rows fetched at a time by iter_matching
+_LAST_ROW = 2**63 - 1  # greater than every row number
+
+# Filters and sorts read derived columns for strings and dates
+def _lower(attr: str) -> str:
+    return f"{attr}_lc"
+
+
+def _instant(attr: str) -> str:
+    return f"{attr}_instant"
+
+
+def _day(attr: str) -> str:
+    return f"{attr}_day"
+
+
+def _schema() -> tuple[list[str], dict[str, str]]:
+    """Statements creating the tables, and the B-tree index on every filterable column by name."""
+    # Raw value columns are declared without a type: SQLite then keeps every
+    # value as given (75000 stays an int, 88.0 stays a float).
+    columns = ["row INTEGER PRIMARY KEY"] + _ATTRIBUTES
+    indexed: list[str] = []
+    for f in FIELD_DEFINITIONS:
+        attr = EMPLOYEE_FIELDS[f.field]
+        match f.type:
+            case "string":
+                columns.append(f"{_lower(attr)} TEXT")
+                indexed.append(_lower(attr))
+            case "date":
+                columns += [f"{_instant(attr)} INTEGER", f"{_day(attr)} INTEGER"]
+                indexed += [_instant(attr), _day(attr)]
+            case _:
+                indexed.append(attr)
+
+    tables = [
+        f"CREATE TABLE IF NOT EXISTS employees ({', '.join(columns)})",
+        # One FTS column per value, holding Employee.search_text; lower-cased
+        # already, so the tokenizer must not fold case on its own
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS employees_text USING fts5("
+        f"{', '.join(EMPLOYEE_FIELDS.values())}, tokenize='trigram case_sensitive 1')",
+    ]
+    indexes = {f"employees_{c}": f"CREATE INDEX IF NOT EXISTS employees_{c} ON employees({c})" for c in indexed}
+    return tables, indexes
+
+
+_TABLES, _INDEXES = _schema()
+
+
+class _Database:
+    """
+    One SQLite connection and the lock serialising its use. Requests run on
+    FastAPI's thread pool, and exports fetch their rows from the thread
+    consuming the response, so every statement, and every fetch from a
+    statement still returning rows, holds the lock. The version stamped into
+    cursors is the connection's: a new connection may hold another dataset.
+    """
+
+    def __init__(self, database: str) -> None:
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.version = new_version()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> list[tuple]:
+        """Every row the statement returns."""
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def stream(self, sql: str, params: Sequence[Any], size: int) -> Iterator[list[tuple]]:
+        """
+        The rows in batches of at most size. The statement runs now; the lock
+        is then held only while each batch is fetched, so other queries
+        proceed between the batches of a long export.
+        """
+        with self.lock:
+            cursor = self.connection.execute(sql, params)
+
+        def batches() -> Iterator[list[tuple]]:
+            while True:
+                with self.lock:
+                    batch = cursor.fetchmany(size)
+                if not batch:
+                    return
+                yield batch
+
+        return batches()
+
+
+class SqliteEmployeeRepository(EmployeeRepository):
+    """
+    Concrete implementation backed by an SQLite database.
+
+    employees, when given, replaces the stored dataset; an empty database is
+    seeded with the sample data. database is a file path, or ":memory:" for a
+    private in-memory database.
+
+    Each request reads the connection once, so a load swapping in another
+    database never shows one request two datasets.
+    """
+
+    def __init__(self, employees: Iterable[Employee] | None = None, database: str = ":memory:") -> None:
+        self._database = database
+        if employees is not None:
+            self.load(employees)
+            return
+        self._db = self._open(database)
+        if self._db.execute("SELECT NOT EXISTS (SELECT 1 FROM employees)")[0][0]:
+            self.load(EMPLOYEES)
+
+    def get_field_definitions(self) -> list[FieldDefinition]:
+        return list(FIELD_DEFINITIONS)
+
+    # ── Dataset management ────────────────────────────────────────────────────
+
+    def load(self, employees: Iterable[Employee]) -> None:
+        """
+        Replace the stored dataset; rows keep the order of the iterable.
+
+        The rows are written to a new database: a new in-memory one, or a new
+        file next to the database file, renamed over it once complete. Its
+        connection then replaces the current one in one step. Queries already
+        running, exports included, finish on the previous dataset (an open
+        connection keeps reading the file it opened), and no query sees a
+        dataset half written.
+        """
+        if self._database == ":memory:":
+            self._db = self._fill(_Database(":memory:"), employees)
+            return
+        staging = f"{self._database}.loading"
+        for leftover in (staging, f"{staging}-journal"):  # from a load that was interrupted
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        self._fill(_Database(staging), employees).connection.close()
+        os.replace(staging, self._database)
+        self._db = self._open(self._database)
+
+    @staticmethod
+    def _open(database: str) -> _Database:
+        """A connection to the database, its tables and indexes created when missing."""
+        db = _Database(database)
+        for statement in _TABLES + list(_INDEXES.values()):
+            db.execute(statement)
+        return db
+
+    @classmethod
+    def _fill(cls, db: _Database, employees: Iterable[Employee]) -> _Database:
+        """
+        Store the employees in a new, empty database. The indexes are created
+        after the bulk insert, which is faster than maintaining them row by row.
+        """
+        columns = ["row"] + _ATTRIBUTES
+        for f in FIELD_DEFINITIONS:
+            attr = EMPLOYEE_FIELDS[f.field]
+            if f.type == "string":
+                columns.append(_lower(attr))
+            elif f.type == "date":
+                columns += [_instant(attr), _day(attr)]
+        insert_row = f"INSERT INTO employees ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        insert_text = (
+            f"INSERT INTO employees_text (rowid, {', '.join(EMPLOYEE_FIELDS.values())}) "
+            f"VALUES ({', '.join('?' * (len(EMPLOYEE_FIELDS) + 1))})"
+        )
+
+        connection = db.connection
+        with db.lock:
+            with connection:
+                for statement in _TABLES:
+                    connection.execute(statement)
+                numbered = enumerate(employees)
+                while batch := list(islice(numbered, _INSERT_BATCH)):
+                    connection.executemany(insert_row, [cls._record(row, e) for row, e in batch])
+                    connection.executemany(insert_text, [(row, *e.search_text) for row, e in batch])
+                for statement in _INDEXES.values():
+                    connection.execute(statement)
+            connection.execute("ANALYZE")
+        return db
+
+    @staticmethod
+    def _record(row: int, employee: Employee) -> tuple:
+        values: list[Any] = [row] + [getattr(employee, attr) for attr in _ATTRIBUTES]
+        for f in FIELD_DEFINITIONS:
+            raw = employee.get(f.field)
+            if f.type == "string":
+                values.append(None if raw is None else str(raw).lower())
+            elif f.type == "date":
+                dt = parse_datetime(raw)
+                values += [epoch_us(dt), dt.date().toordinal()] if dt else [None, None]
+        return tuple(values)
+
+    # ── Public search interface ───────────────────────────────────────────────
+
+    def search(self, query: SearchQuery) -> SearchResult:
+        db = self._db
+        where, params = self._where(compile_query(query))
+        # totalMode 'none' skips the COUNT; an estimate costs about as much as the count
+        exact = query.total_mode != "none" or query.explain
+        total = self._count_where(db, where, params) if exact else None
+
+        order_by, sort_key = self._order_by(query)
+        next_cursor = None
+        if query.cursor is not None:
+            seek, seek_params = self._seek(db, query)
+            limit = query.page_size + 1  # one extra row tells whether another page follows
+            sql = f"SELECT {_SELECT}, {sort_key} FROM employees WHERE ({where}) AND ({seek}) ORDER BY {order_by} LIMIT ?"
+            records = db.execute(sql, params + seek_params + [limit])
+            count = SearchCount(len(records), "gte")
+            if len(records) > query.page_size:
+                records = records[: query.page_size]
+                next_cursor = self._cursor_after(db, records[-1], query)
+        else:
+            start = max((query.page - 1) * query.page_size, 0)
+            end = max(query.page * query.page_size, 0)
+            extra = int(total is None)  # without a count, one extra row tells whether more follow
+            sql = f"SELECT {_SELECT}, {sort_key} FROM employees WHERE {where} ORDER BY {order_by} LIMIT ? OFFSET ?"
+            records = db.execute(sql, params + [end - start + extra, start]) if end > start else []
+            more = len(records) > end - start
+            records = records[: end - start]
+            # Rows were skipped by OFFSET only if the page is not empty
+            seen = (start if records else 0) + len(records) + more
+            count = SearchCount(seen, "gte" if more or (start and not records) else "eq")
+        if total is not None:
+            count = SearchCount(total)
+
+        return SearchResult(
+            data=tuple(self._employee(r).view for r in records),
+            total=count.total,
+            page=query.page,
+            page_size=query.page_size,
+            total_pages=max(1, -(-count.total // query.page_size)),  # ceiling division
+            next_cursor=next_cursor,
+            facets=self._facets(db, query, where, params),
+            explanation=self._explain(db, query, count.total, where, params) if query.explain else None,
+            total_relation=count.relation,
+        )
+
+    def count(self, query: SearchQuery) -> SearchCount:
+        where, params = self._where(compile_query(query))
+        return SearchCount(self._count_where(self._db, where, params))
+
+    def suggest(self, field: str, prefix: str, limit: int) -> list[FieldSuggestion]:
+        if _FIELD_TYPES.get(field) != "string":
+            return []
+        attr = EMPLOYEE_FIELDS[field]
+        lc = _lower(attr)
+        where, params = self._string_condition(attr, "starts_with", prefix.lower())
+        sql = (
+            f"SELECT MIN({attr}), COUNT(*) FROM employees WHERE ({where}) AND {lc} <> '' "
+            f"GROUP BY {lc} ORDER BY COUNT(*) DESC, {lc} LIMIT ?"
+        )
+        return [FieldSuggestion(value, count) for value, count in self._db.execute(sql, params + [limit])]
+
+    def get_all_matching(self, query: SearchQuery) -> list[Employee]:
+        return list(self.iter_matching(query))
+
+    def iter_matching(self, query: SearchQuery) -> Iterator[Employee]:
+        return map(self._employee, chain.from_iterable(self._select_all(query, _FETCH_BATCH)))
+
+    def iter_matching_columns(self, query: SearchQuery, batch_size: int) -> Iterator[dict[str, list[Any]]]:
+        return self._column_batches(self._select_all(query, batch_size))
+
+    # ── Reading rows ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _count_where(db: _Database, where: str, params: list[Any]) -> int:
+        return db.execute(f"SELECT COUNT(*) FROM employees WHERE {where}", params)[0][0]
+
+    def _select_all(self, query: SearchQuery, batch_size: int) -> Iterator[list[tuple]]:
+        """Every matching record in sort order, in batches of at most batch_size."""
+        where, params = self._where(compile_query(query))
+        order_by, _ = self._order_by(query)
+        sql = f"SELECT {_SELECT} FROM employees WHERE {where} ORDER BY {order_by}"
+        return self._db.stream(sql, params, batch_size)
+
+    @staticmethod
+    def _employee(record: tuple) -> Employee:
+        values = dict(zip(_ATTRIBUTES, record[1:]))
+        for attr in _BOOLEAN_ATTRIBUTES:
+            if values[attr] is not None:
+                values[attr] = bool(values[attr])
+        return Employee(**values)
+
+    @staticmethod
+    def _column_batches(batches: Iterator[list[tuple]]) -> Iterator[dict[str, list[Any]]]:
+        for batch in batches:
+            columns = list(zip(*batch))
+            yield {
+                field: [None if v is None else bool(v) for v in columns[i + 1]]
+                if attr in _BOOLEAN_ATTRIBUTES
+                else list(columns[i + 1])
+                for i, (field, attr) in enumerate((f, EMPLOYEE_FIELDS[f]) for f in EMPLOYEE_FIELDS)
+            }
+
+    # ── SQL translation ───────────────────────────────────────────────────────
+
+    def _where(self, plan: QueryPlan) -> tuple[str, list[Any]]:
+        """WHERE clause (never empty) and its parameters for the query's predicate part."""
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        # 1. Full-text search across all string-serialisable values
+        if plan.needle:
+            sql, values = self._text_condition(plan.needle)
+            conditions.append(sql)
+            params += values
+
+        # 2. Attribute filters combined with AND / OR
+        if plan.filters:
+            translated = [self._filter_condition(f) for f in plan.filters]
+            joiner = " AND " if plan.combinator == "and" else " OR "
+            conditions.append("(" + joiner.join(f"({sql})" for sql, _ in translated) + ")")
+            for _, values in translated:
+                params += values
+
+        return (" AND ".join(conditions) or "1"), params
+
+    @staticmethod
+    def _text_condition(needle: str) -> tuple[str, list[Any]]:
+        checks = " OR ".join(f"instr({attr}, ?) > 0" for attr in EMPLOYEE_FIELDS.values())
+        params: list[Any] = [needle] * len(EMPLOYEE_FIELDS)
+        if len(needle) < 3:  # too short to carry a trigram: check every row
+            return f"row IN (SELECT rowid FROM employees_text WHERE {checks})", params
+        phrase = '"' + needle.replace('"', '""') + '"'
+        return f"row IN (SELECT rowid FROM employees_text WHERE employees_text MATCH ? AND ({checks}))", [phrase] + params
+
+    def _filter_condition(self, f: CompiledFilter) -> tuple[str, list[Any]]:
+        if f.type is None:
+            return "0", []
+        attr = EMPLOYEE_FIELDS[f.field]
+        match f.type:
+            case "string":
+                return self._string_condition(attr, f.operator, f.operand)
+            case "number":
+                return self._number_condition(attr, f.operator, f.operand)
+            case "date":
+                return self._date_condition(attr, f.operator, f.operand)
+            case "boolean":
+                return self._boolean_condition(attr, f.operator, f.operand)
+            case _:
+                return f"{attr} IS NOT NULL", []
+
+    # ── Per-type SQL translation ──────────────────────────────────────────────
+    # Operands arrive pre-parsed from the query compiler. Comparisons with a
+    # NULL column are never true, which matches the in-memory "raw is not
+    # None and ..." predicates.
+
+    @staticmethod
+    def _string_condition(attr: str, operator: str, fv: str) -> tuple[str, list[Any]]:
+        lc = _lower(attr)
+        match operator:
+            case "is_empty":
+                return f"{attr} IS NULL OR trim({attr}, ?) = ''", [_WHITESPACE]
+            case "is_not_empty":
+                return f"{attr} IS NOT NULL AND trim({attr}, ?) <> ''", [_WHITESPACE]
+            case "contains" | "starts_with" | "ends_with" if fv == "":
+                return f"{attr} IS NOT NULL", []
+            case "contains":
+                return f"instr({lc}, ?) > 0", [fv]
+            case "not_contains":
+                return (f"instr({lc}, ?) = 0", [fv]) if fv else ("0", [])
+            case "equals":
+                return f"{lc} = ?", [fv]
+            case "not_equals":
+                return f"{lc} <> ?", [fv]
+            case "starts_with":
+                last = ord(fv[-1])
+                if last < 0x10FFFF:  # an index range: every string from fv up to its successor
+                    return f"{lc} >= ? AND {lc} < ?", [fv, fv[:-1] + chr(last + 1)]
+                return f"substr({lc}, 1, ?) = ?", [len(fv), fv]
+            case "ends_with":
+                return f"substr({lc}, -?) = ?", [len(fv), fv]
+            case _:
+                return f"{attr} IS NOT NULL", []
+
+    @staticmethod
+    def _number_condition(attr: str, operator: str, operand: Any) -> tuple[str, list[Any]]:
+        match operator:
+            case "is_empty":
+                return f"{attr} IS NULL", []
+            case "is_not_empty":
+                return f"{attr} IS NOT NULL", []
+            case "between":
+                lo, hi = operand
+                if lo != lo or hi != hi:  # NaN bound: no value compares true
+                    return "0", []
+                return f"{attr} BETWEEN ? AND ?", [lo, hi]
+            case "equals" | "not_equals" | "greater_than" | "greater_than_or_equal" | "less_than" | "less_than_or_equal":
+                if operand != operand:  # NaN binds as NULL; only != holds for every value
+                    return (f"{attr} IS NOT NULL", []) if operator == "not_equals" else ("0", [])
+                return f"{attr} {_COMPARISONS[operator]} ?", [operand]
+            case _:
+                return f"{attr} IS NOT NULL", []
+
+    @staticmethod
+    def _date_condition(attr: str, operator: str, operand: Any) -> tuple[str, list[Any]]:
+        instant = _instant(attr)
+        match operator:
+            case "is_empty":
+                return f"{attr} IS NULL", []
+            case "is_not_empty":
+                return f"{attr} IS NOT NULL", []
+            case "between":
+                return f"{instant} BETWEEN ? AND ?", list(operand)
+            case "equals":
+                return f"{_day(attr)} = ?", [operand]
+            case "not_equals":
+                return f"{_day(attr)} <> ?", [operand]
+            case "before" | "after" | "before_or_equals" | "after_or_equals":
+                return f"{instant} {_COMPARISONS[operator]} ?", [operand]
+            case _:
+                return f"{instant} IS NOT NULL", []
+
+    @staticmethod
+    def _boolean_condition(attr: str, operator: str, fv: bool) -> tuple[str, list[Any]]:
+        match operator:
+            case "equals":
+                return f"{attr} = ?", [int(fv)]
+            case "not_equals":
+                return f"{attr} <> ?", [int(fv)]
+            case _:
+                return f"{attr} IS NOT NULL", []
+
+    # ── Sort and keyset pagination ────────────────────────────────────────────
+
+    @staticmethod
+    def _sort_column(field: str) -> str | None:
+        attr = EMPLOYEE_FIELDS.get(field)
+        match _FIELD_TYPES.get(field):
+            case "string":
+                return _lower(attr)
+            case "date":
+                return _instant(attr)
+            case None:
+                return None
+            case _:
+                return attr
+
+    def _order_by(self, query: SearchQuery) -> tuple[str, str]:
+        """
+        ORDER BY clause and the (null flag, value) sort key expressions. None
+        sorts last ascending and first descending; ties keep dataset order in
+        both directions, like the in-memory sort index.
+        """
+        column = self._sort_column(query.sort_field)
+        if column is None:  # unknown sort field → dataset order
+            return "row", "NULL, NULL"
+        key = f"{column} IS NULL, IFNULL({column}, '')"
+        if query.sort_order == "desc":
+            return f"{column} IS NULL DESC, {column} DESC, row", key
+        return f"{column} IS NULL, {column}, row", key
+
+    def _seek(self, db: _Database, query: SearchQuery) -> tuple[str, list[Any]]:
+        """Condition selecting the rows after the query's cursor in sort order."""
+        cursor = decode_cursor(query)
+        if cursor is None:
+            return "1", []
+        column = self._sort_column(query.sort_field)
+        row = self._cursor_row(db, cursor, column is None)
+        if column is None:
+            return "row > ?", [row]
+        if cursor.key is None or len(cursor.key) != 2:
+            raise InvalidQueryError("Malformed pagination cursor")
+
+        flag, value = cursor.key
+        null, key = f"({column} IS NULL)", f"IFNULL({column}, '')"
+        after = "<" if query.sort_order == "desc" else ">"
+        sql = f"{null} {after} ? OR ({null} = ? AND ({key} {after} ? OR ({key} = ? AND row > ?)))"
+        return sql, [flag, flag, value, value, row]
+
+    @staticmethod
+    def _cursor_row(db: _Database, cursor: Cursor, dataset_order: bool) -> int:
+        """
+        Row the cursor points at. A cursor issued on another dataset is looked
+        up by id; when its employee is gone, the page resumes after every row
+        with the cursor's sort key (or at its row, in dataset order).
+        """
+        if cursor.version == db.version:
+            return cursor.row
+        found = db.execute("SELECT row FROM employees WHERE id = ? ORDER BY row LIMIT 1", [cursor.id])
+        if found:
+            return found[0][0]
+        return cursor.row if dataset_order else _LAST_ROW
+
+    @staticmethod
+    def _cursor_after(db: _Database, record: tuple, query: SearchQuery) -> str:
+        null, value = record[-2], record[-1]
+        key = None if null is None else (int(null), value)
+        return encode_cursor(Cursor(
+            sort_field=query.sort_field,
+            sort_order=query.sort_order,
+            key=key,
+            id=record[1],
+            row=record[0],
+            version=db.version,
+        ))
+
+    # ── Facets and explain ────────────────────────────────────────────────────
+
+    @staticmethod
+    def _facets(db: _Database, query: SearchQuery, where: str, params: list[Any]) -> tuple[FacetResult, ...]:
+        def count_values(field: str) -> dict[Any, int]:
+            attr = EMPLOYEE_FIELDS[field]
+            sql = f"SELECT {attr}, COUNT(*) FROM employees WHERE {where} GROUP BY {attr}"
+            counts = db.execute(sql, params)
+            if attr in _BOOLEAN_ATTRIBUTES:
+                return {None if v is None else bool(v): n for v, n in counts}
+            return dict(counts)
+
+        return compute_facets(query.facets, count_values)
+
+    def _explain(self, db: _Database, query: SearchQuery, matched_rows: int, where: str, params: list[Any]) -> QueryExplanation:
+        """SQLite's own plan for the page query; it publishes no row estimates."""
+        order_by, _ = self._order_by(query)
+        sql = f"EXPLAIN QUERY PLAN SELECT {_SELECT} FROM employees WHERE {where} ORDER BY {order_by}"
+        steps = tuple(PlanStep("sqlite", detail, None) for _, _, _, detail in db.execute(sql, params))
+        return QueryExplanation(compile_query(query).combinator, steps, matched_rows)
+
+
+_COMPARISONS = {
+    "equals": "=",
+    "not_equals": "<>",
+    "greater_than": ">",
+    "greater_than_or_equal": ">=",
+    "less_than": "<",
+    "less_than_or_equal": "<=",
+    "before": "<",
+    "after": ">",
+    "before_or_equals": "<=",
+    "after_or_equals": ">=",
+}
@@ -0,0 +1,84 @@
+"""
+Infrastructure Layer — Result Cache
+
+LRU cache of search results shared across requests. The Angular grid pages
+through a result set by re-posting the same query with another page, and
+the CSV export re-posts it once more; all of them can be served from the
+rows matched by the first request.
+
+Entries are keyed on the dataset version plus the predicate part of the
+query (text, filters, combinator) — never on page or page size. Each entry
+holds the matched row numbers and, once a caller needed more than the first
+page, the full ordering for every sort that was requested, plus every facet
+computed over those rows and the plan that matched them. Bumping the
+dataset version makes every older entry unreachable.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+from app.domain.value_objects import FacetResult, QueryExplanation, SearchFacet
+
+
+@dataclass
+class CachedResult:
+    """Row numbers matching one query; None means every row."""
+
+    matched: array | None
+    # (sort field, descending) → every matched row in that order
+    orderings: dict[tuple[str, bool], array] = field(default_factory=dict)
+    facets: dict[SearchFacet, FacetResult] = field(default_factory=dict)
+    explanation: QueryExplanation | None = None  # how the rows were matched
+
+    @property
+    def total(self) -> int | None:
+        return None if self.matched is None else len(self.matched)
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> CachedResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Membership test that neither refreshes the entry nor counts as a hit."""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: Hashable, entry: CachedResult) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+            }
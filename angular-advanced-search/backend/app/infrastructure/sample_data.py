@@ -3,8 +3,8 @@ Infrastructure Layer — Sample Data
 
 30 employee records used by the in-memory repository.
 Adding a new record: append an Employee instance to EMPLOYEES.
-Adding a new field: add the attribute to Employee (domain), update to_dict(),
-and add a FieldDefinition below.
+Adding a new field: add the attribute to Employee (domain), map it in
+EMPLOYEE_FIELDS, and add a FieldDefinition below.
 """
 
 from app.domain.entities import Employee, FieldDefinition
@@ -8,6 +8,7 @@ under the /api prefix.
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.exposition.routers.admin_router import router as admin_router
 from app.exposition.routers.fields_router import router as fields_router
 from app.exposition.routers.search_router import router as search_router
 
@@ -26,3 +27,4 @@ app.add_middleware(
 
 app.include_router(fields_router, prefix="/api", tags=["Fields"])
 app.include_router(search_router, prefix="/api", tags=["Search"])
+app.include_router(admin_router, prefix="/api", tags=["Admin"])
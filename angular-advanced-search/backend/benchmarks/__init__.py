@@ -0,0 +1,6 @@
+"""
+Stand-alone performance benchmarks and checks for the backend.
+
+Each module is a script run from the backend folder, e.g.
+    python -m benchmarks.export_formats --rows 200000
+"""
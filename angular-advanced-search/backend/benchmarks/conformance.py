@@ -0,0 +1,280 @@
+"""
+Conformance — Repository Adapters
+
+Runs the same randomly generated queries against InMemoryEmployeeRepository
+(the reference) and every other adapter, the in-memory one in compact
+storage mode included, over a dataset built to exercise the edge cases:
+None values, unparseable dates, mixed int / float numbers, blank strings,
+duplicate ids and case variants. Every operator of every
+field type is drawn, with AND and OR combinators, the full-text search,
+every sort field in both directions, offset pages, cursor walks and facets.
+
+Queries are also sent in batches of variants of one query (a filter more
+or less, another text, sort or page; some with explain set), to every
+adapter and to a fresh in-memory repository, and each batch result must
+equal the reference's single search, the explanation's matched row count
+included.
+
+Value suggestions are drawn too: a string field, a prefix (often the start
+of an existing value, in any case) and a limit.
+
+Any difference in page data, totals, counts, facets, full result order,
+cursor walk, batch result or suggestions is reported and the script exits
+with status 1.
+
+    python -m benchmarks.conformance --rows 500 --queries 1000 --seed 7
+"""
+
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+
+from app.domain.entities import Employee
+from app.domain.exceptions import InvalidQueryError
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchFacet, SearchFilter, SearchQuery, SearchResult
+from app.infrastructure.repositories.columnar_employee_repository import ColumnarEmployeeRepository
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from app.infrastructure.repositories.sharded_employee_repository import ShardedEmployeeRepository
+from app.infrastructure.repositories.sqlite_employee_repository import SqliteEmployeeRepository
+from app.infrastructure.sample_data import EMPLOYEES, FIELD_DEFINITIONS
+
+_ADAPTERS: dict[str, Callable[..., EmployeeRepository]] = {
+    "columnar": ColumnarEmployeeRepository,
+    "compact": lambda employees: InMemoryEmployeeRepository(employees, compact=True),
+    "sharded": lambda employees: ShardedEmployeeRepository(employees, shards=3),  # several shards even on one core
+    "sqlite": SqliteEmployeeRepository,
+}
+
+_OPERATORS = {
+    "string": ["contains", "not_contains", "equals", "not_equals", "starts_with", "ends_with",
+               "is_empty", "is_not_empty", "unknown"],
+    "number": ["equals", "not_equals", "greater_than", "greater_than_or_equal", "less_than",
+               "less_than_or_equal", "between", "is_empty", "is_not_empty", "unknown"],
+    "date": ["before", "after", "equals", "not_equals", "before_or_equals", "after_or_equals",
+             "between", "is_empty", "is_not_empty", "unknown"],
+    "boolean": ["equals", "not_equals", "unknown"],
+}
+_WORDS = "alpha beta gamma delta senior dev ops cloud Data ENGINEER manager lead".split()
+_STRINGS = ["eng", "Engineering", "a", "", " ", "active", "user1", "senior", "LEAD", "gamma delta", "ß"]
+_TEXTS = ["", "", "", "eng", "a", "gamma", "  ", "user1", "true", "none", "2023", "ALPHA b", "@example"]
+_FACET_FIELDS = ["department", "status", "isActive", "isVerified", "age", "salary", "score"]
+_STRING_FIELDS = [f.field for f in FIELD_DEFINITIONS if f.type == "string"]
+
+
+class Generator:
+    def __init__(self, seed: int) -> None:
+        self.random = random.Random(seed)
+
+    def date(self) -> str:
+        r = self.random
+        zone = r.choice(["Z", "Z", "+02:00", "-05:00"])
+        return f"{r.randint(1970, 2025):04d}-{r.randint(1, 12):02d}-{r.randint(1, 28):02d}T{r.randint(0, 23):02d}:{r.randint(0, 59):02d}:00{zone}"
+
+    def maybe(self, value: Any, none_share: float = 0.05) -> Any:
+        return None if self.random.random() < none_share else value
+
+    def employees(self, rows: int) -> list[Employee]:
+        r = self.random
+        out = list(EMPLOYEES)
+        for i in range(len(out) + 1, len(out) + 1 + rows):
+            out.append(Employee(
+                id=i if r.random() > 0.02 else r.randint(1, 30),
+                name=self.maybe(" ".join(r.choice(_WORDS).title() for _ in range(2))),
+                email=f"user{i}@example.com",
+                age=self.maybe(r.randint(20, 65)),
+                salary=self.maybe(r.choice([r.randint(30, 150) * 1000, r.random() * 100_000, 75000, 75000.0])),
+                score=self.maybe(round(r.uniform(50, 100), 1)),
+                status=self.maybe(r.choice(["active", "inactive", "pending", "Active"])),
+                department=self.maybe(r.choice(["Engineering", "HR", "Sales", "engineering", "Design", "", "  "])),
+                description=" ".join(r.choice(_WORDS) for _ in range(r.randint(0, 6))),
+                is_active=self.maybe(r.random() > 0.3),
+                is_verified=r.random() > 0.5,
+                created_at=self.maybe(self.date()),
+                updated_at=self.date(),
+                birth_date=self.date() if r.random() > 0.05 else "not-a-date",
+            ))
+        return out
+
+    def value(self, field_type: str, operator: str) -> Any:
+        r = self.random
+        match field_type:
+            case "string":
+                return r.choice(_STRINGS)
+            case "number":
+                if operator == "between":
+                    low = r.choice([r.randint(20, 40), r.randint(0, 100_000)])
+                    return f"{low}, {low + r.randint(0, 50_000)}"
+                return str(r.choice([r.randint(20, 65), r.randint(30, 150) * 1000, 75000, 88.5, "nan"]))
+            case "date":
+                if operator == "between":
+                    return ",".join(sorted([self.date(), self.date()]))
+                return r.choice([self.date(), self.date()[:10]])
+            case _:
+                return r.choice([True, False, "true", "false"])
+
+    def query(self) -> SearchQuery:
+        r = self.random
+        filters = []
+        for i in range(r.choice([0, 0, 1, 1, 2, 3])):
+            definition = r.choice(FIELD_DEFINITIONS)
+            operator = r.choice(_OPERATORS[definition.type])
+            filters.append(SearchFilter(str(i), definition.field, operator, self.value(definition.type, operator)))
+        if r.random() < 0.05:
+            filters.append(SearchFilter("x", "unknownField", "equals", "x"))
+        facets = tuple(SearchFacet(f, buckets=r.randint(1, 6), limit=r.randint(1, 5))
+                       for f in r.sample(_FACET_FIELDS, r.choice([0, 0, 1, 2])))
+        return SearchQuery(
+            text=r.choice(_TEXTS),
+            filters=tuple(filters),
+            combinator=r.choice(["and", "or"]),
+            page=r.choice([1, 1, 2, 3, 10, 0, -1]),
+            page_size=r.choice([5, 10, 25]),
+            sort_field=r.choice([f.field for f in FIELD_DEFINITIONS] + ["unknownField"]),
+            sort_order=r.choice(["asc", "desc"]),
+            facets=facets,
+        )
+
+    def suggestion(self, employees: list[Employee]) -> tuple[str, str, int]:
+        """(field, prefix, limit) of a suggestion request."""
+        r = self.random
+        field = r.choice(_STRING_FIELDS)
+        value = employees[r.randrange(len(employees))].get(field)
+        if value is None or r.random() < 0.3:
+            prefix = r.choice(_STRINGS)
+        else:
+            prefix = str(value)[: r.randint(0, 6)]
+            prefix = r.choice([prefix, prefix.upper(), prefix.lower()])
+        return field, prefix, r.choice([1, 3, 10])
+
+    def batch(self, size: int) -> list[SearchQuery]:
+        """Variants of one query, sharing most of its text and filters."""
+        r = self.random
+        base = self.query()
+        queries = [base]
+        while len(queries) < size:
+            other = self.query()
+            match r.randrange(4):
+                case 0:
+                    variant = replace(base, filters=base.filters[:-1])
+                case 1:
+                    variant = replace(base, filters=base.filters + other.filters[:1])
+                case 2:
+                    variant = replace(base, text=other.text)
+                case _:
+                    variant = replace(base, sort_field=other.sort_field, sort_order=other.sort_order, page=other.page)
+            queries.append(r.choice(queries) if r.random() < 0.1 else variant)
+        return [replace(q, explain=True) if r.random() < 0.3 else q for q in queries]
+
+
+def outcome(repo: EmployeeRepository, query: SearchQuery) -> tuple:
+    """Everything a query returns, in comparable form (or the error it raises)."""
+    try:
+        result = repo.search(query)
+        return (
+            [dict(row) for row in result.data],
+            result.total,
+            result.total_pages,
+            result.facets,
+            [e.id for e in repo.get_all_matching(query)],
+            repo.count(query),
+        )
+    except InvalidQueryError as error:
+        return ("InvalidQueryError", str(error))
+
+
+def page_outcome(result: SearchResult) -> tuple:
+    """The page, totals, facets and explained row count of one search result."""
+    matched_rows = None if result.explanation is None else result.explanation.matched_rows
+    return [dict(row) for row in result.data], result.total, result.total_pages, result.facets, matched_rows
+
+
+def batch_outcome(repo: EmployeeRepository, queries: list[SearchQuery]) -> list[tuple] | str:
+    """page_outcome() of each query of a batch (or the error it raises)."""
+    try:
+        results = repo.search_batch(queries)
+    except InvalidQueryError:
+        return "InvalidQueryError"
+    return [page_outcome(r) for r in results]
+
+
+def single_outcome(repo: EmployeeRepository, queries: list[SearchQuery]) -> list[tuple] | str:
+    """batch_outcome() from one search per query."""
+    results = []
+    for query in queries:
+        try:
+            results.append(page_outcome(repo.search(query)))
+        except InvalidQueryError:
+            return "InvalidQueryError"
+    return results
+
+
+def cursor_walk(repo: EmployeeRepository, query: SearchQuery) -> list[Any]:
+    """Ids of every row, read page by page with keyset cursors."""
+    ids: list[Any] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        result = repo.search(replace(query, page=1, cursor=cursor, facets=()))
+        ids += [row["id"] for row in result.data]
+        cursor = result.next_cursor
+    return ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=400)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--batches", type=int, default=50, help="query batches of 8 related queries")
+    parser.add_argument("--suggestions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--adapter", choices=sorted(_ADAPTERS), action="append",
+                        help="adapter to check (repeatable; default: all)")
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+    data = generator.employees(args.rows)
+    reference = InMemoryEmployeeRepository(data)
+    adapters = {name: _ADAPTERS[name](data) for name in args.adapter or sorted(_ADAPTERS)}
+
+    failures = 0
+    for _ in range(args.queries):
+        base = generator.query()
+        for query in (base, replace(base, sort_order="desc" if base.sort_order == "asc" else "asc")):
+            expected = outcome(reference, query)
+            walk = cursor_walk(reference, query) if expected[0] != "InvalidQueryError" else None
+            for name, repo in adapters.items():
+                checks = {"result": outcome(repo, query) == expected}
+                if walk is not None:
+                    checks["cursor walk"] = cursor_walk(repo, query) == walk
+                for check, passed in checks.items():
+                    if not passed:
+                        failures += 1
+                        print(f"FAIL {name} {check}: {query}")
+
+    batched = {"memory": InMemoryEmployeeRepository(data), **adapters}
+    for _ in range(args.batches):
+        queries = generator.batch(8)
+        expected = single_outcome(reference, queries)
+        for name, repo in batched.items():
+            if batch_outcome(repo, queries) != expected:
+                failures += 1
+                print(f"FAIL {name} batch: {queries}")
+
+    for _ in range(args.suggestions):
+        request = generator.suggestion(data)
+        expected = reference.suggest(*request)
+        for name, repo in adapters.items():
+            if repo.suggest(*request) != expected:
+                failures += 1
+                print(f"FAIL {name} suggest: {request}")
+
+    print(f"{args.queries * 2} queries, {args.batches} batches, {args.suggestions} suggestions, "
+          f"{len(adapters)} adapter(s), {failures} mismatch(es)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark — Export Formats
+
+Exports the same result set as CSV, NDJSON, Arrow IPC and Parquet through
+the export use cases and reports, for each format, the encoded size, the
+time until the first chunk is ready, the total time and the throughput,
+relative to CSV.
+
+The dataset is --rows synthetic employees (benchmarks/synthetic.py).
+
+    python -m benchmarks.export_formats --rows 200000 --repository memory
+"""
+
+import argparse
+import time
+from collections.abc import Callable, Iterator
+
+from app.application.use_cases.export_arrow import ExportArrowUseCase
+from app.application.use_cases.export_csv import ExportCsvUseCase
+from app.application.use_cases.export_ndjson import ExportNdjsonUseCase
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchQuery
+from app.infrastructure.repositories.columnar_employee_repository import ColumnarEmployeeRepository
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from benchmarks.synthetic import generate_employees
+
+_REPOSITORIES: dict[str, type[EmployeeRepository]] = {
+    "memory": InMemoryEmployeeRepository,
+    "columnar": ColumnarEmployeeRepository,
+}
+
+_FORMATS: dict[str, Callable[[EmployeeRepository], Callable[[SearchQuery], Iterator[bytes]]]] = {
+    "csv": lambda repo: ExportCsvUseCase(repo).execute,
+    "ndjson": lambda repo: ExportNdjsonUseCase(repo).execute,
+    "arrow": lambda repo: ExportArrowUseCase(repo, "arrow").execute,
+    "parquet": lambda repo: ExportArrowUseCase(repo, "parquet").execute,
+}
+
+
+def measure(export: Callable[[SearchQuery], Iterator[bytes]], query: SearchQuery) -> tuple[int, float, float]:
+    """Return (bytes, seconds to first chunk, total seconds) of one export."""
+    size = 0
+    first = None
+    start = time.perf_counter()
+    for chunk in export(query):
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    total = time.perf_counter() - start
+    return size, first or total, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repository", choices=sorted(_REPOSITORIES), default="memory")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per format; the fastest is reported")
+    parser.add_argument("--text", default="", help="full-text filter applied to the export")
+    args = parser.parse_args()
+
+    repo = _REPOSITORIES[args.repository](generate_employees(args.rows))
+    query = SearchQuery(text=args.text)
+    rows = len(repo.get_all_matching(query))
+    print(f"{rows:,} matching rows of {args.rows:,} ({args.repository} repository)\n")
+    print(f"{'format':<8} {'size MB':>9} {'vs csv':>7} {'first ms':>9} {'total s':>8} {'rows/s':>11} {'MB/s':>7} {'speed vs csv':>13}")
+
+    baseline = None
+    for name, make in _FORMATS.items():
+        size, first, total = min((measure(make(repo), query) for _ in range(args.repeat)), key=lambda r: r[2])
+        baseline = baseline or (size, total)
+        print(
+            f"{name:<8} {size / 1e6:>9.2f} {size / baseline[0]:>6.2f}x {first * 1e3:>9.1f} {total:>8.2f}"
+            f" {rows / total:>11,.0f} {size / 1e6 / total:>7.1f} {baseline[1] / total:>12.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
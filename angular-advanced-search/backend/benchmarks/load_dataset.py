@@ -0,0 +1,42 @@
+"""
+Benchmark — Dataset Load
+
+Loads a .csv or .jsonl dataset file into a repository the way the API does
+when EMPLOYEE_DATA is set, and reports the row count, load time and the
+process's peak memory. Run it once per repository: peak memory is a
+high-water mark of the whole process.
+
+    python -m benchmarks.load_dataset employees.csv --repository columnar
+"""
+
+import argparse
+
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.infrastructure.dataset_loader import load_repository, peak_memory
+from app.infrastructure.repositories.columnar_employee_repository import ColumnarEmployeeRepository
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from app.infrastructure.repositories.sqlite_employee_repository import SqliteEmployeeRepository
+
+_REPOSITORIES: dict[str, type[EmployeeRepository]] = {
+    "memory": InMemoryEmployeeRepository,
+    "columnar": ColumnarEmployeeRepository,
+    "sqlite": SqliteEmployeeRepository,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="dataset file (.csv, .jsonl or .ndjson)")
+    parser.add_argument("--repository", choices=sorted(_REPOSITORIES), default="memory")
+    args = parser.parse_args()
+
+    baseline = peak_memory()
+    _, report = load_repository(_REPOSITORIES[args.repository], args.path)
+    print(f"{report.summary()} into the {args.repository} repository")
+    if baseline is not None and report.peak_memory is not None:
+        grown = report.peak_memory - baseline
+        print(f"memory grown by the load: {grown / 2**20:,.0f} MiB ({grown / max(report.rows, 1):,.0f} bytes per row)")
+
+
+if __name__ == "__main__":
+    main()
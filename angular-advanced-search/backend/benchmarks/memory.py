@@ -0,0 +1,89 @@
+"""
+Benchmark — Memory per Row
+
+Compares the two storage modes of the in-memory repository on the same
+dataset:
+
+  - objects: one Employee object per row, its view and search text cached
+    on it (the default)
+  - compact: the rows kept column-wise with repeated strings stored once
+    (EMPLOYEE_STORAGE=compact)
+
+The synthetic employees (benchmarks/synthetic.py) are written to a CSV file
+and streamed into each repository the way the API loads EMPLOYEE_DATA, so
+every value is a fresh object as it would be in production. For each mode,
+tracemalloc measures the memory the loaded repository keeps, per row and
+in total, with the peak reached during the load. Memory per row includes
+the indexes, which both modes build identically. The p50 latency of a
+search page rendered to JSON shows what compact mode costs on reads.
+
+    python -m benchmarks.memory --rows 200000
+"""
+
+import argparse
+import gc
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+
+from app.domain.value_objects import SearchFilter, SearchQuery
+from app.exposition.routers.search_router import _search_json
+from app.infrastructure.dataset_loader import read_employees
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from benchmarks.synthetic import write_dataset
+
+_PAGE = SearchQuery(
+    filters=(SearchFilter("1", "department", "equals", "Engineering"),),
+    sort_field="name",
+    page_size=25,
+)
+
+
+def measure(path: Path, rows: int, compact: bool, repeat: int) -> dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    repository = InMemoryEmployeeRepository(read_employees(path), cache_size=0, refinement_size=0, compact=compact)
+    gc.collect()
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for page in range(1, repeat + 1):  # a different page each time, so no row is served twice
+        start = time.perf_counter()
+        _search_json(repository.search(replace(_PAGE, page=page)))
+        timings.append(time.perf_counter() - start)
+    return {
+        "bytes per row": (kept - before) / rows,
+        "kept MiB": (kept - before) / 2**20,
+        "peak MiB": (peak - before) / 2**20,
+        "page p50 ms": statistics.median(timings) * 1e3,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50, help="pages rendered to measure the page latency")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "employees.csv"
+        write_dataset(path, args.rows, args.seed)
+        results = {mode: measure(path, args.rows, mode == "compact", args.repeat) for mode in ("objects", "compact")}
+
+    columns = list(results["objects"])
+    print(f"{args.rows:,} rows")
+    print(f"{'storage':<10}" + "".join(f"{c:>15}" for c in columns))
+    for mode, result in results.items():
+        print(f"{mode:<10}" + "".join(f"{result[c]:>15,.2f}" for c in columns))
+    saved = 1 - results["compact"]["bytes per row"] / results["objects"]["bytes per row"]
+    print(f"compact storage keeps {saved:.0%} less memory per row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark — Dataset Reload
+
+Measures what reloading the dataset costs the searches served meanwhile,
+and checks that every one of them saw exactly one dataset.
+
+Two synthetic datasets (benchmarks/synthetic.py) of different sizes and
+seeds are written to CSV files. A BackgroundDatasetReloader serves the
+first; the file it reads is then replaced by the second and a reload is
+started, while a client thread keeps searching through the reloader's
+current repository the way every API request does. The client's search
+latency is reported before, during and after the reload.
+
+Each response is compared with the answers of the two datasets, computed
+beforehand on repositories of their own. A response matching neither (a
+page of one dataset with the total of the other, say), or the first
+dataset answering after the second already had, is counted as mixed; the
+run exits with status 1 when there is any.
+
+    python -m benchmarks.reload --rows 100000 --repository memory
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from app.domain.value_objects import SearchFilter, SearchQuery, SearchResult
+from app.exposition.dependencies import _REPOSITORIES
+from app.infrastructure.dataset_loader import load_repository
+from app.infrastructure.dataset_reloader import BackgroundDatasetReloader
+from benchmarks.synthetic import write_dataset
+
+_QUERY = SearchQuery(
+    filters=(SearchFilter("1", "department", "equals", "Engineering"),),
+    sort_field="salary",
+    sort_order="desc",
+    page_size=25,
+)
+
+
+def _answer(result: SearchResult) -> tuple:
+    return result.total, tuple(row["id"] for row in result.data)
+
+
+def _percentiles(timings: list[float]) -> str:
+    if not timings:
+        return "no searches"
+    ms = sorted(t * 1e3 for t in timings)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    return f"{len(ms):>6} searches  p50 {statistics.median(ms):7.2f} ms  p99 {p99:7.2f} ms  max {ms[-1]:7.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="rows of the first dataset; the second has 10%% more")
+    parser.add_argument("--repository", choices=sorted(_REPOSITORIES), default="memory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--settle", type=float, default=1.0, help="seconds searched before and after the reload")
+    args = parser.parse_args()
+    factory = _REPOSITORIES[args.repository]
+
+    with tempfile.TemporaryDirectory() as directory:
+        served = Path(directory) / "employees.csv"
+        first, second = Path(directory) / "first.csv", Path(directory) / "second.csv"
+        write_dataset(first, args.rows, args.seed)
+        write_dataset(second, args.rows + args.rows // 10, args.seed + 1)
+        expected = []
+        for path in (first, second):
+            repository, _ = load_repository(factory, path)
+            expected.append(_answer(repository.search(_QUERY)))
+            del repository
+        if expected[0] == expected[1]:
+            sys.exit("the two datasets give the same answer; use another --seed")
+
+        shutil.copyfile(first, served)
+        reloader = BackgroundDatasetReloader(lambda: load_repository(factory, served))
+        phases: dict[str, list[float]] = {"before": [], "during": [], "after": []}
+        served_by = [0, 0]
+        mixed = 0
+        phase = "before"
+        stop = threading.Event()
+
+        def client() -> None:
+            nonlocal mixed
+            newest = 0
+            while not stop.is_set():
+                start = time.perf_counter()
+                answer = _answer(reloader.repository.search(_QUERY))
+                phases[phase].append(time.perf_counter() - start)
+                if answer not in expected or expected.index(answer) < newest:
+                    mixed += 1
+                    continue
+                newest = expected.index(answer)
+                served_by[newest] += 1
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        time.sleep(args.settle)
+        shutil.copyfile(second, served)
+        phase = "during"
+        reloader.reload()
+        status = reloader.wait()
+        phase = "after"
+        time.sleep(args.settle)
+        stop.set()
+        thread.join()
+
+    print(f"{args.repository} repository, {args.rows:,} → {args.rows + args.rows // 10:,} rows")
+    print(f"reload: {status.state}, generation {status.generation}, {status.rows:,} rows in {status.seconds:.2f}s")
+    for name, timings in phases.items():
+        print(f"{name:<7} {_percentiles(timings)}")
+    print(f"answers: {served_by[0]} from the first dataset, {served_by[1]} from the second, {mixed} mixed")
+    if status.state != "idle" or mixed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
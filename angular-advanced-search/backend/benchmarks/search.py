@@ -0,0 +1,247 @@
+"""
+Benchmark — Search
+
+Runs representative SearchQuery shapes against a repository loaded with
+synthetic employees (benchmarks/synthetic.py) and reports, per scenario,
+latency percentiles over --repeat runs and the peak memory allocated while
+the scenario runs once under tracemalloc. The load time and the memory held
+by the loaded repository are reported too.
+
+Scenarios: text searches (common, rare and too short for the trigram
+index), many AND filters, OR combinators, searches that need no exact total, a date range, a deep offset page,
+a sort on every field, a filtered CSV export drained to the end, a
+dashboard of eight related queries run one by one and as one batch, and
+value suggestions for a typed prefix.
+
+The result caches of the memory and sharded repositories (and the memory
+repository's refinement cache) are disabled
+unless --cache is given, so repeated runs measure query evaluation and not
+cache hits. The sharded repository runs --shards worker processes (one per
+CPU core by default); compare it with the memory repository on the same
+--rows to see what the parallel evaluation gains over one core.
+
+Results can be saved as a baseline and later runs compared against it;
+comparison prints each scenario's p50 relative to the baseline and exits
+with status 1 when one is slower than --tolerance allows:
+
+    python -m benchmarks.search --rows 100000 --save benchmarks/baselines/memory-100k.json
+    python -m benchmarks.search --rows 100000 --compare benchmarks/baselines/memory-100k.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.application.use_cases.export_csv import ExportCsvUseCase
+from app.domain.ports.employee_repository import EmployeeRepository
+from app.domain.value_objects import SearchFilter, SearchQuery
+from app.infrastructure.dataset_loader import peak_memory
+from app.infrastructure.repositories.columnar_employee_repository import ColumnarEmployeeRepository
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from app.infrastructure.repositories.sharded_employee_repository import ShardedEmployeeRepository
+from app.infrastructure.repositories.sqlite_employee_repository import SqliteEmployeeRepository
+from app.infrastructure.sample_data import FIELD_DEFINITIONS
+from benchmarks.synthetic import generate_employees
+
+_REPOSITORIES: dict[str, Callable[..., EmployeeRepository]] = {
+    "memory": InMemoryEmployeeRepository,
+    "columnar": ColumnarEmployeeRepository,
+    "sqlite": SqliteEmployeeRepository,
+    "sharded": ShardedEmployeeRepository,
+}
+
+Scenario = Callable[[EmployeeRepository], Any]
+
+
+def _filters(*specs: tuple[str, str, str]) -> tuple[SearchFilter, ...]:
+    return tuple(SearchFilter(str(i), field, operator, value) for i, (field, operator, value) in enumerate(specs))
+
+
+def scenarios(rows: int) -> dict[str, Scenario]:
+    """Scenario name → function running it once against a repository."""
+    def search(**fields: Any) -> Scenario:
+        query = SearchQuery(**fields)
+        return lambda repo: repo.search(query)
+
+    def export(query: SearchQuery) -> Scenario:
+        return lambda repo: sum(len(chunk) for chunk in ExportCsvUseCase(repo).execute(query))
+
+    def dashboard(batch: bool) -> Scenario:
+        active = ("status", "equals", "active")
+        queries = [
+            SearchQuery(filters=_filters(active)),
+            SearchQuery(filters=_filters(active), sort_field="salary", sort_order="desc"),
+            SearchQuery(filters=_filters(active, ("department", "equals", "Engineering"))),
+            SearchQuery(filters=_filters(active, ("department", "equals", "Sales")), sort_field="name"),
+            SearchQuery(filters=_filters(active, ("score", "less_than", "70")), sort_field="score"),
+            SearchQuery(text="engineer", filters=_filters(active)),
+            SearchQuery(text="engineer", filters=_filters(("age", "less_than", "30"))),
+            SearchQuery(text="engineer", sort_field="createdAt", sort_order="desc"),
+        ]
+        if batch:
+            return lambda repo: repo.search_batch(queries)
+        return lambda repo: [repo.search(query) for query in queries]
+
+    deep_page = max(1, rows // 25 - 10)
+    suite: dict[str, Scenario] = {
+        "text common": search(text="engineer"),
+        "text rare": search(text="kubernetes"),
+        "text short": search(text="ux"),
+        "and 4 filters": search(filters=_filters(
+            ("age", "between", "30,45"),
+            ("department", "equals", "Engineering"),
+            ("status", "equals", "active"),
+            ("isActive", "equals", "true"),
+        )),
+        "or departments": search(combinator="or", filters=_filters(
+            ("department", "equals", "Sales"),
+            ("department", "equals", "HR"),
+            ("department", "equals", "Finance"),
+        )),
+        "or mixed": search(combinator="or", filters=_filters(
+            ("salary", "greater_than", "100000"),
+            ("score", "less_than", "70"),
+            ("status", "equals", "pending"),
+        )),
+        "text total none": search(text="engineer", total_mode="none"),
+        "or total estimate": search(combinator="or", total_mode="estimate", filters=_filters(
+            ("department", "equals", "Sales"),
+            ("department", "equals", "HR"),
+            ("department", "equals", "Finance"),
+        )),
+        "text and filter": search(text="developer", filters=_filters(("age", "less_than", "30"),)),
+        "date between": search(filters=_filters(("createdAt", "between", "2020-01-01,2021-01-01"),)),
+        "range and range": search(filters=_filters(
+            ("score", "less_than_or_equal", "80"),
+            ("age", "greater_than_or_equal", "40"),
+        )),
+        "range page 50": search(page=50, filters=_filters(("age", "between", "25,55"),)),
+        "starts with": search(filters=_filters(("name", "starts_with", "ja"),)),
+        "suggest name": lambda repo: repo.suggest("name", "Ja", 10),
+        "suggest email all": lambda repo: repo.suggest("email", "", 10),
+        f"deep page {deep_page}": search(page=deep_page, page_size=25, sort_field="name"),
+    }
+    for f in FIELD_DEFINITIONS:
+        suite[f"sort {f.field}"] = search(sort_field=f.field, sort_order="desc")
+    suite["export csv"] = export(SearchQuery(filters=_filters(("department", "equals", "Engineering"),)))
+    suite["dashboard 8 separate"] = dashboard(batch=False)
+    suite["dashboard 8 batch"] = dashboard(batch=True)
+    return suite
+
+
+# ── Measurement ───────────────────────────────────────────────────────────────
+
+def measure(run: Scenario, repo: EmployeeRepository, repeat: int) -> dict[str, float]:
+    """Latency percentiles in milliseconds, and the traced peak allocation in KiB."""
+    run(repo)  # warm-up: lazy structures, page cache
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(repo)
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    tracemalloc.start()
+    run(repo)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    cuts = statistics.quantiles(timings, n=100, method="inclusive") if len(timings) > 1 else timings * 99
+    return {
+        "p50": round(cuts[49], 3),
+        "p90": round(cuts[89], 3),
+        "p99": round(cuts[98], 3),
+        "max": round(max(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Any]:
+    employees = generate_employees(args.rows, args.seed)
+    match args.repository:
+        case "memory":
+            options = {"cache_size": 32, "refinement_size": 8} if args.cache else {"cache_size": 0, "refinement_size": 0}
+        case "sharded":
+            options = {"shards": args.shards, "cache_size": 32 if args.cache else 0}
+        case _:
+            options = {}
+    before = peak_memory()
+    start = time.perf_counter()
+    repo = _REPOSITORIES[args.repository](employees, **options)
+    load_seconds = time.perf_counter() - start
+    after = peak_memory()
+
+    results: dict[str, Any] = {
+        "rows": args.rows,
+        "repository": args.repository,
+        "seed": args.seed,
+        "shards": getattr(repo, "shard_count", None),
+        "python": platform.python_version(),
+        "load_seconds": round(load_seconds, 2),
+        "load_memory_mib": None if before is None else round((after - before) / 2**20, 1),
+        "scenarios": {},
+    }
+    print(f"{args.rows:,} rows, {args.repository} repository: loaded in {load_seconds:.2f}s, "
+          f"peak memory grew by {results['load_memory_mib']} MiB\n")
+    for name, run in scenarios(args.rows).items():
+        if args.only and not any(part in name for part in args.only):
+            continue
+        results["scenarios"][name] = measure(run, repo, args.repeat)
+    return results
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+def report(results: dict[str, Any], baseline: dict[str, Any] | None, tolerance: float) -> int:
+    """Print the results table; return the number of scenarios slower than the baseline allows."""
+    header = f"{'scenario':<22} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'peak KiB':>10}"
+    print(header + (f" {'p50 vs base':>12}" if baseline else ""))
+    regressions = 0
+    for name, m in results["scenarios"].items():
+        line = f"{name:<22} {m['p50']:>9.2f} {m['p90']:>9.2f} {m['p99']:>9.2f} {m['max']:>9.2f} {m['peak_kib']:>10,.0f}"
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base:
+            ratio = m["p50"] / max(base["p50"], 1e-6)
+            slower = ratio > tolerance
+            regressions += slower
+            line += f" {ratio:>11.2f}x" + ("  SLOWER" if slower else "")
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic employees to load (10k to 5M)")
+    parser.add_argument("--repository", choices=sorted(_REPOSITORIES), default="memory")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--shards", type=int, help="worker processes of the sharded repository (default: CPU cores)")
+    parser.add_argument("--cache", action="store_true", help="keep the result cache of the memory / sharded repository enabled")
+    parser.add_argument("--only", action="append", help="run scenarios whose name contains this (repeatable)")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON baseline file")
+    parser.add_argument("--compare", type=Path, help="compare against this JSON baseline file")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed p50 ratio against the baseline")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if baseline and (baseline["rows"], baseline["repository"]) != (args.rows, args.repository):
+        print(f"warning: baseline was recorded with {baseline['rows']:,} rows on the "
+              f"{baseline['repository']} repository", file=sys.stderr)
+
+    results = run_suite(args)
+    regressions = report(results, baseline, args.tolerance)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nbaseline saved to {args.save}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark — Search Response Serialization
+
+Compares, for several page sizes, the cost of turning one SearchResult into
+the POST /api/search response body:
+
+  - response_model: what FastAPI does for a handler returning a dict with
+    response_model=SearchResponseSchema — validate the payload with pydantic,
+    dump it to JSON-compatible Python, then encode it with json.dumps
+  - fragments, cold: the router's raw Response, with no row encoded yet
+  - fragments, warm: the same page again, every row's JSON already cached
+    on its view
+
+Both produce the same bytes. The rows are synthetic employees
+(benchmarks/synthetic.py).
+
+    python -m benchmarks.serialization --sizes 10 25 100 500 1000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from fastapi.responses import JSONResponse
+
+from app.domain.entities import EmployeeView
+from app.domain.value_objects import SearchResult
+from app.exposition.routers.search_router import _explanation_to_dict, _facet_to_dict, _search_response
+from app.exposition.schemas import SearchResponseSchema
+from benchmarks.synthetic import generate_employees
+
+
+def response_model(result: SearchResult) -> bytes:
+    payload = {
+        "data": list(result.data),
+        "total": result.total,
+        "page": result.page,
+        "pageSize": result.page_size,
+        "totalPages": result.total_pages,
+        "nextCursor": result.next_cursor,
+        "facets": [_facet_to_dict(f) for f in result.facets],
+        "explanation": _explanation_to_dict(result.explanation),
+        "totalRelation": result.total_relation,
+        "totalError": result.total_error,
+    }
+    content = SearchResponseSchema.model_validate(payload).model_dump(mode="json")
+    return JSONResponse(content).body
+
+
+def fragments(result: SearchResult) -> bytes:
+    return _search_response(result).body
+
+
+def page(views: list[EmployeeView], size: int) -> SearchResult:
+    return SearchResult(data=tuple(views[:size]), total=len(views), page=1, page_size=size, total_pages=1)
+
+
+def fastest(run: Callable[[], bytes], repeat: int, prepare: Callable[[], None] = lambda: None) -> tuple[float, int]:
+    """Lowest time in milliseconds over repeat runs, and the size of the body."""
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        prepare()
+        start = time.perf_counter()
+        size = len(run())
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 25, 50, 100, 500, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=20, help="runs per measurement; the fastest is reported")
+    args = parser.parse_args()
+
+    views = [e.view for e in generate_employees(max(args.sizes))]
+    print(f"{'page size':>9} {'KiB':>8} {'response_model ms':>18} {'cold ms':>9} {'warm ms':>9} "
+          f"{'cold speedup':>13} {'warm speedup':>13} {'warm µs/row':>12}")
+    for size in args.sizes:
+        result = page(views, size)
+        cold_views: list[EmployeeView] = []
+
+        def fresh() -> None:  # the same rows, none of them encoded yet
+            nonlocal cold_views
+            cold_views = [EmployeeView(v) for v in views[:size]]
+
+        assert response_model(result) == fragments(result)
+        baseline, body = fastest(lambda: response_model(result), args.repeat)
+        cold, _ = fastest(lambda: fragments(page(cold_views, size)), args.repeat, fresh)
+        warm, _ = fastest(lambda: fragments(result), args.repeat)
+        print(f"{size:>9} {body / 1024:>8.1f} {baseline:>18.3f} {cold:>9.3f} {warm:>9.3f} "
+              f"{baseline / cold:>12.1f}x {baseline / warm:>12.1f}x {warm * 1e3 / size:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark — Sharding Speedup
+
+Measures what the sharded repository gains from running on several CPU
+cores. The same synthetic employees (benchmarks/synthetic.py) are loaded
+into the memory repository, which evaluates every query on one core, and
+into the sharded repository with each of the --shards counts. The scenarios
+of benchmarks/search.py that read every row or every match (text searches,
+a CSV export, a dashboard batch) are run against each one, with the result
+caches disabled so every run evaluates the query again.
+
+For each scenario the p50 latency is reported per repository, with the
+speedup over the memory repository. The speedup is bounded by the CPU
+cores of the machine (printed first): shards beyond that share cores, and
+each one adds its own round trip and merge work.
+
+    python -m benchmarks.sharding --rows 1000000 --shards 1 2 4 8
+"""
+
+import argparse
+import multiprocessing
+import time
+
+from app.infrastructure.repositories.in_memory_employee_repository import InMemoryEmployeeRepository
+from app.infrastructure.repositories.sharded_employee_repository import ShardedEmployeeRepository
+from benchmarks.search import measure, scenarios
+from benchmarks.synthetic import generate_employees
+
+# Scenarios that read every row or every match; the memory repository answers
+# most of the others from an index without reading rows, on one core or many
+_SCENARIOS = ["text common", "text short", "text and filter", "export csv", "dashboard 8 batch"]
+
+
+def main() -> None:
+    cores = multiprocessing.cpu_count()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=sorted({1, 2, cores}), help="shard counts to run")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", help="run scenarios whose name contains this (repeatable)")
+    args = parser.parse_args()
+
+    suite = {
+        name: run for name, run in scenarios(args.rows).items()
+        if (name in _SCENARIOS if not args.only else any(part in name for part in args.only))
+    }
+    employees = list(generate_employees(args.rows, args.seed))
+    repositories = {"memory": lambda: InMemoryEmployeeRepository(employees, cache_size=0, refinement_size=0)}
+    for shards in args.shards:
+        repositories[f"{shards} shards"] = lambda shards=shards: ShardedEmployeeRepository(
+            employees, shards=shards, cache_size=0
+        )
+
+    print(f"{args.rows:,} rows, {cores} CPU cores")
+    p50: dict[str, dict[str, float]] = {}
+    for label, build in repositories.items():
+        start = time.perf_counter()
+        repository = build()
+        print(f"{label}: loaded in {time.perf_counter() - start:.2f}s")
+        p50[label] = {name: measure(run, repository, args.repeat)["p50"] for name, run in suite.items()}
+        del repository  # stops the workers before the next shard count starts its own
+
+    print()
+    print(f"{'scenario':<20}" + "".join(f"{label:>22}" for label in repositories))
+    for name in suite:
+        base = p50["memory"][name]
+        cells = [f"{p50[label][name]:>10.2f} ms {base / p50[label][name]:>6.2f}x" for label in repositories]
+        print(f"{name:<20}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
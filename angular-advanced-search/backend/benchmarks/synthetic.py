@@ -0,0 +1,168 @@
+"""
+Synthetic Employees
+
+Generates any number of employees whose values follow the distributions of
+the 30 sample records in app/infrastructure/sample_data.py:
+
+  - department, status and first / last names are drawn with the sample's
+    frequencies; descriptions come from the sample employees of the same
+    department, so text searches hit realistic shares of the rows
+  - age is normal with the sample's mean and deviation, clipped to its
+    range; salary follows the sample's linear relation to age, and score its
+    relation to salary, each with the sample's residual noise
+  - isActive has the sample's probability for each status; isVerified its
+    overall probability
+  - createdAt lies in the sample's range, updatedAt after it, and birthDate
+    agrees with the age
+
+The generator is seeded and streams its rows, so 5 million employees can be
+written to a file without holding them. The file can then be loaded by the
+API through EMPLOYEE_DATA:
+
+    python -m benchmarks.synthetic --rows 1000000 --output employees.csv
+"""
+
+import argparse
+import csv
+import json
+import random
+import statistics
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app.domain.entities import Employee
+from app.infrastructure.dates import parse_datetime
+from app.infrastructure.sample_data import EMPLOYEES
+
+
+def _weights(values: list) -> tuple[list, list[int]]:
+    counts = Counter(values)
+    return list(counts), list(counts.values())
+
+
+class _SampleModel:
+    """Distributions fitted to the sample data."""
+
+    def __init__(self, sample: list[Employee]) -> None:
+        first, last = zip(*(e.name.split(" ", 1) for e in sample))
+        self.first_names = _weights(list(first))
+        self.last_names = _weights(list(last))
+        self.departments = _weights([e.department for e in sample])
+        self.statuses = _weights([e.status for e in sample])
+
+        self.descriptions: dict[str, list[str]] = defaultdict(list)
+        for e in sample:
+            self.descriptions[e.department].append(e.description)
+
+        by_status: dict[str, list[bool]] = defaultdict(list)
+        for e in sample:
+            by_status[e.status].append(e.is_active)
+        self.active_share = {status: sum(flags) / len(flags) for status, flags in by_status.items()}
+        self.verified_share = sum(e.is_verified for e in sample) / len(sample)
+
+        ages = [e.age for e in sample]
+        salaries = [e.salary for e in sample]
+        scores = [e.score for e in sample]
+        self.age = statistics.mean(ages), statistics.stdev(ages), min(ages), max(ages)
+        self.salary = self._fit(ages, salaries), min(salaries), max(salaries)
+        self.score = self._fit(salaries, scores), min(scores), max(scores)
+
+        created = [parse_datetime(e.created_at) for e in sample]
+        updated = [parse_datetime(e.updated_at) for e in sample]
+        self.created = min(created), max(created)
+        self.updated_until = max(updated)
+
+    @staticmethod
+    def _fit(x: list[float], y: list[float]) -> tuple[float, float, float]:
+        """(slope, intercept, residual standard deviation) of y against x."""
+        slope, intercept = statistics.linear_regression(x, y)
+        residuals = [b - (slope * a + intercept) for a, b in zip(x, y)]
+        return slope, intercept, statistics.pstdev(residuals)
+
+
+_MODEL = _SampleModel(EMPLOYEES)
+
+
+def generate_employees(rows: int, seed: int = 0) -> Iterator[Employee]:
+    """Stream `rows` synthetic employees with ids 1..rows."""
+    r = random.Random(seed)
+    m = _MODEL
+
+    def clip(value: float, low: float, high: float) -> float:
+        return min(max(value, low), high)
+
+    def related(x: float, fit: tuple[float, float, float], low: float, high: float) -> float:
+        slope, intercept, noise = fit
+        return clip(slope * x + intercept + r.gauss(0, noise), low, high)
+
+    created_span = (m.created[1] - m.created[0]).total_seconds()
+    for i in range(1, rows + 1):
+        first = r.choices(*m.first_names)[0]
+        last = r.choices(*m.last_names)[0]
+        department = r.choices(*m.departments)[0]
+        status = r.choices(*m.statuses)[0]
+
+        mean, deviation, low, high = m.age
+        age = round(clip(r.gauss(mean, deviation), low, high))
+        salary = round(related(age, *m.salary) / 1000) * 1000
+        score = round(related(salary, *m.score), 1)
+
+        created = m.created[0] + timedelta(seconds=r.uniform(0, created_span))
+        created = created.replace(minute=r.choice((0, 30)), second=0, microsecond=0)
+        updated = created + timedelta(seconds=r.uniform(0, max((m.updated_until - created).total_seconds(), 0)))
+        updated = updated.replace(minute=0, second=0, microsecond=0)
+        born = m.updated_until - timedelta(days=365.25 * age + r.uniform(0, 365))
+
+        yield Employee(
+            id=i,
+            name=f"{first} {last}",
+            email=f"{first}.{last}{i}@example.com".lower().replace(" ", ""),
+            age=age,
+            salary=salary,
+            score=score,
+            status=status,
+            department=department,
+            description=r.choice(m.descriptions[department]),
+            is_active=r.random() < m.active_share[status],
+            is_verified=r.random() < m.verified_share,
+            created_at=_iso(created),
+            updated_at=_iso(updated),
+            birth_date=_iso(born.replace(hour=0, minute=0, second=0, microsecond=0)),
+        )
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def write_dataset(path: str | Path, rows: int, seed: int = 0) -> None:
+    """Write synthetic employees to a .csv or .jsonl file readable by the dataset loader."""
+    path = Path(path)
+    employees = generate_employees(rows, seed)
+    with path.open("w", newline="", encoding="utf-8") as file:
+        if path.suffix.lower() == ".csv":
+            writer = None
+            for employee in employees:
+                if writer is None:
+                    writer = csv.DictWriter(file, fieldnames=list(employee.view))
+                    writer.writeheader()
+                writer.writerow(employee.view)
+        else:
+            for employee in employees:
+                file.write(json.dumps(employee.to_dict(), ensure_ascii=False, separators=(",", ":")))
+                file.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="destination .csv or .jsonl file")
+    args = parser.parse_args()
+    write_dataset(args.output, args.rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
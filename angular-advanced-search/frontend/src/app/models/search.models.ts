@@ -6,6 +6,11 @@ export interface FieldDefinition {
   type: FieldType;
 }
 
+export interface FieldSuggestion {
+  value: string;
+  count: number;
+}
+
 export interface FilterOperator {
   value: string;
   label: string;
@@ -70,6 +75,41 @@ export interface SearchFilter {
 
 export type Combinator = 'and' | 'or';
 
+/** Aggregation over every matched row: counts (string), ratio (boolean) or histogram (number). */
+export interface FacetRequest {
+  field: string;
+  buckets?: number;
+  limit?: number;
+}
+
+export interface FacetBucket {
+  count: number;
+  value?: any;
+  low?: number | null;
+  high?: number | null;
+}
+
+export interface FacetResult {
+  field: string;
+  kind: 'counts' | 'ratio' | 'histogram';
+  buckets: FacetBucket[];
+  missing: number;
+  ratio?: number | null;
+}
+
+export interface PlanStep {
+  operation: string;
+  description: string;
+  estimatedRows: number | null;
+}
+
+export interface QueryExplanation {
+  combinator: Combinator;
+  steps: PlanStep[];
+  matchedRows: number;
+  cached: boolean;
+}
+
 export interface SearchQuery {
   text: string;
   filters: SearchFilter[];
@@ -78,6 +118,24 @@ export interface SearchQuery {
   pageSize: number;
   sortField: string;
   sortOrder: 'asc' | 'desc';
+  /** Keyset pagination (opt-in): '' for the first page, then the previous nextCursor. */
+  cursor?: string | null;
+  facets?: FacetRequest[];
+  /** Ask the backend to return the evaluation plan it chose. */
+  explain?: boolean;
+  /** How precise `total` must be; 'none' only needs the page. Default 'exact'. */
+  totalMode?: TotalMode;
+}
+
+export type TotalMode = 'exact' | 'estimate' | 'none';
+
+/** 'eq': exact; 'gte': a lower bound; 'approx': an estimate ± the error. */
+export type TotalRelation = 'eq' | 'gte' | 'approx';
+
+export interface CountResponse {
+  total: number;
+  relation: TotalRelation;
+  error: number;
 }
 
 export interface SearchResponse {
@@ -86,4 +144,10 @@ export interface SearchResponse {
   page: number;
   pageSize: number;
   totalPages: number;
+  /** Only set in cursor mode, when another page follows. */
+  nextCursor?: string | null;
+  facets?: FacetResult[];
+  explanation?: QueryExplanation | null;
+  totalRelation?: TotalRelation;
+  totalError?: number;
 }
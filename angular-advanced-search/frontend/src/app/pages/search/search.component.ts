@@ -1,6 +1,7 @@
 import { Component, OnInit, inject } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
+import { HttpErrorResponse } from '@angular/common/http';
 import { TableModule, TableLazyLoadEvent } from 'primeng/table';
 import { ButtonModule } from 'primeng/button';
 import { InputTextModule } from 'primeng/inputtext';
@@ -182,12 +183,14 @@ export class SearchComponent implements OnInit {
         this.totalRecords = response.total;
         this.resultsLoading = false;
       },
-      error: () => {
+      error: (err: HttpErrorResponse) => {
         this.resultsLoading = false;
         this.messageService.add({
           severity: 'error',
           summary: 'Search Failed',
-          detail: 'Unable to reach the FastAPI backend. Please ensure it is running on port 8000.',
+          detail: err.status === 422 && typeof err.error?.detail === 'string'
+            ? err.error.detail
+            : 'Unable to reach the FastAPI backend. Please ensure it is running on port 8000.',
           life: 5000,
         });
       },
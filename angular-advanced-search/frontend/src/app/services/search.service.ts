@@ -1,7 +1,7 @@
 import { Injectable, inject } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { Observable, BehaviorSubject } from 'rxjs';
-import { FieldDefinition, SearchQuery, SearchResponse } from '../models/search.models';
+import { CountResponse, FieldDefinition, FieldSuggestion, SearchQuery, SearchResponse } from '../models/search.models';
 
 @Injectable({ providedIn: 'root' })
 export class SearchService {
@@ -15,11 +15,25 @@ export class SearchService {
     return this.http.get<FieldDefinition[]>(`${this.API_URL}/fields`);
   }
 
+  suggest(field: string, prefix: string, limit = 10): Observable<FieldSuggestion[]> {
+    return this.http.get<FieldSuggestion[]>(`${this.API_URL}/fields/${encodeURIComponent(field)}/suggest`, {
+      params: { prefix, limit },
+    });
+  }
+
   search(query: SearchQuery): Observable<SearchResponse> {
     this.currentQuerySubject.next(query);
     return this.http.post<SearchResponse>(`${this.API_URL}/search`, query);
   }
 
+  searchBatch(queries: SearchQuery[]): Observable<SearchResponse[]> {
+    return this.http.post<SearchResponse[]>(`${this.API_URL}/search/batch`, queries);
+  }
+
+  count(query: SearchQuery): Observable<CountResponse> {
+    return this.http.post<CountResponse>(`${this.API_URL}/search/count`, query);
+  }
+
   getCurrentQuery(): SearchQuery | null {
     return this.currentQuerySubject.getValue();
   }